@@ -32,8 +32,6 @@ class OpenBrowserExample(LibraryComponent):
             profile_dir=profile_dir, options=options, service_log_path=service_log_path)
         driver.set_script_timeout(self.ctx.timeout)
         driver.implicitly_wait(self.ctx.implicit_wait)
-        if self.ctx.speed:
-            self._monkey_patch_speed(driver)
         return driver
 
 
@@ -0,0 +1,9 @@
+"""Fake W3C WebDriver server for running SeleniumLibrary without browsers.
+
+See `FakeWebDriverServer` for usage. The server can also be started from
+the command line::
+
+    python -m fakewebdriver start [--port 4445] [--latency 0.001]
+"""
+
+from .server import FakeWebDriver, FakeWebDriverServer
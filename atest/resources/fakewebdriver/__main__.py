@@ -0,0 +1,40 @@
+from __future__ import print_function
+
+import argparse
+
+try:
+    from httplib import HTTPConnection
+except ImportError:  # Python 3
+    from http.client import HTTPConnection
+
+from .server import FakeWebDriverServer
+
+
+def stop_server(port):
+    connection = HTTPConnection('127.0.0.1', port)
+    connection.request('QUIT', '/')
+    connection.getresponse()
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m fakewebdriver',
+                                     description='Fake W3C WebDriver server.')
+    parser.add_argument('command', choices=['start', 'stop'])
+    parser.add_argument('--port', type=int, default=4445)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Delay in seconds added to every command.')
+    options = parser.parse_args()
+    if options.command == 'stop':
+        stop_server(options.port)
+        return
+    server = FakeWebDriverServer(options.port, options.latency).start()
+    print('Fake WebDriver server running at %s' % server.url)
+    try:
+        server.wait()
+    except KeyboardInterrupt:
+        pass
+    server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""CSS selector subset used by the fake WebDriver.
+
+Supports type, universal, id, class and attribute selectors (``=``, ``~=``,
+``|=``, ``^=``, ``$=``, ``*=``), ``:first-child``, ``:last-child``,
+``:nth-child(n)``, ``:checked``, ``:disabled``, ``:enabled``, selector
+groups and descendant, child and sibling combinators.
+"""
+
+import re
+
+
+class SelectorError(ValueError):
+    pass
+
+
+TOKEN = re.compile(r'''
+    \s*(?P<combinator>[>+~,])\s*
+  | (?P<space>\s+)
+  | (?P<type>\*|[\w-]+)
+  | \#(?P<id>(?:[\w-]|\\.)+)
+  | \.(?P<class>(?:[\w-]|\\.)+)
+  | \[\s*(?P<attr>[\w:-]+)\s*
+        (?:(?P<op>[~|^$*]?=)\s*
+           (?:"(?P<dq>(?:[^"\\]|\\.)*)"|'(?P<sq>(?:[^'\\]|\\.)*)'|(?P<bare>[^\]\s]+))
+        \s*)?\]
+  | :(?P<pseudo>[\w-]+)(?:\(\s*(?P<pseudo_arg>[^)]*?)\s*\))?
+''', re.VERBOSE)
+ESCAPE = re.compile(r'\\(.)')
+
+
+def unescape(value):
+    return ESCAPE.sub(r'\1', value) if value else value
+
+
+class Compound(object):
+
+    def __init__(self):
+        self.tag = None
+        self.tests = []
+
+    def matches(self, element):
+        if self.tag and element.tag != self.tag:
+            return False
+        return all(test(element) for test in self.tests)
+
+
+def _attribute_test(name, op, expected):
+    def test(element):
+        if name not in element.attributes:
+            return False
+        value = element.attributes[name]
+        if op is None:
+            return True
+        if op == '=':
+            return value == expected
+        if op == '~=':
+            return expected in value.split()
+        if op == '|=':
+            return value == expected or value.startswith(expected + '-')
+        if not expected:
+            return False
+        if op == '^=':
+            return value.startswith(expected)
+        if op == '$=':
+            return value.endswith(expected)
+        return expected in value
+    return test
+
+
+def _siblings(element):
+    return element.parent.elements if element.parent is not None else [element]
+
+
+def _pseudo_test(name, argument):
+    if name == 'first-child':
+        return lambda e: _siblings(e)[0] is e
+    if name == 'last-child':
+        return lambda e: _siblings(e)[-1] is e
+    if name == 'nth-child' and argument and argument.isdigit():
+        index = int(argument) - 1
+        return lambda e: (len(_siblings(e)) > index
+                          and _siblings(e)[index] is e)
+    if name == 'checked':
+        return lambda e: e.checked or e.selected
+    if name == 'disabled':
+        return lambda e: not e.is_enabled
+    if name == 'enabled':
+        return lambda e: e.is_enabled
+    raise SelectorError("Unsupported pseudo-class ':%s'." % name)
+
+
+def parse(selector):
+    """Returns a list of selectors, each a list of (combinator, compound)."""
+    groups = [[]]
+    compound = None
+    combinator = ' '
+    position = 0
+    selector = selector.strip()
+    while position < len(selector):
+        match = TOKEN.match(selector, position)
+        if not match or match.end() == position:
+            raise SelectorError("Invalid selector '%s'." % selector)
+        position = match.end()
+        kind = match.lastgroup if match.group('attr') is None else 'attr'
+        if match.group('pseudo'):
+            kind = 'pseudo'
+        if kind in ('combinator', 'space'):
+            if compound is None:
+                raise SelectorError("Invalid selector '%s'." % selector)
+            groups[-1].append((combinator, compound))
+            compound = None
+            value = match.group('combinator')
+            if value == ',':
+                groups.append([])
+                combinator = ' '
+            else:
+                combinator = value or ' '
+            continue
+        if compound is None:
+            compound = Compound()
+        if kind == 'type':
+            if match.group('type') != '*':
+                compound.tag = match.group('type').lower()
+        elif kind == 'id':
+            compound.tests.append(
+                _attribute_test('id', '=', unescape(match.group('id'))))
+        elif kind == 'class':
+            compound.tests.append(
+                _attribute_test('class', '~=', unescape(match.group('class'))))
+        elif kind == 'attr':
+            value = match.group('dq')
+            if value is None:
+                value = match.group('sq')
+            if value is None:
+                value = match.group('bare')
+            compound.tests.append(_attribute_test(
+                match.group('attr').lower(), match.group('op'), unescape(value)))
+        else:
+            compound.tests.append(_pseudo_test(match.group('pseudo'),
+                                               match.group('pseudo_arg')))
+    if compound is None:
+        raise SelectorError("Invalid selector '%s'." % selector)
+    groups[-1].append((combinator, compound))
+    return groups
+
+
+def _matches(element, parts):
+    combinator, compound = parts[-1]
+    if not compound.matches(element):
+        return False
+    rest = parts[:-1]
+    if not rest:
+        return True
+    if combinator == '>':
+        parent = element.parent
+        return parent.tag != '#document' and _matches(parent, rest)
+    if combinator == ' ':
+        return any(_matches(ancestor, rest) for ancestor in element.ancestors()
+                   if ancestor.tag != '#document')
+    siblings = _siblings(element)
+    index = siblings.index(element)
+    if combinator == '+':
+        return index > 0 and _matches(siblings[index - 1], rest)
+    return any(_matches(sibling, rest) for sibling in siblings[:index])
+
+
+def select(scope, selector):
+    """Finds descendants of ``scope`` matching ``selector`` in document order.
+
+    Like ``querySelectorAll``, ancestors outside the scope can match the
+    leading parts of the selector.
+    """
+    groups = parse(selector)
+    return [element for element in scope.iter()
+            if element is not scope and element.tag != '#document'
+            and any(_matches(element, parts) for parts in groups)]
@@ -0,0 +1,345 @@
+"""Minimal HTML document object model built with the standard HTML parser."""
+
+import re
+from collections import OrderedDict
+
+try:
+    from HTMLParser import HTMLParser
+    from htmlentitydefs import name2codepoint
+    unichr = unichr
+except ImportError:  # Python 3
+    from html.parser import HTMLParser
+    from html.entities import name2codepoint
+    unichr = chr
+
+
+VOID_ELEMENTS = frozenset(['area', 'base', 'br', 'col', 'embed', 'hr', 'img',
+                           'input', 'link', 'meta', 'param', 'source',
+                           'track', 'wbr'])
+BOOLEAN_ATTRIBUTES = frozenset(['async', 'autofocus', 'checked', 'defer',
+                                'disabled', 'hidden', 'multiple', 'novalidate',
+                                'readonly', 'required', 'selected'])
+BLOCK_ELEMENTS = frozenset(['address', 'article', 'aside', 'blockquote',
+                            'body', 'dd', 'div', 'dl', 'dt', 'fieldset',
+                            'figure', 'footer', 'form', 'h1', 'h2', 'h3',
+                            'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+                            'nav', 'ol', 'option', 'p', 'pre', 'section',
+                            'select', 'table', 'tbody', 'tfoot', 'thead',
+                            'tr', 'ul'])
+INVISIBLE_ELEMENTS = frozenset(['head', 'script', 'style', 'template',
+                                'title', 'noscript'])
+# Start tag -> (tags it implicitly closes, tags stopping the search).
+IMPLIED_END_TAGS = {
+    'li': (('li',), ('ul', 'ol')),
+    'option': (('option',), ('select', 'datalist')),
+    'dt': (('dt', 'dd'), ('dl',)),
+    'dd': (('dt', 'dd'), ('dl',)),
+    'tr': (('tr', 'td', 'th'), ('table', 'thead', 'tbody', 'tfoot')),
+    'td': (('td', 'th'), ('tr', 'table')),
+    'th': (('td', 'th'), ('tr', 'table')),
+    'thead': (('tbody', 'thead', 'tfoot', 'tr', 'td', 'th'), ('table',)),
+    'tbody': (('tbody', 'thead', 'tfoot', 'tr', 'td', 'th'), ('table',)),
+    'tfoot': (('tbody', 'thead', 'tfoot', 'tr', 'td', 'th'), ('table',)),
+    'p': (('p',), ('body', 'div', 'section', 'article', 'td', 'th', 'li')),
+}
+WHITESPACE = re.compile(r'[ \t\r\n\f]+')
+
+
+class Node(object):
+    parent = None
+    order = 0
+
+    @property
+    def document(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+
+class Text(Node):
+
+    def __init__(self, data):
+        self.data = data
+
+    @property
+    def string_value(self):
+        return self.data
+
+
+class Attribute(Node):
+
+    def __init__(self, element, name, value):
+        self.parent = element
+        self.name = name
+        self.value = value
+        self.order = element.order
+
+    @property
+    def string_value(self):
+        return self.value
+
+
+class Element(Node):
+
+    def __init__(self, tag, attributes=()):
+        self.tag = tag
+        self.attributes = OrderedDict(attributes)
+        self.children = []
+        self.value = self.attributes.get('value', '')
+        self.checked = 'checked' in self.attributes
+        self.selected = 'selected' in self.attributes
+        self.content_document = None
+        self._string_value = None
+
+    def append(self, node):
+        node.parent = self
+        self.children.append(node)
+        self._string_value = None
+
+    @property
+    def elements(self):
+        return [child for child in self.children if isinstance(child, Element)]
+
+    def iter(self):
+        """Iterates this element and its descendant elements in document order.
+
+        Iterative to support arbitrarily deep documents.
+        """
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element.elements))
+
+    def iter_nodes(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            if isinstance(node, Element):
+                stack.extend(reversed(node.children))
+
+    @property
+    def string_value(self):
+        if self._string_value is None:
+            self._string_value = ''.join(node.data for node in self.iter_nodes()
+                                         if isinstance(node, Text))
+        return self._string_value
+
+    def get(self, name, default=None):
+        return self.attributes.get(name, default)
+
+    @property
+    def classes(self):
+        return self.attributes.get('class', '').split()
+
+    @property
+    def is_displayed(self):
+        for element in self.ancestors(include_self=True):
+            if not isinstance(element, Element) or element.tag == '#document':
+                break
+            style = element.get('style', '').replace(' ', '').lower()
+            if (element.tag in INVISIBLE_ELEMENTS or 'hidden' in element.attributes
+                    or 'display:none' in style
+                    or 'visibility:hidden' in style
+                    or (element.tag == 'input'
+                        and element.get('type', '').lower() == 'hidden')):
+                return False
+        return True
+
+    @property
+    def is_enabled(self):
+        return not any('disabled' in element.attributes
+                       for element in self.ancestors(include_self=True)
+                       if element.tag in ('input', 'button', 'select',
+                                          'textarea', 'option', 'optgroup',
+                                          'fieldset'))
+
+    def ancestors(self, include_self=False):
+        node = self if include_self else self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    @property
+    def visible_text(self):
+        """Rendered text roughly the way browsers return it."""
+        if not self.is_displayed:
+            return ''
+        lines = ['']
+        self._collect_text(self, lines)
+        return '\n'.join(line.strip() for line in lines if line.strip())
+
+    def _collect_text(self, element, lines):
+        stack = [element]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                lines.append('')
+            elif isinstance(node, Text):
+                lines[-1] += WHITESPACE.sub(' ', node.data)
+            elif node.tag == 'br':
+                lines.append('')
+            elif node.tag in ('td', 'th') and lines[-1].strip():
+                lines[-1] += ' '
+                stack.extend(reversed(node.children))
+            elif node.is_visible_child:
+                if node.tag in BLOCK_ELEMENTS:
+                    lines.append('')
+                    stack.append(None)
+                stack.extend(reversed(node.children))
+
+    @property
+    def is_visible_child(self):
+        style = self.get('style', '').replace(' ', '').lower()
+        return not (self.tag in INVISIBLE_ELEMENTS or 'hidden' in self.attributes
+                    or 'display:none' in style)
+
+    def get_style(self, name):
+        for declaration in self.get('style', '').split(';'):
+            if ':' in declaration:
+                key, value = declaration.split(':', 1)
+                if key.strip().lower() == name.lower():
+                    return value.strip()
+        return ''
+
+    def serialize(self):
+        parts = []
+        self._serialize(parts)
+        return ''.join(parts)
+
+    def _serialize(self, parts):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Text):
+                parts.append(escape(node.data))
+            elif isinstance(node, tuple):
+                parts.append('</%s>' % node[0])
+            elif node.tag == '#document':
+                stack.extend(reversed(node.children))
+            else:
+                attributes = ''.join(' %s="%s"' % (name, escape(value, True))
+                                     for name, value in node.attributes.items())
+                parts.append('<%s%s>' % (node.tag, attributes))
+                if node.tag not in VOID_ELEMENTS:
+                    stack.append((node.tag,))
+                    stack.extend(reversed(node.children))
+
+
+class Document(Element):
+
+    def __init__(self, url='about:blank'):
+        Element.__init__(self, '#document')
+        self.url = url
+        self.alive = True
+
+    @property
+    def title(self):
+        for element in self.iter():
+            if element.tag == 'title':
+                return WHITESPACE.sub(' ', element.string_value).strip()
+        return ''
+
+    @property
+    def body(self):
+        for element in self.iter():
+            if element.tag == 'body':
+                return element
+        return self.elements[0] if self.elements else self
+
+    def number(self):
+        for index, node in enumerate(self.iter_nodes()):
+            node.order = index
+
+
+def escape(text, attribute=False):
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return text.replace('"', '&quot;') if attribute else text
+
+
+class DocumentBuilder(HTMLParser):
+
+    def __init__(self, url):
+        HTMLParser.__init__(self)
+        self.document = Document(url)
+        self.stack = [self.document]
+
+    @property
+    def current(self):
+        return self.stack[-1]
+
+    def handle_starttag(self, tag, attrs):
+        self._close_implied(tag)
+        element = Element(tag, [(name, value if value is not None else '')
+                                for name, value in attrs])
+        self.current.append(element)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.stack.pop()
+
+    def _close_implied(self, tag):
+        if tag not in IMPLIED_END_TAGS:
+            return
+        closes, stops = IMPLIED_END_TAGS[tag]
+        close_from = None
+        for index in range(len(self.stack) - 1, 0, -1):
+            open_tag = self.stack[index].tag
+            if open_tag in stops:
+                break
+            if open_tag in closes:
+                close_from = index
+        if close_from is not None:
+            del self.stack[close_from:]
+        if tag == 'tr' and self.current.tag == 'table':
+            self.handle_starttag('tbody', [])
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                return
+
+    def handle_data(self, data):
+        children = self.current.children
+        if children and isinstance(children[-1], Text):
+            children[-1].data += data
+        else:
+            self.current.append(Text(data))
+
+    def handle_entityref(self, name):
+        if name in name2codepoint:
+            self.handle_data(unichr(name2codepoint[name]))
+        else:
+            self.handle_data('&%s;' % name)
+
+    def handle_charref(self, name):
+        if name.lower().startswith('x'):
+            self.handle_data(unichr(int(name[1:], 16)))
+        else:
+            self.handle_data(unichr(int(name)))
+
+
+def parse(html, url='about:blank'):
+    builder = DocumentBuilder(url)
+    builder.feed(html)
+    builder.close()
+    document = builder.document
+    document.number()
+    _select_default_options(document)
+    return document
+
+
+def _select_default_options(document):
+    # Like browsers, select the first option of single selection lists
+    # having no selected option.
+    for select in document.iter():
+        if select.tag == 'select' and 'multiple' not in select.attributes:
+            options = [e for e in select.iter() if e.tag == 'option']
+            if options and not any(option.selected for option in options):
+                options[0].selected = True
@@ -0,0 +1,703 @@
+"""In-process fake WebDriver server speaking the W3C WebDriver protocol.
+
+Pages are loaded over HTTP or from files, parsed with the standard HTML
+parser and kept as a static document. JavaScript is not executed, but the
+scripts Selenium and SeleniumLibrary commonly send are emulated. Every
+command can be delayed with a configurable latency, which makes it
+possible to measure round-trips without a real browser.
+"""
+
+from __future__ import print_function
+
+import base64
+import itertools
+import json
+import re
+import threading
+import time
+import uuid
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urllib2 import urlopen
+    from urllib import unquote
+    from urlparse import urljoin
+except ImportError:  # Python 3
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import unquote, urljoin
+    from urllib.request import urlopen
+
+from . import css, xpath
+from .dom import BOOLEAN_ATTRIBUTES, Element, parse
+
+
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+# 1x1 transparent PNG.
+SCREENSHOT = ('iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAA'
+              'AAYAAjCB0C8AAAAASUVORK5CYII=')
+
+
+class WebDriverError(Exception):
+
+    def __init__(self, error, message, status=404):
+        Exception.__init__(self, message)
+        self.error = error
+        self.status = status
+
+
+def no_such_element(message):
+    return WebDriverError('no such element', message)
+
+
+class Session(object):
+
+    def __init__(self, capabilities):
+        self.id = uuid.uuid4().hex
+        self.capabilities = capabilities
+        self.window = 'window-%s' % self.id[:8]
+        self.rect = {'x': 0, 'y': 0, 'width': 1024, 'height': 768}
+        self.timeouts = {'implicit': 0, 'pageLoad': 300000, 'script': 30000}
+        self.cookies = []
+        self.history = []
+        self.history_index = -1
+        self.document = parse('', 'about:blank')
+        self.frames = []
+        self._references = {}
+        self._ids = itertools.count(1)
+
+    @property
+    def context(self):
+        return self.frames[-1] if self.frames else self.document
+
+    def navigate(self, url, record=True):
+        self.document.alive = False
+        self.document = load(url)
+        self.frames = []
+        if record:
+            del self.history[self.history_index + 1:]
+            self.history.append(url)
+            self.history_index = len(self.history) - 1
+
+    def reference(self, element):
+        if not hasattr(element, 'reference'):
+            element.reference = 'element-%d' % next(self._ids)
+            self._references[element.reference] = element
+        return {ELEMENT_KEY: element.reference}
+
+    def element(self, reference):
+        element = self._references.get(reference)
+        if element is None:
+            raise no_such_element("Element '%s' does not exist." % reference)
+        if not element.document.alive:
+            raise WebDriverError('stale element reference',
+                                 'Element is not attached to the page document.')
+        return element
+
+    def encode(self, value):
+        if isinstance(value, Element):
+            return self.reference(value)
+        if isinstance(value, (list, tuple)):
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            return dict((key, self.encode(item)) for key, item in value.items())
+        return value
+
+    def decode(self, value):
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self.element(value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        return value
+
+
+def load(url):
+    if url.startswith('about:'):
+        html = ''
+    elif url.startswith('data:'):
+        header, _, data = url[5:].partition(',')
+        if header.endswith(';base64'):
+            html = base64.b64decode(data).decode('UTF-8')
+        else:
+            html = unquote(data)
+    else:
+        try:
+            response = urlopen(url, timeout=30)
+            html = response.read().decode('UTF-8', 'replace')
+            response.close()
+        except Exception as error:
+            raise WebDriverError('unknown error', "Loading '%s' failed: %s"
+                                 % (url, error), status=500)
+    return parse(html, url)
+
+
+def find(session, scope, using, value):
+    try:
+        if using == 'css selector':
+            return css.select(scope, value)
+        if using == 'xpath':
+            return [node for node in xpath.select(scope, value)
+                    if isinstance(node, Element)]
+    except ValueError as error:
+        raise WebDriverError('invalid selector', str(error), status=400)
+    if using == 'tag name':
+        return [element for element in scope.iter()
+                if element is not scope and element.tag == value.lower()]
+    if using in ('link text', 'partial link text'):
+        links = [element for element in scope.iter() if element.tag == 'a'
+                 and element is not scope]
+        if using == 'link text':
+            return [link for link in links if link.visible_text == value.strip()]
+        return [link for link in links if value in link.visible_text]
+    raise WebDriverError('invalid argument',
+                         "Unsupported locator strategy '%s'." % using,
+                         status=400)
+
+
+# Emulated scripts. Selenium sends the getAttribute and isDisplayed atoms
+# as 'return (function(){...}).apply(null, arguments);'.
+def get_attribute(element, name):
+    name = name.lower()
+    if name in ('checked', 'selected'):
+        return 'true' if element.checked or element.selected else None
+    if name in BOOLEAN_ATTRIBUTES:
+        return 'true' if name in element.attributes else None
+    if name == 'value' and element.tag in ('input', 'textarea', 'option',
+                                           'select', 'button'):
+        return get_property(element, 'value')
+    if name in ('href', 'src') and name in element.attributes:
+        return urljoin(element.document.url, element.attributes[name])
+    if name == 'index':
+        return get_property(element, 'index')
+    if name == 'classname':
+        name = 'class'
+    return element.get(name)
+
+
+def get_property(element, name):
+    if name == 'value':
+        if element.tag == 'select':
+            selected = [option for option in element.iter()
+                        if option.tag == 'option' and option.selected]
+            return get_property(selected[0], 'value') if selected else ''
+        if element.tag == 'option' and 'value' not in element.attributes:
+            return element.string_value.strip()
+        return element.value
+    if name in ('checked', 'selected'):
+        return element.checked or element.selected
+    if name in BOOLEAN_ATTRIBUTES:
+        return name in element.attributes
+    if name == 'tagName':
+        return element.tag.upper()
+    if name == 'textContent':
+        return element.string_value
+    if name == 'innerText':
+        return element.visible_text
+    if name == 'innerHTML':
+        return ''.join(child.serialize() if isinstance(child, Element)
+                       else child.data for child in element.children)
+    if name == 'outerHTML':
+        return element.serialize()
+    if name == 'index':
+        select = next((ancestor for ancestor in element.ancestors()
+                       if getattr(ancestor, 'tag', None) == 'select'), None)
+        if select is None:
+            return 0
+        options = [e for e in select.iter() if e.tag == 'option']
+        return options.index(element)
+    if name == 'className':
+        name = 'class'
+    return element.get(name)
+
+
+SCRIPTS = [
+    (re.compile(r'^return \(function.*\)\.apply\(null, arguments\);$', re.S),
+     lambda session, args: (get_attribute(*args) if len(args) == 2
+                            else args[0].is_displayed)),
+    (re.compile(r'^\s*return window\.innerWidth;?\s*$'),
+     lambda session, args: session.rect['width']),
+    (re.compile(r'^\s*return window\.innerHeight;?\s*$'),
+     lambda session, args: session.rect['height'] - 80),
+    (re.compile(r'^\s*return \[ ?window\.id, ?window\.name ?\];?\s*$'),
+     lambda session, args: [None, '']),
+    (re.compile(r'^\s*return document\.readyState;?\s*$'),
+     lambda session, args: 'complete'),
+    (re.compile(r'^\s*return document\.title;?\s*$'),
+     lambda session, args: session.document.title),
+    (re.compile(r'^\s*return (document|window)\.location\.href;?\s*$'),
+     lambda session, args: session.document.url),
+    (re.compile(r"^\s*arguments\[0\]\.id = '([^']*)';?\s*$"), None),
+]
+
+
+def execute_script(session, script, args):
+    args = session.decode(args)
+    for pattern, handler in SCRIPTS:
+        match = pattern.match(script)
+        if match:
+            if handler is None:
+                args[0].attributes['id'] = match.group(1)
+                return None
+            return handler(session, args)
+    return None
+
+
+def click(session, element):
+    tag, kind = element.tag, element.get('type', '').lower()
+    if not element.is_enabled:
+        return
+    if tag == 'input' and kind == 'checkbox':
+        element.checked = not element.checked
+    elif tag == 'input' and kind == 'radio':
+        name = element.get('name')
+        for other in element.document.iter():
+            if (other.tag == 'input' and other.get('type', '').lower() == 'radio'
+                    and name is not None and other.get('name') == name):
+                other.checked = False
+        element.checked = True
+    elif tag == 'option':
+        select = next((ancestor for ancestor in element.ancestors()
+                       if getattr(ancestor, 'tag', None) == 'select'), None)
+        if select is not None and 'multiple' in select.attributes:
+            element.selected = not element.selected
+        else:
+            if select is not None:
+                for option in select.iter():
+                    option.selected = False
+            element.selected = True
+    elif tag == 'a' and element.get('href'):
+        href = element.get('href')
+        if not href.startswith(('#', 'javascript:')):
+            session.navigate(urljoin(element.document.url, href))
+
+
+def send_keys(element, text):
+    # Characters in the private use area are WebDriver key codes.
+    text = ''.join(character for character in text
+                   if not u'\ue000' <= character <= u'\uf8ff')
+    element.value += text
+
+
+def frame_document(session, frame_id):
+    context = session.context
+    if frame_id is None:
+        return None
+    if isinstance(frame_id, int):
+        frames = [element for element in context.iter()
+                  if element.tag in ('frame', 'iframe')]
+        if frame_id >= len(frames):
+            raise WebDriverError('no such frame', 'Frame %d not found.' % frame_id)
+        frame = frames[frame_id]
+    else:
+        frame = session.decode(frame_id)
+        if not isinstance(frame, Element) or frame.tag not in ('frame', 'iframe'):
+            raise WebDriverError('no such frame', 'Element is not a frame.')
+    if frame.content_document is None or not frame.content_document.alive:
+        src = frame.get('src', 'about:blank')
+        frame.content_document = load(urljoin(frame.document.url, src))
+    return frame.content_document
+
+
+class FakeWebDriver(object):
+    """Command implementations. Names are used to configure latencies."""
+
+    def __init__(self):
+        self.sessions = {}
+
+    def new_session(self, session, body):
+        capabilities = dict(body.get('capabilities', {}).get('alwaysMatch', {}))
+        capabilities.setdefault('browserName', 'fake')
+        capabilities.update({'browserVersion': '1.0', 'platformName': 'any',
+                             'acceptInsecureCerts': False})
+        session = Session(capabilities)
+        self.sessions[session.id] = session
+        return {'sessionId': session.id, 'capabilities': capabilities}
+
+    def delete_session(self, session, body):
+        self.sessions.pop(session.id, None)
+
+    def status(self, session, body):
+        return {'ready': True, 'message': 'Fake WebDriver ready.'}
+
+    def get_timeouts(self, session, body):
+        return session.timeouts
+
+    def set_timeouts(self, session, body):
+        for name in ('implicit', 'pageLoad', 'script'):
+            if name in body:
+                session.timeouts[name] = body[name]
+
+    def navigate_to(self, session, body):
+        session.navigate(body['url'])
+
+    def get_current_url(self, session, body):
+        return session.document.url
+
+    def back(self, session, body):
+        if session.history_index > 0:
+            session.history_index -= 1
+            session.navigate(session.history[session.history_index], False)
+
+    def forward(self, session, body):
+        if session.history_index < len(session.history) - 1:
+            session.history_index += 1
+            session.navigate(session.history[session.history_index], False)
+
+    def refresh(self, session, body):
+        session.navigate(session.document.url, False)
+
+    def get_title(self, session, body):
+        return session.document.title
+
+    def get_page_source(self, session, body):
+        return session.context.serialize()
+
+    def get_window_handle(self, session, body):
+        return session.window
+
+    def get_window_handles(self, session, body):
+        return [session.window] if session.window else []
+
+    def close_window(self, session, body):
+        session.window = None
+        self.sessions.pop(session.id, None)
+        return []
+
+    def switch_to_window(self, session, body):
+        if body.get('handle') != session.window:
+            raise WebDriverError('no such window', 'Window not found.')
+
+    def get_window_rect(self, session, body):
+        return session.rect
+
+    def set_window_rect(self, session, body):
+        session.rect.update((key, value) for key, value in body.items()
+                            if key in session.rect and value is not None)
+        return session.rect
+
+    def maximize_window(self, session, body):
+        session.rect.update({'x': 0, 'y': 0, 'width': 1920, 'height': 1080})
+        return session.rect
+
+    def switch_to_frame(self, session, body):
+        document = frame_document(session, body.get('id'))
+        if document is None:
+            session.frames = []
+        else:
+            session.frames.append(document)
+
+    def switch_to_parent_frame(self, session, body):
+        if session.frames:
+            session.frames.pop()
+
+    def find_element(self, session, body, element_id=None):
+        elements = self.find_elements(session, body, element_id)
+        if not elements:
+            raise no_such_element('Unable to locate element: %s=%s'
+                                  % (body['using'], body['value']))
+        return elements[0]
+
+    def find_elements(self, session, body, element_id=None):
+        scope = (session.element(element_id) if element_id
+                 else session.context)
+        return [session.reference(element) for element
+                in find(session, scope, body['using'], body['value'])]
+
+    def find_element_from_element(self, session, body, element_id):
+        return self.find_element(session, body, element_id)
+
+    def find_elements_from_element(self, session, body, element_id):
+        return self.find_elements(session, body, element_id)
+
+    def get_active_element(self, session, body):
+        return session.reference(session.context.body)
+
+    def is_element_selected(self, session, body, element_id):
+        element = session.element(element_id)
+        return element.checked or element.selected
+
+    def is_element_enabled(self, session, body, element_id):
+        return session.element(element_id).is_enabled
+
+    def is_element_displayed(self, session, body, element_id):
+        return session.element(element_id).is_displayed
+
+    def get_element_attribute(self, session, body, element_id, name):
+        return get_attribute(session.element(element_id), name)
+
+    def get_element_property(self, session, body, element_id, name):
+        return get_property(session.element(element_id), name)
+
+    def get_element_css_value(self, session, body, element_id, name):
+        return session.element(element_id).get_style(name)
+
+    def get_element_text(self, session, body, element_id):
+        return session.element(element_id).visible_text
+
+    def get_element_tag_name(self, session, body, element_id):
+        return session.element(element_id).tag
+
+    def get_element_rect(self, session, body, element_id):
+        element = session.element(element_id)
+        return {'x': 8, 'y': 8 + element.order % 1000, 'width': 100,
+                'height': 20}
+
+    def element_click(self, session, body, element_id):
+        click(session, session.element(element_id))
+
+    def element_clear(self, session, body, element_id):
+        session.element(element_id).value = ''
+
+    def element_send_keys(self, session, body, element_id):
+        send_keys(session.element(element_id),
+                  body.get('text', ''.join(body.get('value', []))))
+
+    def execute_script(self, session, body):
+        return session.encode(execute_script(session, body['script'],
+                                             body.get('args', [])))
+
+    def execute_async_script(self, session, body):
+        return self.execute_script(session, body)
+
+    def get_all_cookies(self, session, body):
+        return session.cookies
+
+    def get_named_cookie(self, session, body, name):
+        for cookie in session.cookies:
+            if cookie['name'] == name:
+                return cookie
+        raise WebDriverError('no such cookie', "Cookie '%s' not found." % name)
+
+    def add_cookie(self, session, body):
+        cookie = dict({'path': '/', 'domain': '', 'secure': False,
+                       'httpOnly': False}, **body['cookie'])
+        self.delete_cookie(session, body, cookie['name'])
+        session.cookies.append(cookie)
+
+    def delete_cookie(self, session, body, name):
+        session.cookies = [cookie for cookie in session.cookies
+                           if cookie['name'] != name]
+
+    def delete_all_cookies(self, session, body):
+        session.cookies = []
+
+    def perform_actions(self, session, body):
+        pass
+
+    def release_actions(self, session, body):
+        pass
+
+    def alert(self, session, body):
+        raise WebDriverError('no such alert', 'No alert is open.')
+
+    def take_screenshot(self, session, body, element_id=None):
+        if element_id:
+            session.element(element_id)
+        return SCREENSHOT
+
+
+ROUTES = [
+    ('POST', '/session', 'new_session'),
+    ('GET', '/status', 'status'),
+    ('DELETE', '/session/{id}', 'delete_session'),
+    ('GET', '/session/{id}/timeouts', 'get_timeouts'),
+    ('POST', '/session/{id}/timeouts', 'set_timeouts'),
+    ('POST', '/session/{id}/url', 'navigate_to'),
+    ('GET', '/session/{id}/url', 'get_current_url'),
+    ('POST', '/session/{id}/back', 'back'),
+    ('POST', '/session/{id}/forward', 'forward'),
+    ('POST', '/session/{id}/refresh', 'refresh'),
+    ('GET', '/session/{id}/title', 'get_title'),
+    ('GET', '/session/{id}/source', 'get_page_source'),
+    ('GET', '/session/{id}/window', 'get_window_handle'),
+    ('DELETE', '/session/{id}/window', 'close_window'),
+    ('POST', '/session/{id}/window', 'switch_to_window'),
+    ('GET', '/session/{id}/window/handles', 'get_window_handles'),
+    ('GET', '/session/{id}/window/rect', 'get_window_rect'),
+    ('POST', '/session/{id}/window/rect', 'set_window_rect'),
+    ('POST', '/session/{id}/window/(?:maximize|minimize|fullscreen)',
+     'maximize_window'),
+    ('POST', '/session/{id}/frame', 'switch_to_frame'),
+    ('POST', '/session/{id}/frame/parent', 'switch_to_parent_frame'),
+    ('GET', '/session/{id}/element/active', 'get_active_element'),
+    ('POST', '/session/{id}/element', 'find_element'),
+    ('POST', '/session/{id}/elements', 'find_elements'),
+    ('POST', '/session/{id}/element/{element}/element',
+     'find_element_from_element'),
+    ('POST', '/session/{id}/element/{element}/elements',
+     'find_elements_from_element'),
+    ('GET', '/session/{id}/element/{element}/selected', 'is_element_selected'),
+    ('GET', '/session/{id}/element/{element}/enabled', 'is_element_enabled'),
+    ('GET', '/session/{id}/element/{element}/displayed',
+     'is_element_displayed'),
+    ('GET', '/session/{id}/element/{element}/attribute/{name}',
+     'get_element_attribute'),
+    ('GET', '/session/{id}/element/{element}/property/{name}',
+     'get_element_property'),
+    ('GET', '/session/{id}/element/{element}/css/{name}',
+     'get_element_css_value'),
+    ('GET', '/session/{id}/element/{element}/text', 'get_element_text'),
+    ('GET', '/session/{id}/element/{element}/name', 'get_element_tag_name'),
+    ('GET', '/session/{id}/element/{element}/rect', 'get_element_rect'),
+    ('POST', '/session/{id}/element/{element}/click', 'element_click'),
+    ('POST', '/session/{id}/element/{element}/clear', 'element_clear'),
+    ('POST', '/session/{id}/element/{element}/value', 'element_send_keys'),
+    ('GET', '/session/{id}/element/{element}/screenshot', 'take_screenshot'),
+    ('POST', '/session/{id}/execute/sync', 'execute_script'),
+    ('POST', '/session/{id}/execute/async', 'execute_async_script'),
+    ('GET', '/session/{id}/cookie', 'get_all_cookies'),
+    ('POST', '/session/{id}/cookie', 'add_cookie'),
+    ('DELETE', '/session/{id}/cookie', 'delete_all_cookies'),
+    ('GET', '/session/{id}/cookie/{name}', 'get_named_cookie'),
+    ('DELETE', '/session/{id}/cookie/{name}', 'delete_cookie'),
+    ('POST', '/session/{id}/actions', 'perform_actions'),
+    ('DELETE', '/session/{id}/actions', 'release_actions'),
+    ('GET', '/session/{id}/alert/text', 'alert'),
+    ('POST', '/session/{id}/alert/(?:text|accept|dismiss)', 'alert'),
+    ('GET', '/session/{id}/screenshot', 'take_screenshot'),
+]
+
+
+def _compile_route(pattern):
+    pattern = (pattern.replace('{id}', '(?P<session>[^/]+)')
+               .replace('{element}', '(?P<element>[^/]+)')
+               .replace('{name}', '(?P<name>[^/]+)'))
+    return re.compile('^%s$' % pattern)
+
+
+ROUTES = [(method, _compile_route(pattern), handler)
+          for method, pattern, handler in ROUTES]
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+    def do_QUIT(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        threading.Thread(target=self.server.shutdown).start()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, value = self.server.fake.handle(method, self.path,
+                                                body.decode('UTF-8'))
+        data = json.dumps({'value': value}).encode('UTF-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class ThreadingServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeWebDriverServer(object):
+    """Fake W3C WebDriver server running in a background thread.
+
+    ``latency`` is the delay in seconds added to every command and
+    ``latencies`` overrides it for individual commands using the names of
+    the `FakeWebDriver` methods, for example ``{'find_elements': 0.05}``.
+    Handled commands are recorded to ``commands``.
+
+    Browsers are opened against the server with ``remote_url``::
+
+        server = FakeWebDriverServer(latency=0.001).start()
+        Open Browser    ${URL}    remote_url=${server.url}
+    """
+
+    def __init__(self, port=0, latency=0.0, latencies=None):
+        self.port = port
+        self.latency = latency
+        self.latencies = latencies or {}
+        self.commands = []
+        self.driver = FakeWebDriver()
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:%d' % self.port
+
+    def start(self):
+        self._server = ThreadingServer(('127.0.0.1', self.port), RequestHandler)
+        self._server.fake = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name='FakeWebDriverServer')
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def wait(self):
+        while self._thread.is_alive():
+            self._thread.join(0.5)
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_commands(self):
+        with self._lock:
+            self.commands = []
+
+    def handle(self, method, path, body):
+        path = path.split('?')[0].rstrip('/')
+        for route_method, pattern, name in ROUTES:
+            match = route_method == method and pattern.match(path)
+            if match:
+                break
+        else:
+            return 404, {'error': 'unknown command', 'stacktrace': '',
+                         'message': 'Unknown command %s %s.' % (method, path)}
+        with self._lock:
+            self.commands.append(name)
+        delay = self.latencies.get(name, self.latency)
+        if delay:
+            time.sleep(delay)
+        try:
+            return 200, self._execute(name, match.groupdict(), body)
+        except WebDriverError as error:
+            return error.status, {'error': error.error, 'message': str(error),
+                                  'stacktrace': ''}
+
+    def _execute(self, name, arguments, body):
+        body = json.loads(body) if body.strip() else {}
+        session = None
+        if 'session' in arguments:
+            session = self.driver.sessions.get(arguments.pop('session'))
+            if session is None:
+                raise WebDriverError('invalid session id', 'Session not found.')
+        args = [arguments[key] for key in ('element', 'name')
+                if arguments.get(key) is not None]
+        args = [unquote(arg) for arg in args]
+        with self._lock:
+            return getattr(self.driver, name)(session, body, *args)
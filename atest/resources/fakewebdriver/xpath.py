@@ -0,0 +1,582 @@
+"""XPath 1.0 subset used by the fake WebDriver.
+
+Supports location paths with the common axes, name, ``*``, ``text()`` and
+``node()`` tests, predicates, unions, comparisons, ``and``/``or`` and the
+most used functions. Arithmetic is limited to addition and subtraction
+and variables are not supported.
+"""
+
+import math
+import re
+
+from .dom import Attribute, Element, Text, WHITESPACE
+
+
+class XPathError(ValueError):
+    pass
+
+
+TOKEN = re.compile(r'''
+    \s*(?:
+        (?P<literal>"[^"]*"|'[^']*')
+      | (?P<number>\d+(?:\.\d*)?|\.\d+)
+      | (?P<operator>//|::|\.\.|!=|<=|>=|[/()\[\]@,|=<>.*+-])
+      | (?P<name>[A-Za-z_][\w.-]*(?::[A-Za-z_][\w.-]*)?)
+    )\s*''', re.VERBOSE)
+AXES = frozenset(['ancestor', 'ancestor-or-self', 'attribute', 'child',
+                  'descendant', 'descendant-or-self', 'following-sibling',
+                  'parent', 'preceding-sibling', 'self'])
+
+
+def tokenize(expression):
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise XPathError("Invalid expression '%s'." % expression)
+        position = match.end()
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'literal':
+            value = value[1:-1]
+        elif kind == 'number':
+            value = float(value)
+        tokens.append((kind, value))
+    return tokens
+
+
+# Value helpers
+
+def string(value):
+    if isinstance(value, list):
+        return value[0].string_value if value else ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float):
+        if value == int(value):
+            return str(int(value))
+        return repr(value)
+    return value
+
+
+def number(value):
+    if isinstance(value, float):
+        return value
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    try:
+        return float(string(value).strip())
+    except ValueError:
+        return float('nan')
+
+
+def boolean(value):
+    if isinstance(value, list):
+        return bool(value)
+    if isinstance(value, float):
+        return value != 0 and not math.isnan(value)
+    return bool(value)
+
+
+# Expression tree
+
+class Context(object):
+
+    def __init__(self, node, position=1, size=1):
+        self.node = node
+        self.position = position
+        self.size = size
+
+
+class Expression(object):
+    positional = False
+
+    def evaluate(self, context):
+        raise NotImplementedError
+
+
+class Literal(Expression):
+
+    def __init__(self, value):
+        self.value = value
+        self.positional = isinstance(value, float)
+
+    def evaluate(self, context):
+        return self.value
+
+
+class Operation(Expression):
+
+    def __init__(self, operator, left, right):
+        self.operator = operator
+        self.left = left
+        self.right = right
+        self.positional = left.positional or right.positional
+
+    def evaluate(self, context):
+        if self.operator == 'or':
+            return (boolean(self.left.evaluate(context))
+                    or boolean(self.right.evaluate(context)))
+        if self.operator == 'and':
+            return (boolean(self.left.evaluate(context))
+                    and boolean(self.right.evaluate(context)))
+        left = self.left.evaluate(context)
+        right = self.right.evaluate(context)
+        if self.operator == '+':
+            return number(left) + number(right)
+        if self.operator == '-':
+            return number(left) - number(right)
+        if self.operator == '|':
+            if not (isinstance(left, list) and isinstance(right, list)):
+                raise XPathError('Union requires node-sets.')
+            return document_order(left + right)
+        return compare(self.operator, left, right)
+
+
+COMPARATORS = {
+    '=': lambda a, b: a == b,
+    '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b,
+    '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b,
+    '>=': lambda a, b: a >= b,
+}
+
+
+def compare(operator, left, right):
+    function = COMPARATORS[operator]
+    equality = operator in ('=', '!=')
+    if isinstance(left, list) and isinstance(right, list):
+        right_values = [node.string_value for node in right]
+        return any(function(*_convert(a.string_value, b, equality))
+                   for a in left for b in right_values)
+    if isinstance(left, list):
+        return any(function(*_convert_single(node.string_value, right, equality))
+                   for node in left) if not isinstance(right, bool) \
+            else function(boolean(left), right)
+    if isinstance(right, list):
+        return any(function(*_convert_single(node.string_value, left, equality)[::-1])
+                   for node in right) if not isinstance(left, bool) \
+            else function(left, boolean(right))
+    if not equality:
+        return function(number(left), number(right))
+    if isinstance(left, bool) or isinstance(right, bool):
+        return function(boolean(left), boolean(right))
+    if isinstance(left, float) or isinstance(right, float):
+        return function(number(left), number(right))
+    return function(string(left), string(right))
+
+
+def _convert(a, b, equality):
+    if equality:
+        return a, b
+    return number(a), number(b)
+
+
+def _convert_single(node_value, other, equality):
+    if isinstance(other, float) or not equality:
+        return number(node_value), number(other)
+    return node_value, string(other)
+
+
+class Function(Expression):
+
+    def __init__(self, name, arguments):
+        if name not in FUNCTIONS:
+            raise XPathError("Unsupported function '%s'." % name)
+        self.name = name
+        self.function = FUNCTIONS[name]
+        self.arguments = arguments
+        self.positional = (name in ('position', 'last')
+                           or any(arg.positional for arg in arguments))
+
+    def evaluate(self, context):
+        values = [argument.evaluate(context) for argument in self.arguments]
+        return self.function(context, *values)
+
+
+def _default(context, value):
+    return [context.node] if value is None else value
+
+
+def _normalize_space(context, value=None):
+    return WHITESPACE.sub(' ', string(_default(context, value))).strip()
+
+
+def _translate(context, value, source, target):
+    value, source, target = string(value), string(source), string(target)
+    result = []
+    for character in value:
+        index = source.find(character)
+        if index == -1:
+            result.append(character)
+        elif index < len(target):
+            result.append(target[index])
+    return ''.join(result)
+
+
+def _name(context, value=None):
+    nodes = _default(context, value)
+    if not nodes:
+        return ''
+    node = nodes[0]
+    if isinstance(node, Attribute):
+        return node.name
+    return node.tag if isinstance(node, Element) else ''
+
+
+FUNCTIONS = {
+    'boolean': lambda context, value: boolean(value),
+    'concat': lambda context, *values: ''.join(string(v) for v in values),
+    'contains': lambda context, a, b: string(b) in string(a),
+    'count': lambda context, nodes: float(len(nodes)),
+    'ends-with': lambda context, a, b: string(a).endswith(string(b)),
+    'false': lambda context: False,
+    'last': lambda context: float(context.size),
+    'local-name': _name,
+    'name': _name,
+    'normalize-space': _normalize_space,
+    'not': lambda context, value: not boolean(value),
+    'number': lambda context, value=None: number(_default(context, value)),
+    'position': lambda context: float(context.position),
+    'starts-with': lambda context, a, b: string(a).startswith(string(b)),
+    'string': lambda context, value=None: string(_default(context, value)),
+    'string-length': lambda context, value=None:
+        float(len(string(_default(context, value)))),
+    'substring-after': lambda context, a, b:
+        string(a).partition(string(b))[2] if string(b) in string(a) else '',
+    'substring-before': lambda context, a, b: string(a).partition(string(b))[0]
+        if string(b) in string(a) else '',
+    'translate': _translate,
+    'true': lambda context: True,
+}
+
+
+class Step(object):
+
+    def __init__(self, axis, test, predicates):
+        self.axis = axis
+        self.test = test
+        self.predicates = predicates
+
+    def matches(self, node):
+        test = self.test
+        if test == 'node()':
+            return True
+        if test == 'text()':
+            return isinstance(node, Text)
+        if self.axis == 'attribute':
+            return test == '*' or node.name == test
+        if not isinstance(node, Element) or node.tag == '#document':
+            return False
+        return test == '*' or node.tag == test
+
+    def select(self, node):
+        nodes = [candidate for candidate in axis_nodes(self.axis, node)
+                 if self.matches(candidate)]
+        for predicate in self.predicates:
+            nodes = filter_nodes(nodes, predicate)
+        return nodes
+
+
+def axis_nodes(axis, node):
+    if axis == 'child':
+        return node.children if isinstance(node, Element) else []
+    if axis == 'descendant':
+        if not isinstance(node, Element):
+            return []
+        nodes = node.iter_nodes()
+        next(nodes)
+        return nodes
+    if axis == 'descendant-or-self':
+        return node.iter_nodes() if isinstance(node, Element) else [node]
+    if axis == 'self':
+        return [node]
+    if axis == 'parent':
+        return [node.parent] if node.parent is not None else []
+    if axis == 'attribute':
+        if not isinstance(node, Element):
+            return []
+        return [Attribute(node, name, value)
+                for name, value in node.attributes.items()]
+    if axis in ('ancestor', 'ancestor-or-self'):
+        nodes = [node] if axis == 'ancestor-or-self' else []
+        parent = node.parent
+        while parent is not None:
+            nodes.append(parent)
+            parent = parent.parent
+        return nodes
+    siblings = node.parent.children if node.parent is not None else [node]
+    index = siblings.index(node)
+    if axis == 'following-sibling':
+        return siblings[index + 1:]
+    return siblings[:index][::-1]
+
+
+def filter_nodes(nodes, predicate):
+    size = len(nodes)
+    result = []
+    for position, node in enumerate(nodes, start=1):
+        value = predicate.evaluate(Context(node, position, size))
+        if isinstance(value, float):
+            if value == position:
+                result.append(node)
+        elif boolean(value):
+            result.append(node)
+    return result
+
+
+def document_order(nodes):
+    unique = dict((id(node), node) for node in nodes)
+    return sorted(unique.values(), key=lambda node: node.order)
+
+
+class Path(Expression):
+
+    def __init__(self, start, steps):
+        self.start = start
+        self.steps = self._optimize(steps)
+
+    def _optimize(self, steps):
+        # '//name' is 'descendant-or-self::node()/child::name', which is the
+        # same as 'descendant::name' unless predicates depend on position.
+        optimized = []
+        for step in steps:
+            previous = optimized[-1] if optimized else None
+            if (previous and previous.axis == 'descendant-or-self'
+                    and previous.test == 'node()' and not previous.predicates
+                    and step.axis == 'child'
+                    and not any(p.positional for p in step.predicates)):
+                optimized[-1] = Step('descendant', step.test, step.predicates)
+            else:
+                optimized.append(step)
+        return optimized
+
+    def evaluate(self, context):
+        if self.start == '/':
+            nodes = [context.node.document]
+        elif self.start is None:
+            nodes = [context.node]
+        else:
+            nodes = self.start.evaluate(context)
+            if not isinstance(nodes, list):
+                raise XPathError('Path requires a node-set.')
+        for step in self.steps:
+            selected = []
+            for node in nodes:
+                selected.extend(step.select(node))
+            nodes = document_order(selected) if len(nodes) > 1 else selected
+            if step.axis in ('ancestor', 'ancestor-or-self',
+                             'preceding-sibling'):
+                nodes = document_order(nodes)
+        return nodes
+
+
+class Filter(Expression):
+
+    def __init__(self, expression, predicates):
+        self.expression = expression
+        self.predicates = predicates
+        self.positional = expression.positional
+
+    def evaluate(self, context):
+        nodes = self.expression.evaluate(context)
+        if not isinstance(nodes, list):
+            raise XPathError('Predicates require a node-set.')
+        for predicate in self.predicates:
+            nodes = filter_nodes(nodes, predicate)
+        return nodes
+
+
+# Parser
+
+class Parser(object):
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.tokens = tokenize(expression)
+        self.index = 0
+
+    def parse(self):
+        result = self.parse_or()
+        if self.peek() is not None:
+            self.error()
+        return result
+
+    def error(self):
+        raise XPathError("Invalid expression '%s'." % self.expression)
+
+    def peek(self, offset=0):
+        index = self.index + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def next(self):
+        token = self.peek()
+        if token is None:
+            self.error()
+        self.index += 1
+        return token
+
+    def accept(self, *values):
+        token = self.peek()
+        if token and token[0] in ('operator', 'name') and token[1] in values:
+            self.index += 1
+            return token[1]
+        return None
+
+    def expect(self, value):
+        if not self.accept(value):
+            self.error()
+
+    def parse_or(self):
+        left = self.parse_and()
+        while self.accept('or'):
+            left = Operation('or', left, self.parse_and())
+        return left
+
+    def parse_and(self):
+        left = self.parse_equality()
+        while self.accept('and'):
+            left = Operation('and', left, self.parse_equality())
+        return left
+
+    def parse_equality(self):
+        left = self.parse_relational()
+        operator = self.accept('=', '!=')
+        while operator:
+            left = Operation(operator, left, self.parse_relational())
+            operator = self.accept('=', '!=')
+        return left
+
+    def parse_relational(self):
+        left = self.parse_additive()
+        operator = self.accept('<', '<=', '>', '>=')
+        while operator:
+            left = Operation(operator, left, self.parse_additive())
+            operator = self.accept('<', '<=', '>', '>=')
+        return left
+
+    def parse_additive(self):
+        left = self.parse_union()
+        operator = self.accept('+', '-')
+        while operator:
+            left = Operation(operator, left, self.parse_union())
+            operator = self.accept('+', '-')
+        return left
+
+    def parse_union(self):
+        left = self.parse_path()
+        while self.accept('|'):
+            left = Operation('|', left, self.parse_path())
+        return left
+
+    def parse_path(self):
+        token = self.peek()
+        if token is None:
+            self.error()
+        kind, value = token
+        if kind in ('literal', 'number'):
+            self.next()
+            return Literal(value)
+        if kind == 'operator' and value == '(' or self._is_function_call():
+            primary = self.parse_primary()
+            predicates = self.parse_predicates()
+            expression = Filter(primary, predicates) if predicates else primary
+            if self.peek() in (('operator', '/'), ('operator', '//')):
+                return Path(expression, self.parse_relative_path())
+            return expression
+        if self.accept('/'):
+            if self._starts_step():
+                return Path('/', self.parse_relative_path(first=True))
+            return Path('/', [])
+        if self.peek() == ('operator', '//'):
+            return Path('/', self.parse_relative_path())
+        return Path(None, self.parse_relative_path(first=True))
+
+    def _is_function_call(self):
+        token, following = self.peek(), self.peek(1)
+        return (token[0] == 'name' and following == ('operator', '(')
+                and token[1] not in ('text', 'node'))
+
+    def _starts_step(self):
+        token = self.peek()
+        return token is not None and (
+            token[0] == 'name' or token[1] in ('.', '..', '@', '*'))
+
+    def parse_primary(self):
+        if self.accept('('):
+            expression = self.parse_or()
+            self.expect(')')
+            return expression
+        name = self.next()[1]
+        self.expect('(')
+        arguments = []
+        if not self.accept(')'):
+            arguments.append(self.parse_or())
+            while self.accept(','):
+                arguments.append(self.parse_or())
+            self.expect(')')
+        return Function(name, arguments)
+
+    def parse_relative_path(self, first=False):
+        steps = []
+        if first:
+            steps.append(self.parse_step())
+        while True:
+            if self.accept('//'):
+                steps.append(Step('descendant-or-self', 'node()', []))
+            elif not self.accept('/'):
+                return steps
+            steps.append(self.parse_step())
+
+    def parse_step(self):
+        if self.accept('.'):
+            return Step('self', 'node()', [])
+        if self.accept('..'):
+            return Step('parent', 'node()', [])
+        axis = 'child'
+        if self.accept('@'):
+            axis = 'attribute'
+        elif (self.peek() and self.peek()[0] == 'name'
+              and self.peek(1) == ('operator', '::')):
+            axis = self.next()[1]
+            if axis not in AXES:
+                raise XPathError("Unsupported axis '%s'." % axis)
+            self.next()
+        kind, value = self.next()
+        if kind == 'operator' and value == '*':
+            test = '*'
+        elif kind == 'name':
+            test = value.lower()
+            if value in ('text', 'node') and self.accept('('):
+                self.expect(')')
+                test = value + '()'
+        else:
+            self.error()
+        return Step(axis, test, self.parse_predicates())
+
+    def parse_predicates(self):
+        predicates = []
+        while self.accept('['):
+            predicates.append(self.parse_or())
+            self.expect(']')
+        return predicates
+
+
+_cache = {}
+
+
+def compile(expression):
+    if expression not in _cache:
+        _cache[expression] = Parser(expression).parse()
+    return _cache[expression]
+
+
+def select(scope, expression):
+    """Evaluates ``expression`` with ``scope`` as the context node."""
+    result = compile(expression).evaluate(Context(scope))
+    if not isinstance(result, list):
+        raise XPathError("Expression '%s' does not select nodes." % expression)
+    return result
@@ -0,0 +1,157 @@
+"""Generated large pages for stress testing and benchmarks.
+
+Pages are served by the test server under ``/stress/``. Sizes can be
+changed with query parameters, for example ``/stress/table?rows=500``.
+
+- ``/stress/table?rows=10000&columns=5``: Table with ``id=large``.
+  Cells contain ``R<row>C<column>``.
+- ``/stress/select?options=5000``: Select list with ``id=large``. Options
+  have labels ``Option <n>`` and values ``<n>``.
+- ``/stress/iframes?depth=10``: Nested iframes. The innermost frame
+  contains ``id=deepest`` with text ``Deepest frame``.
+- ``/stress/dom?nodes=100000``: Nested ``div`` structure with about the
+  given number of elements. The last leaf has ``id=last`` and text
+  ``Last node``.
+- ``/stress/list?items=100000&visible=50``: Virtualized list with
+  ``id=large`` rendering only ``visible`` items at a time.
+"""
+
+try:
+    from urlparse import parse_qs
+except ImportError:  # Python 3
+    from urllib.parse import parse_qs
+
+
+PAGE = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="UTF-8">
+<title>%(title)s</title>
+</head>
+<body>
+%(body)s
+</body>
+</html>
+'''
+
+
+def _page(title, body):
+    return PAGE % {'title': title, 'body': body}
+
+
+def table(rows=10000, columns=5):
+    parts = ['<table id="large" border="1"><thead><tr>']
+    parts.extend('<th>Header %d</th>' % column
+                 for column in range(1, columns + 1))
+    parts.append('</tr></thead><tbody>')
+    for row in range(1, rows + 1):
+        parts.append('<tr>')
+        parts.extend('<td>R%dC%d</td>' % (row, column)
+                     for column in range(1, columns + 1))
+        parts.append('</tr>\n')
+    parts.append('</tbody></table>')
+    return _page('Table with %d rows' % rows, ''.join(parts))
+
+
+def select(options=5000):
+    parts = ['<select id="large" name="large">']
+    parts.extend('<option value="%d">Option %d</option>\n' % (index, index)
+                 for index in range(1, options + 1))
+    parts.append('</select>')
+    return _page('Select with %d options' % options, ''.join(parts))
+
+
+def iframes(depth=10):
+    if depth <= 0:
+        return _page('Deepest frame', '<p id="deepest">Deepest frame</p>')
+    body = ('<p>Frame depth %d</p>'
+            '<iframe id="frame" src="/stress/iframes?depth=%d"></iframe>'
+            % (depth, depth - 1))
+    return _page('Frames %d' % depth, body)
+
+
+def dom(nodes=100000, children=10):
+    # Breadth-first tree of divs, so the depth grows logarithmically.
+    counts = [1]
+    while sum(counts) < nodes:
+        counts.append(counts[-1] * children)
+    counts[-1] -= sum(counts) - nodes
+    parts = []
+    remaining = list(counts)
+
+    def render(level):
+        remaining[level] -= 1
+        if level + 1 == len(remaining) or remaining[level + 1] <= 0:
+            is_last = not any(remaining)
+            attributes = ' id="last"' if is_last else ''
+            text = 'Last node' if is_last else 'Node %d' % len(parts)
+            parts.append('<span class="leaf"%s>%s</span>' % (attributes, text))
+            return
+        parts.append('<div class="level-%d">' % level)
+        for _ in range(children):
+            if remaining[level + 1] <= 0:
+                break
+            render(level + 1)
+        parts.append('</div>')
+
+    render(0)
+    return _page('DOM with %d nodes' % nodes, ''.join(parts))
+
+
+VIRTUAL_LIST_SCRIPT = '''
+<script>
+(function () {
+  var list = document.getElementById('large');
+  var items = parseInt(list.getAttribute('data-items'));
+  var visible = parseInt(list.getAttribute('data-visible'));
+  list.addEventListener('scroll', function () {
+    var first = Math.min(Math.floor(list.scrollTop / 20), items - visible);
+    var html = '';
+    for (var i = first; i < first + visible; i++) {
+      html += '<li style="height: 20px">Item ' + (i + 1) + '</li>';
+    }
+    list.firstElementChild.style.paddingTop = (first * 20) + 'px';
+    list.firstElementChild.innerHTML = html;
+  });
+})();
+</script>
+'''
+
+
+def virtual_list(items=100000, visible=50):
+    parts = ['<div id="large" data-items="%d" data-visible="%d" '
+             'style="height: 400px; overflow-y: scroll">'
+             '<ul style="height: %dpx; margin: 0">' % (items, visible,
+                                                       items * 20)]
+    parts.extend('<li style="height: 20px">Item %d</li>' % index
+                 for index in range(1, min(items, visible) + 1))
+    parts.append('</ul></div>')
+    parts.append(VIRTUAL_LIST_SCRIPT)
+    return _page('Virtualized list with %d items' % items, ''.join(parts))
+
+
+PAGES = {
+    'table': (table, ('rows', 'columns')),
+    'select': (select, ('options',)),
+    'iframes': (iframes, ('depth',)),
+    'dom': (dom, ('nodes',)),
+    'list': (virtual_list, ('items', 'visible')),
+}
+
+
+def generate(path):
+    """Returns the HTML for ``path`` or ``None`` if it is not a stress page.
+
+    ``path`` is the request path, like ``/stress/table?rows=100``.
+    """
+    path, _, query = path.partition('?')
+    if not path.startswith('/stress/'):
+        return None
+    name = path[len('/stress/'):].strip('/')
+    if name not in PAGES:
+        return None
+    function, arguments = PAGES[name]
+    parameters = parse_qs(query)
+    kwargs = dict((argument, int(parameters[argument][0]))
+                  for argument in arguments if argument in parameters)
+    return function(**kwargs)
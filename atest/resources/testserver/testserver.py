@@ -5,6 +5,7 @@ from __future__ import print_function
 
 import os
 import sys
+import threading
 try:
     from httplib import HTTPConnection
     from BaseHTTPServer import HTTPServer
@@ -15,6 +16,8 @@ except ImportError:  # Python 3
     from http.server import SimpleHTTPRequestHandler, HTTPServer
     from socketserver import ThreadingMixIn
 
+from stresspages import generate as generate_stress_page
+
 
 class StoppableHttpRequestHandler(SimpleHTTPRequestHandler):
     """http request handler with QUIT stopping the server"""
@@ -25,9 +28,31 @@ class StoppableHttpRequestHandler(SimpleHTTPRequestHandler):
         self.server.shutdown()
         self.server.server_close()
 
+    def do_GET(self):
+        html = generate_stress_page(self.path)
+        if html is None:
+            return SimpleHTTPRequestHandler.do_GET(self)
+        data = html.encode('UTF-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=UTF-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
     def do_POST(self):
         self.do_GET()
 
+    def translate_path(self, path):
+        path = SimpleHTTPRequestHandler.translate_path(self, path)
+        root = getattr(self.server, 'root', None)
+        if root:
+            path = os.path.join(root, os.path.relpath(path, os.getcwd()))
+        return path
+
+    def log_message(self, format, *args):
+        if not getattr(self.server, 'quiet', False):
+            SimpleHTTPRequestHandler.log_message(self, format, *args)
+
 
 class ThreadingHttpServer(ThreadingMixIn, HTTPServer):
     pass
@@ -46,6 +71,21 @@ def start_server(path, port=7000):
     server.serve_forever()
 
 
+def start_server_in_thread(path, port=0):
+    """Starts the server in a background thread without changing directory.
+
+    Returns the server. Its port is ``server.server_address[1]`` and it can
+    be stopped with ``server.shutdown()``.
+    """
+    server = ThreadingHttpServer(('127.0.0.1', port), StoppableHttpRequestHandler)
+    server.root = path
+    server.quiet = True
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
 if __name__ == '__main__':
     if len(sys.argv) != 2 or sys.argv[1] not in ['start', 'stop']:
         print('usage: %s start|stop' % sys.argv[0])
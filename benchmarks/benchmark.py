@@ -0,0 +1,114 @@
+"""Benchmark harness measuring SeleniumLibrary keyword overhead.
+
+Keywords are executed against the fake WebDriver server from
+``atest/resources/fakewebdriver``. Because the server has no latency by
+default, the measured time is dominated by the library and Selenium
+client overhead and the number of WebDriver commands sent per call.
+The fastest of the repeated calls is reported, because it is the least
+affected by noise from other processes.
+"""
+
+import os
+import platform
+import sys
+import time
+from os.path import abspath, dirname, join
+
+CURDIR = dirname(abspath(__file__))
+RESOURCES = join(CURDIR, os.pardir, 'atest', 'resources')
+
+
+class Benchmark(object):
+
+    def __init__(self, name, page, function, group, repeat=None):
+        self.name = name
+        self.page = page
+        self.function = function
+        self.group = group
+        self.repeat = repeat
+
+    def run(self, library, server, repeat, root_url):
+        if self.page:
+            library.go_to(page_url(root_url, self.page))
+        if not self.repeat:
+            self.function(library)
+        times = []
+        commands = None
+        for _ in range(self.repeat or repeat):
+            server.reset_commands()
+            start = time.time()
+            elapsed = self.function(library)
+            times.append(elapsed if elapsed is not None
+                         else time.time() - start)
+            commands = len(server.commands)
+        return {'commands': commands, 'time': round(min(times), 6)}
+
+
+BENCHMARKS = []
+
+
+def benchmark(page=None, group=None, repeat=None):
+    """Registers the decorated function as a benchmark.
+
+    The function gets a `SeleniumLibrary` instance as an argument. ``page``
+    is a path served by the acceptance test server, such as
+    ``html/links.html`` or ``stress/table?rows=1000``, and it is opened
+    before the benchmark is run. ``repeat`` overrides how many times slow
+    benchmarks are run and also disables the warm-up run. If the function
+    returns a number, it is used as the measured time in seconds instead
+    of the time the call took.
+    """
+    def decorator(function):
+        BENCHMARKS.append(Benchmark(function.__name__, page, function,
+                                    group or function.__module__, repeat))
+        return function
+    return decorator
+
+
+def page_url(root_url, page):
+    return '%s/%s' % (root_url.rstrip('/'), page.lstrip('/'))
+
+
+def environment():
+    import robot
+    import selenium
+    return {'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'robotframework': robot.__version__,
+            'selenium': selenium.__version__,
+            'platform': sys.platform}
+
+
+def compare(results, baseline):
+    """Returns regressions of ``results`` compared to ``baseline``.
+
+    Only an increase in the number of WebDriver commands is a regression.
+    Times depend on the machine running the benchmarks and are reported
+    separately by `compare_times`.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name in baseline and result['commands'] > baseline[name]['commands']:
+            regressions.append('%s: %d WebDriver commands, baseline %d.'
+                               % (name, result['commands'],
+                                  baseline[name]['commands']))
+    return regressions
+
+
+def compare_times(results, baseline, time_tolerance=50.0, min_time=0.0005):
+    """Returns benchmarks that are slower than in ``baseline``.
+
+    Time has grown when it is more than ``time_tolerance`` percent and more
+    than ``min_time`` seconds longer than in the baseline. These are only
+    informational, because the baseline may be from a different machine.
+    """
+    slower = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        expected = baseline[name]['time']
+        limit = expected * (1 + time_tolerance / 100)
+        if result['time'] > limit and result['time'] - expected > min_time:
+            slower.append('%s: %.2f ms, baseline %.2f ms.'
+                          % (name, result['time'] * 1000, expected * 1000))
+    return slower
@@ -0,0 +1,193 @@
+"""Benchmarks for individual keywords and internal hot paths."""
+
+from SeleniumLibrary import SeleniumLibrary
+
+from benchmark import benchmark
+
+
+# Element finder per locator strategy.
+
+@benchmark('html/links.html')
+def find_by_identifier(lib):
+    lib.find_element('some_id')
+
+
+@benchmark('html/links.html')
+def find_by_id(lib):
+    lib.find_element('id:some_id')
+
+
+@benchmark('html/forms/prefilled_email_form.html')
+def find_by_name(lib):
+    lib.find_element('name:email')
+
+
+@benchmark('html/links.html')
+def find_by_xpath(lib):
+    lib.find_element('//a[@id="some_id"]')
+
+
+@benchmark('html/links.html')
+def find_by_css(lib):
+    lib.find_element('css:a#some_id')
+
+
+@benchmark('html/links.html')
+def find_by_link(lib):
+    lib.find_element('link:Link with id')
+
+
+@benchmark('html/links.html')
+def find_by_partial_link(lib):
+    lib.find_element('partial link:with id')
+
+
+@benchmark('html/links.html')
+def find_by_tag(lib):
+    lib.find_elements('tag:a')
+
+
+@benchmark('html/links.html')
+def find_by_default_with_tag(lib):
+    lib._element_finder.find('Link with id', tag='link')
+
+
+@benchmark('html/links.html')
+def find_by_identifier_with_tag(lib):
+    lib._element_finder.find('id:some_id', tag='link')
+
+
+@benchmark('html/forms/prefilled_email_form.html')
+def find_by_identifier_with_input_tag(lib):
+    lib._element_finder.find('email', tag='text field')
+
+
+# Element keywords.
+
+@benchmark('html/links.html')
+def page_should_contain(lib):
+    lib.page_should_contain('Link with id')
+
+
+@benchmark('html/links.html')
+def page_should_contain_element(lib):
+    lib.page_should_contain_element('id:some_id')
+
+
+@benchmark('html/links.html')
+def get_text(lib):
+    lib.get_text('id:some_id')
+
+
+@benchmark('html/links.html')
+def get_element_attribute(lib):
+    lib.get_element_attribute('id:some_id', 'href')
+
+
+@benchmark('html/links.html')
+def element_should_be_visible(lib):
+    lib.element_should_be_visible('id:some_id')
+
+
+@benchmark('html/links.html')
+def get_element_count(lib):
+    lib.get_element_count('tag:a')
+
+
+@benchmark('html/forms/prefilled_email_form.html')
+def input_text(lib):
+    lib.input_text('name:email', 'robot@example.com')
+
+
+@benchmark('html/forms/prefilled_email_form.html')
+def click_element(lib):
+    lib.click_element('name:can_send_email')
+
+
+# Wait keywords, when the condition is already true.
+
+@benchmark('html/links.html')
+def wait_until_page_contains(lib):
+    lib.wait_until_page_contains('Link with id')
+
+
+@benchmark('html/links.html')
+def wait_until_page_contains_element(lib):
+    lib.wait_until_page_contains_element('id:some_id')
+
+
+@benchmark('html/links.html')
+def wait_until_element_is_visible(lib):
+    lib.wait_until_element_is_visible('id:some_id')
+
+
+@benchmark('html/forms/prefilled_email_form.html')
+def wait_until_element_is_enabled(lib):
+    lib.wait_until_element_is_enabled('name:email')
+
+
+# Table keywords.
+
+@benchmark('html/tables/tables.html')
+def get_table_cell(lib):
+    lib.get_table_cell('simpleTable', 3, 2)
+
+
+@benchmark('html/tables/tables.html')
+def table_should_contain(lib):
+    lib.table_should_contain('simpleTable', 'simpleTable_C2')
+
+
+@benchmark('html/tables/tables.html')
+def table_column_should_contain(lib):
+    lib.table_column_should_contain('simpleTable', 3, 'simpleTable_C2')
+
+
+@benchmark('html/tables/tables.html')
+def table_row_should_contain(lib):
+    lib.table_row_should_contain('simpleTable', 2, 'simpleTable_C2')
+
+
+# Select list keywords.
+
+@benchmark('html/forms/prefilled_email_form.html')
+def get_list_items(lib):
+    lib.get_list_items('preferred_channel')
+
+
+@benchmark('html/forms/prefilled_email_form.html')
+def get_selected_list_label(lib):
+    lib.get_selected_list_label('preferred_channel')
+
+
+@benchmark('html/forms/prefilled_email_form.html')
+def select_from_list_by_label(lib):
+    lib.select_from_list_by_label('preferred_channel', 'Direct mail')
+
+
+@benchmark('html/forms/prefilled_email_form.html')
+def list_selection_should_be(lib):
+    lib.list_selection_should_be('possible_channels', 'Email', 'Telephone')
+
+
+# Library import and keyword dispatch.
+
+@benchmark()
+def import_library(lib):
+    SeleniumLibrary()
+
+
+@benchmark()
+def run_keyword_without_commands(lib):
+    lib.run_keyword('get_selenium_speed', [], {})
+
+
+@benchmark()
+def run_keyword_with_one_command(lib):
+    lib.run_keyword('get_location', [], {})
+
+
+@benchmark()
+def get_keyword_arguments(lib):
+    for name in lib.get_keyword_names():
+        lib.get_keyword_arguments(name)
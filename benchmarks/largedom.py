@@ -0,0 +1,103 @@
+"""Benchmarks using large generated pages.
+
+Pages are generated by ``atest/resources/testserver/stresspages.py``. These
+benchmarks reveal keywords whose WebDriver commands grow with the page
+size. They are slow and therefore run only a few times without warm-up.
+Depending on the keyword, table rows are counted from the header row or
+from the first body row.
+"""
+
+from benchmark import benchmark
+
+
+@benchmark('stress/table?rows=10000', repeat=3)
+def large_table_get_table_cell(lib):
+    lib.get_table_cell('large', 5000, 3)
+
+
+@benchmark('stress/table?rows=10000', repeat=3)
+def large_table_should_contain(lib):
+    lib.table_should_contain('large', 'R10000C5')
+
+
+@benchmark('stress/table?rows=10000', repeat=1)
+def large_table_column_should_contain(lib):
+    lib.table_column_should_contain('large', 5, 'R10000C5')
+
+
+@benchmark('stress/table?rows=10000', repeat=3)
+def large_table_row_should_contain(lib):
+    lib.table_row_should_contain('large', -1, 'R10000C5')
+
+
+@benchmark('stress/table?rows=10000', repeat=3)
+def large_table_cell_should_contain(lib):
+    lib.table_cell_should_contain('large', 10001, 5, 'R10000C5')
+
+
+@benchmark('stress/select?options=5000', repeat=3)
+def large_select_get_list_items(lib):
+    lib.get_list_items('large')
+
+
+@benchmark('stress/select?options=5000', repeat=3)
+def large_select_get_selected_list_label(lib):
+    lib.get_selected_list_label('large')
+
+
+@benchmark('stress/select?options=5000', repeat=3)
+def large_select_from_list_by_label(lib):
+    lib.select_from_list_by_label('large', 'Option 5000')
+
+
+@benchmark('stress/select?options=5000', repeat=3)
+def large_select_from_list_by_value(lib):
+    lib.select_from_list_by_value('large', '5000')
+
+
+@benchmark('stress/iframes?depth=10', repeat=3)
+def nested_iframes_select_deepest(lib):
+    for _ in range(10):
+        lib.select_frame('frame')
+    lib.element_text_should_be('deepest', 'Deepest frame')
+    lib.unselect_frame()
+
+
+@benchmark('stress/iframes?depth=10', repeat=3)
+def nested_iframes_page_should_contain(lib):
+    lib.page_should_contain('Frame depth 9')
+
+
+@benchmark('stress/dom?nodes=100000', repeat=3)
+def large_dom_page_should_contain(lib):
+    lib.page_should_contain('Last node')
+
+
+@benchmark('stress/dom?nodes=100000', repeat=3)
+def large_dom_find_by_id(lib):
+    lib.find_element('id:last')
+
+
+@benchmark('stress/dom?nodes=100000', repeat=3)
+def large_dom_find_by_xpath(lib):
+    lib.find_element('//span[text()="Last node"]')
+
+
+@benchmark('stress/dom?nodes=100000', repeat=3)
+def large_dom_find_by_default(lib):
+    lib.find_element('last')
+
+
+@benchmark('stress/dom?nodes=100000', repeat=3)
+def large_dom_get_element_count(lib):
+    lib.get_element_count('css:div.level-1')
+
+
+@benchmark('stress/list?items=100000', repeat=3)
+def virtual_list_get_text(lib):
+    lib.element_text_should_be('css:#large li:first-child', 'Item 1')
+
+
+@benchmark('stress/list?items=100000', repeat=3)
+def virtual_list_get_element_count(lib):
+    lib.get_element_count('css:#large li')
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+
+"""Runs SeleniumLibrary keyword benchmarks and compares them to a baseline.
+
+Usage: python benchmarks/run.py [options] [pattern ...]
+
+Benchmarks are run against the fake WebDriver server, so no browser is
+needed. Results are written in JSON format and compared to the committed
+``baseline.json``. The exit code is non-zero if some benchmark sends more
+WebDriver commands than in the baseline. Benchmarks that are significantly
+slower than in the baseline are reported, but they do not affect the exit
+code, because times depend on the machine.
+"""
+
+from __future__ import print_function
+
+import argparse
+import fnmatch
+import json
+import os
+import sys
+from os.path import abspath, dirname, join
+
+CURDIR = dirname(abspath(__file__))
+SRC = join(CURDIR, os.pardir, 'src')
+sys.path.insert(0, SRC)
+sys.path.insert(0, join(CURDIR, os.pardir, 'atest', 'resources'))
+sys.path.insert(0, join(CURDIR, os.pardir, 'atest', 'resources', 'testserver'))
+
+from benchmark import (BENCHMARKS, compare, compare_times, environment,  # noqa
+                       page_url, RESOURCES)
+from fakewebdriver import FakeWebDriverServer  # noqa
+from SeleniumLibrary import SeleniumLibrary  # noqa
+from testserver import start_server_in_thread  # noqa
+
+import keywords  # noqa
+import largedom  # noqa
+import startup  # noqa
+
+BASELINE = join(CURDIR, 'baseline.json')
+RESULTS = join(CURDIR, 'results.json')
+
+
+def run_benchmarks(patterns, repeat, latency):
+    results = {}
+    http_server = start_server_in_thread(abspath(RESOURCES))
+    root_url = 'http://127.0.0.1:%d' % http_server.server_address[1]
+    with FakeWebDriverServer(latency=latency) as server:
+        library = SeleniumLibrary(run_on_failure='Nothing')
+        library.open_browser(page_url(root_url, 'html/index.html'), 'chrome',
+                             remote_url=server.url)
+        try:
+            for benchmark in BENCHMARKS:
+                if patterns and not any(fnmatch.fnmatch(benchmark.name, p)
+                                        for p in patterns):
+                    continue
+                result = benchmark.run(library, server, repeat, root_url)
+                results[benchmark.name] = result
+                print('%-45s %3d commands %9.3f ms'
+                      % (benchmark.name, result['commands'],
+                         result['time'] * 1000))
+        finally:
+            library.close_all_browsers()
+            http_server.shutdown()
+            http_server.server_close()
+    return results
+
+
+def write(path, results):
+    with open(path, 'w') as output:
+        json.dump({'environment': environment(), 'benchmarks': results},
+                  output, indent=2, sort_keys=True)
+        output.write('\n')
+
+
+def read(path):
+    with open(path) as baseline:
+        return json.load(baseline)['benchmarks']
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        description='Runs SeleniumLibrary keyword benchmarks.')
+    parser.add_argument('patterns', nargs='*', metavar='pattern',
+                        help='Run only benchmarks matching these glob '
+                             'patterns.')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='Times each benchmark is run. The fastest time '
+                             'is reported. Default is 20.')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Delay in seconds added to each WebDriver '
+                             'command. Default is 0.')
+    parser.add_argument('--output', default=RESULTS,
+                        help='Results file. Default is %(default)s.')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='Baseline file. Default is %(default)s.')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Write results to the baseline file instead of '
+                             'comparing them. When patterns are given, only '
+                             'matching benchmarks are updated.')
+    parser.add_argument('--time-tolerance', type=float, default=50.0,
+                        metavar='PERCENT',
+                        help='Slowdown compared to the baseline that is '
+                             'reported. Does not affect the exit code. '
+                             'Default is 50.')
+    options = parser.parse_args(arguments)
+    results = run_benchmarks(options.patterns, options.repeat,
+                             options.latency)
+    if options.update_baseline:
+        if options.patterns and os.path.exists(options.baseline):
+            results = dict(read(options.baseline), **results)
+        write(options.baseline, results)
+        print('Baseline: %s' % options.baseline)
+        return 0
+    write(options.output, results)
+    print('Results:  %s' % options.output)
+    if not os.path.exists(options.baseline):
+        return 0
+    baseline = read(options.baseline)
+    for slower in compare_times(results, baseline, options.time_tolerance):
+        print('SLOWER: %s' % slower)
+    regressions = compare(results, baseline)
+    for regression in regressions:
+        print('REGRESSION: %s' % regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Benchmarks measuring library import in a new Python process.
+
+Modules already imported by the benchmark runner do not affect these
+benchmarks, because each run starts a new interpreter. The imports of
+Robot Framework are done before the measurement starts.
+"""
+
+import os
+import subprocess
+import sys
+from os.path import abspath, join
+
+from benchmark import benchmark, CURDIR
+
+SOURCE = abspath(join(CURDIR, os.pardir, 'src'))
+MEASURE = '''
+import time
+import robot.api, robot.api.deco, robot.libraries.BuiltIn
+start = time.time()
+%s
+print(time.time() - start)
+'''
+
+
+def measure_import(statement):
+    environ = dict(os.environ)
+    environ['PYTHONPATH'] = os.pathsep.join(
+        [SOURCE] + [p for p in [environ.get('PYTHONPATH')] if p])
+    output = subprocess.check_output([sys.executable, '-c',
+                                      MEASURE % statement], env=environ)
+    return float(output.decode('ASCII').strip())
+
+
+@benchmark(group='startup', repeat=10)
+def import_seleniumlibrary(lib):
+    return measure_import('import SeleniumLibrary')
+
+
+@benchmark(group='startup', repeat=10)
+def import_and_create_library(lib):
+    return measure_import('from SeleniumLibrary import SeleniumLibrary\n'
+                          'SeleniumLibrary()')
+
+
+@benchmark(group='startup', repeat=10)
+def import_seleniumlibrary_with_webdriver(lib):
+    # Compare to import_seleniumlibrary to see what deferring saves.
+    return measure_import('import selenium.webdriver\n'
+                          'import SeleniumLibrary')
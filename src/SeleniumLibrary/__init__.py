@@ -22,30 +22,41 @@ from robot.errors import DataError
 from robot.libraries.BuiltIn import BuiltIn
 from robot.utils.importer import Importer
 
-from SeleniumLibrary.base import DynamicCore, LibraryComponent
+from SeleniumLibrary.base import (DynamicCore, LazyComponent, LibraryComponent,
+                                  LibraryCore)
 from SeleniumLibrary.errors import NoOpenBrowser, PluginError
 from SeleniumLibrary.keywords import (AlertKeywords,
                                       BrowserManagementKeywords,
+                                      BrowserPool,
+                                      CommandPipeline,
                                       CookieKeywords,
                                       ElementKeywords,
                                       FormElementKeywords,
                                       FrameKeywords,
                                       JavaScriptKeywords,
+                                      PerformanceKeywords,
+                                      RemoteConnectionPool,
                                       RunOnFailureKeywords,
+                                      RunOnFailurePolicy,
                                       ScreenshotKeywords,
                                       SelectElementKeywords,
+                                      SharedDriverServices,
+                                      SpeedMiddleware,
                                       TableElementKeywords,
                                       WaitingKeywords,
                                       WebDriverCache,
                                       WindowKeywords)
 from SeleniumLibrary.locators import ElementFinder
-from SeleniumLibrary.utils import LibraryListener, timestr_to_secs, is_truthy
+from SeleniumLibrary.utils import (CommandStatistics, KeywordListener,
+                                   LibraryListener, timestr_to_secs, is_noney,
+                                   is_string, is_truthy, ScreenshotWriter,
+                                   TimingRecorder, Tracer)
 
 
 __version__ = '4.1.0rc2.dev2'
 
 
-class SeleniumLibrary(DynamicCore):
+class SeleniumLibrary(LibraryCore):
     """SeleniumLibrary is a web testing library for Robot Framework.
 
     This document explains how to use keywords provided by SeleniumLibrary.
@@ -339,11 +350,37 @@ class SeleniumLibrary(DynamicCore):
     using the `Register Keyword To Run On Failure` keyword or with the
     ``run_on_failure`` argument when `importing` the library. It is
     possible to use any keyword from any imported library or resource file.
+    `Capture DOM Snapshot` is a faster alternative to screenshots that
+    saves the page HTML with computed styles for offline debugging.
 
     The run-on-failure functionality can be disabled by using a special value
     ``NOTHING`` or anything considered false (see `Boolean arguments`)
     such as ``NONE``.
 
+    When the library is imported with ``background_screenshots`` enabled,
+    `Capture Page Screenshot` run by the run-on-failure functionality only
+    fetches the screenshot from the browser and embeds its path to the log.
+    Decoding and writing the file is done in a background thread, and all
+    files are written before the execution ends. This speeds up suites
+    where keywords fail often, for example inside ``Wait Until Keyword
+    Succeeds``. Screenshots taken by calling the keyword directly are always
+    written before the keyword returns. Background screenshots are new in
+    SeleniumLibrary 4.1.
+
+    How often the run-on-failure keyword is run can be limited with the
+    ``run_on_failure_policy`` argument when `importing` the library. The
+    policy is given as comma separated ``name:value`` pairs:
+
+    | = Option =       | = Description = |
+    | max_per_test     | Maximum number of times the keyword is run in a test, or in a suite setup or teardown. |
+    | skip_unchanged   | When true, the keyword is not run if the URL and DOM of the page have not changed since the keyword was last run. Checking the page requires one JavaScript call. |
+    | skip_in_retry    | When true, the keyword is not run for failures inside ``Wait Until Keyword Succeeds``, ``Run Keyword And Return Status``, ``Run Keyword And Ignore Error``, ``Run Keyword And Expect Error`` and ``Run Keyword And Warn On Failure``. |
+
+    | =Settings= | =Value=         | =Value=                                          |
+    | Library    | SeleniumLibrary | run_on_failure_policy=max_per_test:3,skip_in_retry:True |
+
+    The run-on-failure policy is new in SeleniumLibrary 4.1.
+
     = Boolean arguments =
 
     Some keywords accept arguments that are handled as Boolean values true or
@@ -383,6 +420,158 @@ class SeleniumLibrary(DynamicCore):
 
     EventFiringWebDriver is new in SeleniumLibrary 4.0
 
+    = Browser pool =
+
+    Starting a browser is often the slowest part of a test. When the library
+    is imported with a positive ``browser_pool`` value, SeleniumLibrary
+    keeps that many browsers pre-launched in the background for each
+    `Open Browser` configuration it has seen. When `Open Browser` is later
+    called with the same ``browser``, ``remote_url``, ``desired_capabilities``,
+    ``ff_profile_dir``, ``options`` and ``service_log_path`` arguments, an
+    already running browser is taken into use immediately and a replacement
+    is launched in the background. Pre-launched browsers that are not used
+    are closed when the test execution ends.
+
+    Only browsers opened with arguments given as strings, or as dictionaries
+    containing strings, are pooled. Browsers opened with Python objects,
+    such as Selenium options objects, are always launched normally. Also
+    `Create Webdriver` does not use the pool.
+
+    | =Settings= | =Value=         | =Value=        |
+    | Library    | SeleniumLibrary | browser_pool=2 |
+
+    When the library is imported with a true ``reuse_browsers`` value,
+    `Close Browser` and `Close All Browsers` do not quit browsers opened
+    with `Open Browser`. Instead, extra windows are closed, cookies as well
+    as local and session storage of the current page are cleared, the
+    browser is navigated to ``about:blank`` and returned to the pool to be
+    used by the next `Open Browser` call with the same arguments. Notice
+    that cookies and storage of other sites visited earlier are not cleared.
+    Browsers that cannot be reset are quit normally.
+
+    | =Settings= | =Value=         | =Value=             |
+    | Library    | SeleniumLibrary | reuse_browsers=True |
+
+    Browser pool and reusing browsers are new in SeleniumLibrary 4.1.
+
+    = Shared driver service =
+
+    Normally each local Chrome and Firefox browser started with `Open Browser`
+    starts its own chromedriver or geckodriver process. When the library
+    is imported with a true ``shared_driver_service`` value, driver processes
+    are kept running and new browser sessions are created against them
+    using the WebDriver remote protocol. This avoids starting a new driver
+    process for each browser. Driver processes are checked to be running
+    before they are used and they are stopped when the test execution ends.
+
+    All Chrome browsers share one chromedriver process. geckodriver supports
+    only one session at a time and therefore a new geckodriver process is
+    started if all running ones are busy. Because driver processes are
+    shared, the ``service_log_path`` argument only affects the log file of
+    a new driver process. Browsers opened using ``remote_url`` and other
+    browsers are not affected.
+
+    | =Settings= | =Value=         | =Value=                    |
+    | Library    | SeleniumLibrary | shared_driver_service=True |
+
+    Shared driver service is new in SeleniumLibrary 4.1.
+
+    = Remote connection pool =
+
+    By default Selenium opens a new HTTP connection for each command sent
+    to a remote server such as Selenium Grid. Especially with HTTPS and
+    with proxies between the test execution and the server, connecting
+    can take a considerable part of the time spent in each command.
+
+    When the library is imported with ``remote_connection_pool``, browsers
+    opened using ``remote_url`` keep their connections open and share them
+    with other browsers using the same remote server. The value can be
+    ``True`` to use default settings or settings in the format
+    ``name:value,name:value``. Available settings are:
+
+    | = Setting =       | = Default = | = Description =                                     |
+    | pool_size         | 10          | Maximum number of open connections per server.      |
+    | connect_timeout   | None        | Timeout for opening a connection in Robot Framework time format. |
+    | timeout           | None        | Timeout for reading a response in Robot Framework time format.   |
+    | retries           | 3           | How many times failed connections are retried.      |
+
+    Commands that may already have been executed by the server are not
+    retried if the connection fails while reading the response.
+
+    | =Settings= | =Value=         | =Value=                                              |
+    | Library    | SeleniumLibrary | remote_connection_pool=True                          |
+    | Library    | SeleniumLibrary | remote_connection_pool=pool_size:4,timeout:2 minutes |
+
+    Remote connection pool requires Selenium 3.14 or newer. It is new in
+    SeleniumLibrary 4.1.
+
+    = Command statistics =
+
+    Many keywords send more than one command to the browser. For example,
+    keywords handling lists and tables may send a command for each item.
+    When the library is imported with a true ``command_statistics`` value,
+    WebDriver commands are attributed to the SeleniumLibrary keyword
+    executing them. The number of commands and the time spent in them is
+    logged on DEBUG level after each keyword.
+
+    In addition, a summary containing totals for each keyword is written
+    in JSON format to the output directory at the end of the execution.
+    The summary file is ``seleniumlibrary-commands.json`` by default and
+    it can be changed by giving the file name as the ``command_statistics``
+    value. Keywords in the summary are sorted by the number of commands.
+
+    | =Settings= | =Value=         | =Value=                                |
+    | Library    | SeleniumLibrary | command_statistics=True                |
+    | Library    | SeleniumLibrary | command_statistics=selenium-stats.json |
+
+    Command statistics are new in SeleniumLibrary 4.1.
+
+    = Tracing =
+
+    When the library is imported with ``trace``, the library records when
+    Robot Framework keywords, SeleniumLibrary keywords, element searches
+    and individual WebDriver commands start and end. At the end of the
+    execution, the recorded spans are written next to the output file,
+    and they can be opened as a flame graph to see where the time is spent.
+
+    | = Value =         | = File =                                  | = Viewer =                       |
+    | True or chrome    | ``seleniumlibrary-trace.json``            | [https://ui.perfetto.dev|Perfetto] or ``chrome://tracing`` |
+    | speedscope        | ``seleniumlibrary-trace.speedscope.json`` | [https://www.speedscope.app|Speedscope] |
+
+    Only keywords in suites where SeleniumLibrary is imported are traced.
+    Recording adds a small overhead to each keyword and command, and
+    tracing is meant to be used only when investigating performance.
+
+    | =Settings= | =Value=         | =Value=          |
+    | Library    | SeleniumLibrary | trace=speedscope |
+
+    Tracing is new in SeleniumLibrary 4.1.
+
+    = Timing database =
+
+    When the library is imported with ``timing_database``, the time spent
+    in each keyword and in finding elements with each locator is collected
+    during the execution. At the end of the execution, the statistics are
+    stored as a new run to the given [https://sqlite.org|SQLite] database.
+    Relative database paths are relative to the output directory and the
+    database is created if it does not exist.
+
+    | =Settings= | =Value=         | =Value=                           |
+    | Library    | SeleniumLibrary | timing_database=${CURDIR}/timings.db |
+
+    When the same database is used over many executions, for example in
+    a continuous integration system, the latest run can be compared with
+    a rolling baseline of the preceding runs. Runs are named after the
+    executed suite and only runs with the same name as the latest run
+    are used as the baseline. The comparison reports keywords and
+    locators whose mean time has grown significantly and exits with
+    a non-zero return code if there are any:
+
+    | python -m SeleniumLibrary.utils.timingdatabase timings.db --baseline 10
+
+    Use ``--help`` to see all available options. Timing database is new
+    in SeleniumLibrary 4.1.
+
     = Thread support =
 
     SeleniumLibrary is not thread-safe. This is mainly due because the underlying
@@ -402,11 +591,17 @@ class SeleniumLibrary(DynamicCore):
     """
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
     ROBOT_LIBRARY_VERSION = __version__
+    # (Library class, plugin classes) -> intro documentation.
+    _intro_documentation = {}
 
     def __init__(self, timeout=5.0, implicit_wait=0.0,
                  run_on_failure='Capture Page Screenshot',
                  screenshot_root_directory=None, plugins=None,
-                 event_firing_webdriver=None):
+                 event_firing_webdriver=None, browser_pool=0,
+                 reuse_browsers=False, shared_driver_service=False,
+                 remote_connection_pool=False, command_statistics=False,
+                 trace=False, timing_database=None,
+                 background_screenshots=False, run_on_failure_policy=None):
         """SeleniumLibrary can be imported with several optional arguments.
 
         - ``timeout``:
@@ -423,6 +618,35 @@ class SeleniumLibrary(DynamicCore):
         - ``event_firing_webdriver``:
           Class for wrapping Selenium with
           [https://seleniumhq.github.io/selenium/docs/api/py/webdriver_support/selenium.webdriver.support.event_firing_webdriver.html#module-selenium.webdriver.support.event_firing_webdriver|EventFiringWebDriver]
+        - ``browser_pool``:
+          Number of browsers to pre-launch in the background for each
+          `Open Browser` configuration. See `Browser pool` for details.
+        - ``reuse_browsers``:
+          When true, closed browsers are reset and reused by `Open Browser`
+          instead of quitting them. See `Browser pool` for details.
+        - ``shared_driver_service``:
+          When true, Chrome and Firefox browsers share one long-lived
+          driver service process. See `Shared driver service` for details.
+        - ``remote_connection_pool``:
+          Enables keep-alive connections shared by browsers opened using
+          ``remote_url``. See `Remote connection pool` for details.
+        - ``command_statistics``:
+          When true, WebDriver commands are counted per keyword. See
+          `Command statistics` for details.
+        - ``trace``:
+          Writes a trace of keywords, element searches and WebDriver commands
+          in ``chrome`` or ``speedscope`` format. See `Tracing` for details.
+        - ``timing_database``:
+          Path to an SQLite database where keyword and locator timings are
+          stored at the end of the execution. See `Timing database` for
+          details.
+        - ``background_screenshots``:
+          When true, run-on-failure screenshots are written to files in
+          a background thread. See `Run-on-failure functionality` for
+          details.
+        - ``run_on_failure_policy``:
+          Limits when the run-on-failure keyword is run. See
+          `Run-on-failure functionality` for details.
         """
         self.timeout = timestr_to_secs(timeout)
         self.implicit_wait = timestr_to_secs(implicit_wait)
@@ -430,25 +654,38 @@ class SeleniumLibrary(DynamicCore):
         self.run_on_failure_keyword \
             = RunOnFailureKeywords.resolve_keyword(run_on_failure)
         self._running_on_failure_keyword = False
+        listener = LibraryListener()
+        keyword_listener = KeywordListener()
+        self._run_on_failure_policy = RunOnFailurePolicy(run_on_failure_policy)
+        if self._run_on_failure_policy.enabled:
+            listener.register_scope_start(
+                self._run_on_failure_policy.start_scope)
+            keyword_listener.register_start(
+                self._run_on_failure_policy.start_keyword)
+            keyword_listener.register_end(
+                self._run_on_failure_policy.end_keyword)
+        else:
+            self._run_on_failure_policy = None
         self.screenshot_root_directory = screenshot_root_directory
         self._element_finder = ElementFinder(self)
         self._plugin_keywords = []
         libraries = [
-            AlertKeywords(self),
-            BrowserManagementKeywords(self),
-            CookieKeywords(self),
-            ElementKeywords(self),
-            FormElementKeywords(self),
-            FrameKeywords(self),
-            JavaScriptKeywords(self),
-            RunOnFailureKeywords(self),
-            ScreenshotKeywords(self),
-            SelectElementKeywords(self),
-            TableElementKeywords(self),
-            WaitingKeywords(self),
-            WindowKeywords(self)
+            LazyComponent(AlertKeywords, self),
+            LazyComponent(BrowserManagementKeywords, self),
+            LazyComponent(CookieKeywords, self),
+            LazyComponent(ElementKeywords, self),
+            LazyComponent(FormElementKeywords, self),
+            LazyComponent(FrameKeywords, self),
+            LazyComponent(JavaScriptKeywords, self),
+            LazyComponent(PerformanceKeywords, self),
+            LazyComponent(RunOnFailureKeywords, self),
+            LazyComponent(ScreenshotKeywords, self),
+            LazyComponent(SelectElementKeywords, self),
+            LazyComponent(TableElementKeywords, self),
+            LazyComponent(WaitingKeywords, self),
+            LazyComponent(WindowKeywords, self)
         ]
-        self.ROBOT_LIBRARY_LISTENER = LibraryListener()
+        self.ROBOT_LIBRARY_LISTENER = listener
         self._running_keyword = None
         self.event_firing_webdriver = None
         if is_truthy(event_firing_webdriver):
@@ -458,21 +695,78 @@ class SeleniumLibrary(DynamicCore):
             plugin_libs = self._parse_plugins(plugins)
             self._plugins = plugin_libs
             libraries = libraries + plugin_libs
-        self._drivers = WebDriverCache()
-        DynamicCore.__init__(self, libraries)
+        self._command_pipeline = CommandPipeline([SpeedMiddleware(self)])
+        self._command_statistics = None
+        if is_truthy(command_statistics):
+            self._command_statistics = CommandStatistics(command_statistics)
+            self._command_pipeline.register(self._command_statistics)
+            listener.register_close(self._command_statistics.write_summary)
+        self._tracer = None
+        if is_truthy(trace):
+            self._tracer = Tracer(trace)
+            self._command_pipeline.register(self._tracer)
+            self._element_finder.find = self._tracer.trace(
+                self._element_finder.find, 'element', self._get_find_span_name)
+            keyword_listener.register_start(self._tracer.start_keyword)
+            keyword_listener.register_end(self._tracer.end_keyword)
+            listener.register_close(self._tracer.write)
+        self._timing_recorder = None
+        if not is_noney(timing_database):
+            self._timing_recorder = TimingRecorder(timing_database)
+            self._element_finder.find = self._timing_recorder.trace(
+                self._element_finder.find)
+            keyword_listener.register_end(self._timing_recorder.end_keyword)
+            listener.register_close(self._timing_recorder.write)
+        self._browser_pool = BrowserPool(browser_pool, reuse_browsers)
+        self._drivers = WebDriverCache(self._browser_pool)
+        if self._browser_pool.enabled:
+            listener.register_close(self._browser_pool.close)
+        self._driver_services = None
+        if is_truthy(shared_driver_service):
+            self._driver_services = SharedDriverServices()
+            listener.register_close(self._driver_services.close)
+        self._screenshot_writer = None
+        if is_truthy(background_screenshots):
+            self._screenshot_writer = ScreenshotWriter()
+            listener.register_close(self._close_screenshot_writer)
+        self._remote_connection_pool = None
+        if is_truthy(remote_connection_pool):
+            self._remote_connection_pool \
+                = RemoteConnectionPool(remote_connection_pool)
+            listener.register_close(self._remote_connection_pool.close)
+        if keyword_listener.enabled:
+            self.ROBOT_LIBRARY_LISTENER = [listener, keyword_listener]
+        LibraryCore.__init__(self, libraries)
+
+    def _close_screenshot_writer(self):
+        self._screenshot_writer.close()
+        # Errors are otherwise reported when the next screenshot is taken.
+        for error in self._screenshot_writer.get_errors():
+            logger.warn(error)
 
     def run_keyword(self, name, args, kwargs):
         self._running_keyword = name
+        if self._command_statistics:
+            self._command_statistics.start_keyword(name)
+        if self._tracer:
+            self._tracer.begin(name, 'seleniumlibrary')
         try:
-            return DynamicCore.run_keyword(self, name, args, kwargs)
+            return LibraryCore.run_keyword(self, name, args, kwargs)
         except Exception:
             self.failure_occurred()
             raise
         finally:
             self._running_keyword = None
+            if self._tracer:
+                self._tracer.end(name, 'seleniumlibrary')
+            if self._command_statistics:
+                self._command_statistics.end_keyword()
+
+    def _get_find_span_name(self, locator, *args, **kwargs):
+        return locator if is_string(locator) else 'WebElement'
 
     def get_keyword_tags(self, name):
-        tags = list(DynamicCore.get_keyword_tags(self, name))
+        tags = list(LibraryCore.get_keyword_tags(self, name))
         if name in self._plugin_keywords:
             tags.append('plugin')
         return tags
@@ -480,7 +774,7 @@ class SeleniumLibrary(DynamicCore):
     def get_keyword_documentation(self, name):
         if name == '__intro__':
             return self._get_intro_documentation()
-        return DynamicCore.get_keyword_documentation(self, name)
+        return LibraryCore.get_keyword_documentation(self, name)
 
     def _parse_plugin_doc(self):
         Doc = namedtuple('Doc', 'doc, name')
@@ -489,7 +783,13 @@ class SeleniumLibrary(DynamicCore):
                       name=plugin.__class__.__name__)
 
     def _get_intro_documentation(self):
-        intro = DynamicCore.get_keyword_documentation(self, '__intro__')
+        key = (type(self), tuple(type(plugin) for plugin in self._plugins))
+        if key not in self._intro_documentation:
+            self._intro_documentation[key] = self._create_intro_documentation()
+        return self._intro_documentation[key]
+
+    def _create_intro_documentation(self):
+        intro = LibraryCore.get_keyword_documentation(self, '__intro__')
         for plugin_doc in self._parse_plugin_doc():
             intro += '\n\n'
             intro = intro + '= Plugin: %s =' % plugin_doc.name + '\n\n'
@@ -513,9 +813,35 @@ class SeleniumLibrary(DynamicCore):
         :type alias: str
         :return: The index of the `WebDriver` instance.
         :rtype: int
+
+        Commands sent by the ``driver`` are passed through the registered
+        command middleware, see `register_command_middleware`.
         """
+        self._command_pipeline.install(driver)
         return self._drivers.register(driver, alias)
 
+    def register_command_middleware(self, middleware):
+        """Adds ``middleware`` around commands sent by registered drivers.
+
+        :param middleware: Callable accepting ``driver``, ``command``,
+            ``params`` and ``execute`` arguments. It must call
+            ``execute(command, params)`` to send the command forward and
+            return the result.
+        :type middleware: callable
+
+        Middleware registered first is the outermost one. Middleware
+        applies also to browsers that are already open.
+        """
+        self._command_pipeline.register(middleware)
+
+    def unregister_command_middleware(self, middleware):
+        """Removes ``middleware`` added with `register_command_middleware`.
+
+        :param middleware: Previously registered middleware.
+        :type middleware: callable
+        """
+        self._command_pipeline.unregister(middleware)
+
     def failure_occurred(self):
         """Method that is executed when a SeleniumLibrary keyword fails.
 
@@ -525,6 +851,11 @@ class SeleniumLibrary(DynamicCore):
         """
         if self._running_on_failure_keyword or not self.run_on_failure_keyword:
             return
+        policy = self._run_on_failure_policy
+        if policy and not policy.should_run(self._drivers.current):
+            logger.debug("Keyword '%s' not run on failure because of the "
+                         "run-on-failure policy." % self.run_on_failure_keyword)
+            return
         try:
             self._running_on_failure_keyword = True
             BuiltIn().run_keyword(self.run_on_failure_keyword)
@@ -15,5 +15,7 @@
 # limitations under the License.
 
 from .context import ContextAware
+from .lazycomponent import LazyComponent
 from .librarycomponent import LibraryComponent
+from .librarycore import LibraryCore
 from .robotlibcore import DynamicCore, keyword
@@ -35,6 +35,26 @@ class ContextAware(object):
     def drivers(self):
         return self.ctx._drivers
 
+    @property
+    def browser_pool(self):
+        return self.ctx._browser_pool
+
+    @property
+    def command_pipeline(self):
+        return self.ctx._command_pipeline
+
+    @property
+    def driver_services(self):
+        return self.ctx._driver_services
+
+    @property
+    def remote_connection_pool(self):
+        return self.ctx._remote_connection_pool
+
+    @property
+    def screenshot_writer(self):
+        return self.ctx._screenshot_writer
+
     @property
     def element_finder(self):
         return self.ctx._element_finder
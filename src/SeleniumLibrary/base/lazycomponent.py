@@ -0,0 +1,68 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class LazyComponent(object):
+    """Library component created when one of its keywords is first used.
+
+    Keyword names, arguments, documentation and tags are got from the
+    component class, so listing keywords, for example with Libdoc, does
+    not create the component.
+    """
+
+    def __init__(self, component_class, *args, **kwargs):
+        self.component_class = component_class
+        self._args = args
+        self._kwargs = kwargs
+        self._instance = None
+
+    @property
+    def instance(self):
+        if self._instance is None:
+            self._instance = self.component_class(*self._args, **self._kwargs)
+        return self._instance
+
+
+class LazyKeyword(object):
+    __slots__ = ('component', 'name', '__func__')
+
+    def __init__(self, component, name, func):
+        self.component = component
+        self.name = name
+        self.__func__ = func
+
+    def resolve(self):
+        return getattr(self.component.instance, self.name)
+
+
+class KeywordDict(dict):
+    """Dictionary resolving keywords of lazy components when accessed."""
+
+    def __getitem__(self, name):
+        value = dict.__getitem__(self, name)
+        if isinstance(value, LazyKeyword):
+            value = value.resolve()
+            dict.__setitem__(self, name, value)
+        return value
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def values(self):
+        return [self[name] for name in self]
+
+    def items(self):
+        return [(name, self[name]) for name in self]
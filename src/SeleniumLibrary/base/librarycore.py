@@ -0,0 +1,162 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import inspect
+
+from .lazycomponent import KeywordDict, LazyComponent, LazyKeyword
+from .robotlibcore import DynamicCore
+
+
+class LibraryCore(DynamicCore):
+    """`DynamicCore` caching keyword information and supporting lazy components.
+
+    Keyword methods, argument specifications and documentation are cached
+    per class and function, and the caches are shared by all instances.
+    Only methods decorated as keywords are looked up from components,
+    because looking up all attributes of large components is slow.
+
+    Components wrapped in `LazyComponent` are created only when one of
+    their keywords is used. Keyword information is got from the component
+    class without creating the component.
+    """
+    # Class -> names of methods decorated as keywords. Shared by instances.
+    _keyword_methods = {}
+    # Class -> (keyword name, method name, function) tuples of lazy
+    # components. Shared by instances.
+    _keyword_table = {}
+    # (Function, is method) -> argument specification. Shared by instances.
+    _argument_specs = {}
+    # Function -> documentation. Shared by instances.
+    _documentation = {}
+
+    def __init__(self, library_components):
+        self.keywords = KeywordDict()
+        self.attributes = KeywordDict()
+        self._keyword_names = None
+        self.add_library_components(library_components)
+        self.add_library_components([self])
+
+    def add_library_components(self, library_components):
+        self._keyword_names = None
+        for component in library_components:
+            if isinstance(component, LazyComponent):
+                self._add_lazy_component(component)
+            else:
+                DynamicCore.add_library_components(self, [component])
+
+    def _add_lazy_component(self, component):
+        cls = component.component_class
+        if cls not in self._keyword_table:
+            self._keyword_table[cls] = self._get_keyword_table(cls)
+        for kw_name, name, func in self._keyword_table[cls]:
+            kw = LazyKeyword(component, name, func)
+            self.keywords[kw_name] = kw
+            self.attributes[name] = self.attributes[kw_name] = kw
+
+    def _get_keyword_table(self, cls):
+        table = []
+        for name in self._get_keyword_methods_from_class(cls):
+            func = getattr(cls, name)
+            func = getattr(func, '__func__', func)
+            table.append((func.robot_name or name, name, func))
+        return tuple(table)
+
+    def _get_members_from_instance(self, instance):
+        # Avoid calling properties by getting members from class, not instance.
+        # Only decorated methods are got from the class, but attributes
+        # set to the instance, including slots, are inspected as well.
+        cls = type(instance)
+        names = self._get_keyword_methods_from_class(cls)
+        for name in names:
+            yield name, getattr(cls, name)
+        for name in dir(instance):
+            if (name not in names and not hasattr(cls, name)
+                    and not self._is_lazy_keyword(name)):
+                yield name, getattr(instance, name)
+
+    def _is_lazy_keyword(self, name):
+        # Keywords are listed by dir() of the library itself and getting
+        # lazy ones would create their components.
+        return isinstance(dict.get(self.attributes, name), LazyKeyword)
+
+    def _get_keyword_methods_from_class(self, cls):
+        if cls not in self._keyword_methods:
+            self._keyword_methods[cls] = self._get_keyword_methods(cls)
+        return self._keyword_methods[cls]
+
+    def _get_keyword_methods(self, cls):
+        names = []
+        seen = set()  # Names defined in subclasses hide base class members.
+        for owner in inspect.getmro(cls):
+            for name, value in vars(owner).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                func = getattr(value, '__func__', value)
+                if callable(func) and hasattr(func, 'robot_name'):
+                    names.append(name)
+        return frozenset(names)
+
+    def get_keyword_names(self):
+        if self._keyword_names is None:
+            self._keyword_names = sorted(self.keywords)
+        return list(self._keyword_names)
+
+    def get_keyword_arguments(self, name):
+        kw = self._get_keyword(name)
+        key = (getattr(kw, '__func__', kw), self._is_method(kw))
+        if key not in self._argument_specs:
+            self._argument_specs[key] = self._get_keyword_arguments(*key)
+        return list(self._argument_specs[key])
+
+    def _get_keyword(self, name):
+        # Keywords of lazy components are not resolved, because that
+        # would create the component.
+        if name == '__init__':
+            return self.__init__
+        return dict.__getitem__(self.keywords, name)
+
+    def _is_method(self, kw):
+        return inspect.ismethod(kw) or isinstance(kw, LazyKeyword)
+
+    def _get_keyword_arguments(self, func, is_method):
+        args, defaults, varargs, kwargs = self._get_arg_spec(func)
+        if is_method:
+            args = args[1:]  # drop self, functions got from classes are unbound
+        args += ['{}={}'.format(name, value) for name, value in defaults]
+        if varargs:
+            args.append('*{}'.format(varargs))
+        if kwargs:
+            args.append('**{}'.format(kwargs))
+        return tuple(args)
+
+    def get_keyword_tags(self, name):
+        self._get_keyword_tags_supported = True
+        kw = self._get_keyword(name)
+        return getattr(kw, '__func__', kw).robot_tags
+
+    def get_keyword_documentation(self, name):
+        if name in ('__intro__', '__init__'):
+            return DynamicCore.get_keyword_documentation(self, name)
+        kw = self._get_keyword(name)
+        kw = getattr(kw, '__func__', kw)
+        if kw not in self._documentation:
+            self._documentation[kw] = inspect.getdoc(kw) or ''
+        doc = self._documentation[kw]
+        if kw.robot_tags and not self._get_keyword_tags_supported:
+            tags = 'Tags: {}'.format(', '.join(kw.robot_tags))
+            doc = '{}\n\n{}'.format(doc, tags) if doc else tags
+        return doc
@@ -21,11 +21,17 @@ from .element import ElementKeywords
 from .formelement import FormElementKeywords
 from .frames import FrameKeywords
 from .javascript import JavaScriptKeywords
-from .runonfailure import RunOnFailureKeywords
+from .performance import PerformanceKeywords
+from .runonfailure import RunOnFailureKeywords, RunOnFailurePolicy
 from .screenshot import ScreenshotKeywords
 from .selectelement import SelectElementKeywords
 from .tableelement import TableElementKeywords
 from .waiting import WaitingKeywords
+from .webdrivertools import BrowserPool
+from .webdrivertools import CommandPipeline
+from .webdrivertools import SpeedMiddleware
+from .webdrivertools import RemoteConnectionPool
+from .webdrivertools import SharedDriverServices
 from .webdrivertools import WebDriverCache
 from .webdrivertools import WebDriverCreator
 from .window import WindowKeywords
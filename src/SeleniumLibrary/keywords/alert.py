@@ -15,11 +15,12 @@
 # limitations under the License.
 
 from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 from SeleniumLibrary.base import keyword, LibraryComponent
-from SeleniumLibrary.utils import is_truthy, secs_to_timestr
+from SeleniumLibrary.utils import is_truthy, LazyImport, secs_to_timestr
+
+EC = LazyImport('selenium.webdriver.support.expected_conditions')
+WebDriverWait = LazyImport('selenium.webdriver.support.ui', 'WebDriverWait')
 
 
 class AlertKeywords(LibraryComponent):
@@ -14,21 +14,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import time
-import types
-
-from selenium import webdriver
-from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+import warnings
 
 from SeleniumLibrary.base import keyword, LibraryComponent
 from SeleniumLibrary.locators import WindowManager
-from SeleniumLibrary.utils import (is_truthy, is_noney, secs_to_timestr,
-                                   timestr_to_secs)
+from SeleniumLibrary.utils import (is_truthy, is_noney, is_string,
+                                   LazyImport, run_concurrently,
+                                   secs_to_timestr, timestr_to_secs)
 
 from .webdrivertools import WebDriverCreator
 
+webdriver = LazyImport('selenium.webdriver')
+EventFiringWebDriver = LazyImport(
+    'selenium.webdriver.support.event_firing_webdriver', 'EventFiringWebDriver')
+
 
 class BrowserManagementKeywords(LibraryComponent):
+    open_browsers_workers = 8
+    _browser_arguments = (('url', None), ('browser', 'firefox'),
+                          ('alias', None), ('remote_url', False),
+                          ('desired_capabilities', None),
+                          ('ff_profile_dir', None), ('options', None),
+                          ('service_log_path', None))
+    _browser_spec_fields = ('url', 'browser', 'alias', 'options')
 
     def __init__(self, ctx):
         LibraryComponent.__init__(self, ctx)
@@ -126,6 +134,9 @@ class BrowserManagementKeywords(LibraryComponent):
         in the same way as with ``options`` argument. Example: It is possible
         to use FirefoxProfile `set_preference` to define different
         profile settings.
+        Profiles given as a directory or as a string are prepared only once
+        and reused by later browsers as long as the profile directory
+        content does not change.
 
         Optional ``options`` argument allows defining browser specific
         Selenium options. Example for Chrome, the ``options`` argument
@@ -253,7 +264,8 @@ class BrowserManagementKeywords(LibraryComponent):
         and support defining FirefoxProfile with methods and
         attributes are new in SeleniumLibrary 4.0.
         
-        Making ``url`` optional is new in SeleniumLibrary 4.1.
+        Making ``url`` optional and caching prepared Firefox profiles are
+        new in SeleniumLibrary 4.1.
         """
         index = self.drivers.get_index(alias)
         if index:
@@ -269,11 +281,7 @@ class BrowserManagementKeywords(LibraryComponent):
     def _make_new_browser(self, url=None, browser='firefox', alias=None,
                           remote_url=False, desired_capabilities=None,
                           ff_profile_dir=None, options=None, service_log_path=None):
-        if is_truthy(remote_url):
-            self.info("Opening browser '%s' to base url '%s' through "
-                      "remote server at '%s'." % (browser, url, remote_url))
-        else:
-            self.info("Opening browser '%s' to base url '%s'." % (browser, url))
+        self._log_opening_browser(url, browser, remote_url)
         driver = self._make_driver(browser, desired_capabilities,
                                    ff_profile_dir, remote_url,
                                    options, service_log_path)
@@ -283,12 +291,132 @@ class BrowserManagementKeywords(LibraryComponent):
             try:
                 driver.get(url)
             except Exception:
-                self.debug("Opened browser with session id %s but failed "
-                        "to open url '%s'." % (driver.session_id, url))
+                self._log_url_failure(driver, url)
                 raise
         self.debug('Opened browser with session id %s.' % driver.session_id)
         return index
 
+    def _log_opening_browser(self, url, browser, remote_url):
+        if is_truthy(remote_url):
+            self.info("Opening browser '%s' to base url '%s' through "
+                      "remote server at '%s'." % (browser, url, remote_url))
+        else:
+            self.info("Opening browser '%s' to base url '%s'." % (browser, url))
+
+    def _log_url_failure(self, driver, url):
+        self.debug("Opened browser with session id %s but failed "
+                   "to open url '%s'." % (driver.session_id, url))
+
+    @keyword
+    def open_browsers(self, *browsers):
+        """Opens multiple browsers in parallel and returns their indices.
+
+        Each item in ``browsers`` specifies one browser either as a list
+        containing ``url``, ``browser``, ``alias`` and ``options``, in
+        that order, or as a dictionary containing any arguments accepted
+        by `Open Browser`. Values that are not given have the same defaults
+        as with `Open Browser`.
+
+        Browsers are started concurrently, which makes opening many
+        browsers, for example for multi-user tests, considerably faster
+        than using `Open Browser` multiple times. Browsers are nevertheless
+        registered in the given order and the returned indices are in
+        the same order as ``browsers``. The last browser is the active
+        browser after this keyword.
+
+        If a browser with the same ``alias`` is already open, a new browser
+        is not opened, but the existing browser is navigated to the
+        ``url`` and its index is returned. If any browser cannot be opened,
+        browsers started by this keyword are closed and the first error
+        is reported.
+
+        Examples:
+        | @{admin} =       | `Create List`       | http://example.com/admin | Chrome          | admin      |                                  |
+        | &{user} =        | `Create Dictionary` | url=http://example.com   | browser=Firefox | alias=user | options=add_argument("-headless") |
+        | @{indices} =     | `Open Browsers`     | ${admin}                 | ${user}         |            |                                  |
+        | `Switch Browser` | admin               |                          |                 |            |                                  |
+
+        New in SeleniumLibrary 4.1.
+        """
+        specs = [self._get_browser_spec(browser) for browser in browsers]
+        indices = [self.drivers.get_index(spec['alias']) for spec in specs]
+        new_specs = [spec for spec, index in zip(specs, indices) if not index]
+        for spec in new_specs:
+            self._log_opening_browser(spec['url'], spec['browser'],
+                                      spec['remote_url'])
+        drivers = self._make_drivers(new_specs)
+        new_indices = iter(self._register_drivers(drivers, new_specs))
+        indices = [index or next(new_indices) for index in indices]
+        self._open_urls(indices, specs)
+        if indices:
+            self.drivers.switch(indices[-1])
+        return indices
+
+    def _get_browser_spec(self, browser):
+        if isinstance(browser, dict):
+            spec = dict(browser)
+        elif is_string(browser) or len(browser) > len(self._browser_spec_fields):
+            raise ValueError("Browser must be specified as a dictionary or "
+                             "as a list of %s, got '%s'."
+                             % (', '.join(self._browser_spec_fields), browser))
+        else:
+            spec = dict(zip(self._browser_spec_fields, browser))
+        names = [name for name, _ in self._browser_arguments]
+        unexpected = [name for name in spec if name not in names]
+        if unexpected:
+            raise ValueError("Browser specification contains invalid "
+                             "argument%s: %s." % ('s' if len(unexpected) > 1 else '',
+                                                 ', '.join(sorted(unexpected))))
+        for name, default in self._browser_arguments:
+            if is_noney(spec.get(name)):
+                spec[name] = default
+        return spec
+
+    def _make_drivers(self, specs):
+        def make_driver(spec):
+            return self._make_driver(spec['browser'],
+                                     spec['desired_capabilities'],
+                                     spec['ff_profile_dir'], spec['remote_url'],
+                                     spec['options'], spec['service_log_path'])
+
+        results = run_concurrently(make_driver, specs,
+                                   self.open_browsers_workers)
+        errors = [error for _, error in results if error]
+        if errors:
+            for driver, _ in results:
+                if driver:
+                    self._quit_quietly(driver)
+            raise errors[0]
+        return [driver for driver, _ in results]
+
+    def _quit_quietly(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _register_drivers(self, drivers, specs):
+        indices = []
+        for driver, spec in zip(drivers, specs):
+            driver = self._wrap_event_firing_webdriver(driver)
+            indices.append(self.ctx.register_driver(driver, spec['alias']))
+            self.debug('Opened browser with session id %s.' % driver.session_id)
+        return indices
+
+    def _open_urls(self, indices, specs):
+        targets = [(self.drivers.get_connection(index), spec['url'])
+                   for index, spec in zip(indices, specs)
+                   if is_truthy(spec['url'])]
+        results = run_concurrently(lambda target: target[0].get(target[1]),
+                                   targets, self.open_browsers_workers)
+        errors = []
+        for (driver, url), (_, error) in zip(targets, results):
+            if error:
+                self._log_url_failure(driver, url)
+                errors.append(error)
+        if errors:
+            raise errors[0]
+
     @keyword
     def create_webdriver(self, driver_name, alias=None, kwargs={},
                          **init_kwargs):
@@ -583,8 +711,6 @@ class BrowserManagementKeywords(LibraryComponent):
         """
         old_speed = self.get_selenium_speed()
         self.ctx.speed = timestr_to_secs(value)
-        for driver in self.drivers.active_drivers:
-            self._monkey_patch_speed(driver)
         return old_speed
 
     @keyword
@@ -646,23 +772,38 @@ class BrowserManagementKeywords(LibraryComponent):
 
     def _make_driver(self, browser, desired_capabilities=None, profile_dir=None,
                      remote=None, options=None, service_log_path=None):
-        driver = WebDriverCreator(self.log_dir).create_driver(
-            browser=browser, desired_capabilities=desired_capabilities, remote_url=remote,
-            profile_dir=profile_dir, options=options, service_log_path=service_log_path)
+        def create_driver(message_logger=None):
+            # The pool calls this concurrently from its own threads and
+            # each call therefore gets its own creator.
+            creator = WebDriverCreator(self.log_dir, self.driver_services,
+                                       self.remote_connection_pool,
+                                       message_logger)
+            return creator.create_driver(
+                browser=browser, desired_capabilities=desired_capabilities,
+                remote_url=remote, profile_dir=profile_dir, options=options,
+                service_log_path=service_log_path)
+
+        signature = self.browser_pool.get_signature(
+            browser, desired_capabilities, profile_dir, remote, options,
+            service_log_path)
+        pooled = self.browser_pool.acquire(signature, create_driver)
+        if pooled:
+            self.debug('Using browser from the browser pool.')
+        driver = pooled or create_driver()
+        self.browser_pool.track(driver, signature)
         driver.set_script_timeout(self.ctx.timeout)
         driver.implicitly_wait(self.ctx.implicit_wait)
-        if self.ctx.speed:
-            self._monkey_patch_speed(driver)
         return driver
 
     def _monkey_patch_speed(self, driver):
-        def execute(self, driver_command, params=None):
-            result = self._base_execute(driver_command, params)
-            speed = self._speed if hasattr(self, '_speed') else 0.0
-            if speed > 0:
-                time.sleep(speed)
-            return result
-        if not hasattr(driver, '_base_execute'):
-            driver._base_execute = driver.execute
-            driver.execute = types.MethodType(execute, driver)
-        driver._speed = self.ctx.speed
+        """*DEPRECATED.* Selenium speed is applied by the command pipeline.
+
+        Drivers registered to the library use the command pipeline, which
+        waits the `Set Selenium Speed` delay, automatically. This method
+        is kept for libraries extending SeleniumLibrary and installs the
+        pipeline to ``driver``.
+        """
+        warnings.warn('_monkey_patch_speed is deprecated. Selenium speed is '
+                      'applied to registered drivers by the command pipeline.',
+                      DeprecationWarning)
+        self.command_pipeline.install(driver)
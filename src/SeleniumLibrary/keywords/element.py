@@ -16,15 +16,17 @@
 from collections import namedtuple
 
 from robot.utils import plural_or_not
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.keys import Keys
 
 
 from SeleniumLibrary.base import LibraryComponent, keyword
-from SeleniumLibrary.utils import (is_falsy, is_noney, is_truthy,
+from SeleniumLibrary.utils import (is_falsy, is_noney, is_truthy, LazyImport,
                                    plural_or_not as s)
 from SeleniumLibrary.errors import ElementNotFound
 
+ActionChains = LazyImport('selenium.webdriver.common.action_chains',
+                          'ActionChains')
+Keys = LazyImport('selenium.webdriver.common.keys', 'Keys')
+
 
 class ElementKeywords(LibraryComponent):
 
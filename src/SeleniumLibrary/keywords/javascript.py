@@ -22,6 +22,23 @@ from robot.utils import plural_or_not, seq2str
 from SeleniumLibrary.base import LibraryComponent, keyword
 
 
+AWAIT_PROMISE_SCRIPT = """
+var callback = arguments[arguments.length - 1];
+var args = Array.prototype.slice.call(arguments, 0, arguments.length - 1);
+new Promise(function (resolve) {
+    resolve((function () {
+%s
+    }).apply(window, args));
+}).then(function (value) {
+    callback({status: 'fulfilled', value: value});
+}, function (error) {
+    var reason = error instanceof Error ? error.toString() : String(error);
+    var stack = error && error.stack ? String(error.stack) : '';
+    callback({status: 'rejected', reason: reason, stack: stack});
+});
+"""
+
+
 class JavaScriptKeywords(LibraryComponent):
 
     js_marker = 'JAVASCRIPT'
@@ -100,6 +117,45 @@ class JavaScriptKeywords(LibraryComponent):
         self._js_logger('Executing Asynchronous JavaScript', js_code, js_args)
         return self.driver.execute_async_script(js_code, *js_args)
 
+    @keyword
+    def await_javascript_promise(self, *code):
+        """Executes JavaScript code returning a Promise and waits for it to settle.
+
+        The code is executed like with `Execute JavaScript` and it should
+        return a
+        [https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Promise|Promise]
+        or any other thenable. The keyword returns the value the promise
+        is fulfilled with. If the promise is rejected, or the code throws
+        an exception, the keyword fails with the rejection reason and the
+        JavaScript stack trace, when the browser provides one. Values that
+        are not promises are returned as is.
+
+        Unlike with `Execute Async JavaScript`, there is no need to call
+        the callback argument explicitly. The promise is resolved in one
+        WebDriver command without polling, and must settle within the
+        script timeout. See the `Timeout` section for more information.
+
+        JavaScript arguments can be given as part of ``code`` argument.
+        See `Execute JavaScript` for more details.
+
+        Examples:
+        | ${user} = | `Await JavaScript Promise` | return fetch('/api/user').then(r => r.json()); |
+        | `Await JavaScript Promise` | return window.app.ready; |
+        | ${result} = | `Await JavaScript Promise` | return window.app.load(arguments[0]); | ARGUMENTS | page1 |
+
+        New in SeleniumLibrary 4.1.
+        """
+        js_code, js_args = self._get_javascript_to_execute(code)
+        self._js_logger('Awaiting JavaScript Promise', js_code, js_args)
+        result = self.driver.execute_async_script(
+            AWAIT_PROMISE_SCRIPT % js_code, *js_args)
+        if result['status'] == 'rejected':
+            message = 'JavaScript promise was rejected: %s' % result['reason']
+            if result['stack']:
+                message = '%s\n%s' % (message, result['stack'])
+            raise AssertionError(message)
+        return result['value']
+
     def _js_logger(self, base, code, args):
         message = '%s:\n%s\n' % (base, code)
         if args:
@@ -0,0 +1,100 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+from SeleniumLibrary.base import keyword, LibraryComponent
+from SeleniumLibrary.utils import (is_noney, plural_or_not, secs_to_timestr,
+                                   timestr_to_secs)
+
+
+class PerformanceKeywords(LibraryComponent):
+
+    def __init__(self, ctx):
+        LibraryComponent.__init__(self, ctx)
+        self._lock = threading.Lock()
+        self._registered = False
+        self._start = None
+        self._commands = 0
+
+    @keyword
+    def start_performance_budget(self):
+        """Starts measuring WebDriver commands and elapsed time.
+
+        All commands sent to the browsers after this keyword are counted,
+        including commands sent to other browsers than the current one.
+        Calling this keyword again restarts the measurement. Use
+        `Performance Budget Should Not Exceed` to verify that the costs
+        since this keyword are within a budget.
+
+        Example:
+        | `Start Performance Budget`             |             |           |
+        | Fill Registration Form                 |             |           |
+        | `Performance Budget Should Not Exceed` | commands=50 | time=2s   |
+
+        New in SeleniumLibrary 4.1.
+        """
+        if not self._registered:
+            self.command_pipeline.register(self._count_command)
+            self._registered = True
+        with self._lock:
+            self._commands = 0
+            self._start = time.time()
+
+    @keyword
+    def performance_budget_should_not_exceed(self, commands=None, time=None):
+        """Verifies the costs since `Start Performance Budget`.
+
+        Fails if more than ``commands`` WebDriver commands have been sent to
+        the browsers or more than ``time`` has elapsed since the budget was
+        started. ``time`` can be given in Robot Framework's time format,
+        for example ``2s`` or ``1 minute 30 seconds``. Limits that are not
+        given are not verified. The measurement continues after this keyword,
+        so it can be used multiple times to verify cumulative costs.
+
+        Example:
+        | `Performance Budget Should Not Exceed` | commands=50 | time=2s |
+        | `Performance Budget Should Not Exceed` | time=1 min  |         |
+
+        New in SeleniumLibrary 4.1.
+        """
+        used_commands, elapsed = self._get_usage()
+        self.info('Used %d WebDriver command%s in %s.'
+                  % (used_commands, plural_or_not(used_commands),
+                     secs_to_timestr(elapsed)))
+        errors = []
+        if not is_noney(commands) and used_commands > int(commands):
+            errors.append('%d WebDriver commands exceeded the budget of %d.'
+                          % (used_commands, int(commands)))
+        if not is_noney(time) and elapsed > timestr_to_secs(time):
+            errors.append('Elapsed time %s exceeded the budget of %s.'
+                          % (secs_to_timestr(elapsed),
+                             secs_to_timestr(timestr_to_secs(time))))
+        if errors:
+            raise AssertionError('Performance budget exceeded: %s'
+                                 % ' '.join(errors))
+
+    def _get_usage(self):
+        if self._start is None:
+            raise RuntimeError('Performance budget has not been started.')
+        with self._lock:
+            return self._commands, time.time() - self._start
+
+    def _count_command(self, driver, command, params, execute):
+        with self._lock:
+            self._commands += 1
+        return execute(command, params)
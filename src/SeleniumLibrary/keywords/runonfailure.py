@@ -14,8 +14,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from robot.utils import normalize
+
 from SeleniumLibrary.base import LibraryComponent, keyword
-from SeleniumLibrary.utils import is_noney, is_string
+from SeleniumLibrary.utils import is_noney, is_string, is_truthy
+
+
+PAGE_STATE_SCRIPT = '''
+var html = document.documentElement ? document.documentElement.outerHTML : '';
+var hash = 0;
+for (var i = 0; i < html.length; i++) {
+    hash = (hash * 31 + html.charCodeAt(i)) | 0;
+}
+return [window.location.href, html.length, hash];
+'''
 
 
 class RunOnFailureKeywords(LibraryComponent):
@@ -66,3 +78,98 @@ class RunOnFailureKeywords(LibraryComponent):
         if is_noney(name) or is_string(name) and name.upper() == 'NOTHING':
             return None
         return name
+
+
+class RunOnFailurePolicy(object):
+    """Decides should the run-on-failure keyword be run for a failure.
+
+    ``max_per_test`` limits how many times the keyword is run in each
+    test or suite setup and teardown. ``skip_unchanged`` skips running
+    the keyword when the URL and the DOM of the page have not changed
+    since it was last run. ``skip_in_retry`` skips failures inside
+    keywords that retry or expect failures, such as `Wait Until Keyword
+    Succeeds`.
+    """
+    defaults = {'max_per_test': None, 'skip_unchanged': False,
+                'skip_in_retry': False}
+    retry_keywords = frozenset(normalize(name) for name in [
+        'BuiltIn.Wait Until Keyword Succeeds',
+        'BuiltIn.Run Keyword And Return Status',
+        'BuiltIn.Run Keyword And Ignore Error',
+        'BuiltIn.Run Keyword And Expect Error',
+        'BuiltIn.Run Keyword And Warn On Failure'
+    ])
+
+    def __init__(self, config=None):
+        self.config = self._parse_config(config)
+        self._count = 0
+        self._retry_depth = 0
+        self._page_state = None
+
+    @property
+    def enabled(self):
+        return self.config != self.defaults
+
+    def start_scope(self, name):
+        self._count = 0
+        self._retry_depth = 0
+        self._page_state = None
+
+    def start_keyword(self, name, attrs):
+        if normalize(name) in self.retry_keywords:
+            self._retry_depth += 1
+
+    def end_keyword(self, name, attrs):
+        if self._retry_depth and normalize(name) in self.retry_keywords:
+            self._retry_depth -= 1
+
+    def should_run(self, driver=None):
+        if self.config['skip_in_retry'] and self._retry_depth:
+            return False
+        limit = self.config['max_per_test']
+        if limit is not None and self._count >= limit:
+            return False
+        if self.config['skip_unchanged'] and driver is not None:
+            state = self._get_page_state(driver)
+            if state is not None and state == self._page_state:
+                return False
+            self._page_state = state
+        self._count += 1
+        return True
+
+    def _get_page_state(self, driver):
+        try:
+            return (id(driver),) + tuple(driver.execute_script(PAGE_STATE_SCRIPT))
+        except Exception:
+            return None
+
+    def _parse_config(self, config):
+        result = dict(self.defaults)
+        if is_string(config):
+            if not is_truthy(config):
+                return result
+            config = dict(self._split_item(item) for item in config.split(','))
+        elif not isinstance(config, dict):
+            return result
+        for name, value in config.items():
+            name = name.strip()
+            if name not in self.defaults:
+                raise ValueError("Invalid run-on-failure policy option '%s'. "
+                                 "Valid options are %s."
+                                 % (name, ', '.join(sorted(self.defaults))))
+            result[name] = self._convert(name, value)
+        return result
+
+    def _split_item(self, item):
+        if ':' not in item:
+            raise ValueError("Invalid run-on-failure policy option '%s'. "
+                             "Options must be given in format "
+                             "'name:value'." % item.strip())
+        return item.split(':', 1)
+
+    def _convert(self, name, value):
+        if is_string(value):
+            value = value.strip()
+        if name == 'max_per_test':
+            return int(value) if not is_noney(value) else None
+        return is_truthy(value)
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
 import os
 
 from robot.utils import get_link_path
@@ -23,6 +24,100 @@ from SeleniumLibrary.utils import is_noney
 from SeleniumLibrary.utils.path_formatter import _format_path
 
 
+DOM_SNAPSHOT_SCRIPT = """
+var properties = [
+    'display', 'position', 'top', 'right', 'bottom', 'left', 'float',
+    'width', 'height', 'box-sizing', 'overflow-x', 'overflow-y',
+    'margin-top', 'margin-right', 'margin-bottom', 'margin-left',
+    'padding-top', 'padding-right', 'padding-bottom', 'padding-left',
+    'border-top-width', 'border-right-width', 'border-bottom-width',
+    'border-left-width', 'border-top-style', 'border-right-style',
+    'border-bottom-style', 'border-left-style', 'border-top-color',
+    'border-right-color', 'border-bottom-color', 'border-left-color',
+    'color', 'background-color', 'background-image', 'opacity',
+    'visibility', 'z-index', 'font-family', 'font-size', 'font-weight',
+    'font-style', 'line-height', 'text-align', 'text-decoration',
+    'white-space', 'list-style-type', 'flex-direction', 'flex-wrap',
+    'justify-content', 'align-items', 'transform'
+];
+var root = document.documentElement;
+var clone = root.cloneNode(true);
+var originals = Array.prototype.slice.call(root.getElementsByTagName('*'));
+var copies = Array.prototype.slice.call(clone.getElementsByTagName('*'));
+var sandbox = document.createElement('div');
+sandbox.style.cssText = 'position:absolute;left:-10000px;visibility:hidden;';
+(document.body || root).appendChild(sandbox);
+var defaults = {};
+
+function getDefaults(tag) {
+    if (!defaults.hasOwnProperty(tag)) {
+        var element = document.createElement(tag);
+        sandbox.appendChild(element);
+        defaults[tag] = getValues(window.getComputedStyle(element));
+        sandbox.removeChild(element);
+    }
+    return defaults[tag];
+}
+
+function getValues(style) {
+    var values = [];
+    for (var i = 0; i < properties.length; i++) {
+        values.push(style.getPropertyValue(properties[i]));
+    }
+    return values;
+}
+
+try {
+    for (var i = 0; i < originals.length; i++) {
+        var original = originals[i], copy = copies[i];
+        var tag = original.tagName.toLowerCase();
+        if (tag === 'script' || tag === 'noscript') {
+            continue;
+        }
+        var values = getValues(window.getComputedStyle(original));
+        var initial = getDefaults(tag);
+        var declarations = [];
+        for (var j = 0; j < properties.length; j++) {
+            if (values[j] !== initial[j]) {
+                declarations.push(properties[j] + ':' + values[j]);
+            }
+        }
+        if (declarations.length) {
+            copy.setAttribute('style', declarations.join(';'));
+        } else {
+            copy.removeAttribute('style');
+        }
+        if (tag === 'input' || tag === 'textarea') {
+            if (original.type === 'checkbox' || original.type === 'radio') {
+                original.checked ? copy.setAttribute('checked', 'checked')
+                                 : copy.removeAttribute('checked');
+            } else if (tag === 'textarea') {
+                copy.textContent = original.value;
+            } else if (original.type !== 'password') {
+                copy.setAttribute('value', original.value);
+            }
+        } else if (tag === 'option') {
+            original.selected ? copy.setAttribute('selected', 'selected')
+                              : copy.removeAttribute('selected');
+        }
+    }
+} finally {
+    sandbox.parentNode.removeChild(sandbox);
+}
+var removed = clone.querySelectorAll('script, noscript');
+for (var i = 0; i < removed.length; i++) {
+    removed[i].parentNode.removeChild(removed[i]);
+}
+var head = clone.querySelector('head');
+if (head && !head.querySelector('base')) {
+    var base = document.createElement('base');
+    base.setAttribute('href', window.location.href);
+    head.insertBefore(base, head.firstChild);
+}
+return '<!DOCTYPE html>\\n' + clone.outerHTML;
+"""
+
+
 class ScreenshotKeywords(LibraryComponent):
 
     @keyword
@@ -88,6 +183,11 @@ class ScreenshotKeywords(LibraryComponent):
             self.info('Cannot capture screenshot because no browser is open.')
             return
         path = self._get_screenshot_path(filename)
+        if self._write_in_background():
+            self.screenshot_writer.write(path,
+                                         self.driver.get_screenshot_as_base64())
+            self._embed_to_log(path, 800)
+            return path
         self._create_directory(path)
         if not self.driver.save_screenshot(path):
             raise RuntimeError("Failed to save screenshot '{}'.".format(path))
@@ -125,6 +225,64 @@ class ScreenshotKeywords(LibraryComponent):
         self._embed_to_log(path, 400)
         return path
 
+    def _write_in_background(self):
+        writer = self.screenshot_writer
+        if writer is None:
+            return False
+        for error in writer.get_errors():
+            self.warn(error)
+        return self.ctx._running_on_failure_keyword
+
+    @keyword
+    def capture_dom_snapshot(self, filename='selenium-dom-snapshot-{index}.html'):
+        """Saves the current page as HTML with computed styles inlined and links it to the log file.
+
+        The snapshot is created with one JavaScript call. Computed styles
+        that differ from the browser defaults are added to the ``style``
+        attribute of each element, current values of form fields are
+        stored as attributes, and scripts are removed. The snapshot can
+        thus be opened without the application and is a lot faster to
+        create than a screenshot, especially with large windows or
+        remote browsers. Contents of frames are not included.
+
+        Using the snapshot as the `run-on-failure functionality` helps
+        debugging locators, because the whole DOM is available:
+        | =Settings= | =Value=         | =Value=                               |
+        | Library    | SeleniumLibrary | run_on_failure=Capture DOM Snapshot |
+
+        See `Capture Page Screenshot` for details about the ``filename``
+        argument. If ``filename`` ends with ``.gz``, the snapshot is gzip
+        compressed. Snapshots of large pages are often megabytes in size
+        and compress well, but browsers typically download compressed
+        snapshots instead of showing them, and they need to be
+        uncompressed, for example with ``gunzip``, before viewing. The
+        default snapshots are not compressed. An absolute path to the
+        created file is returned.
+
+        A link to the snapshot is written to the log file. The link is
+        relative to the log file, so the snapshots must be kept next to
+        it when results are moved. Uncompressed snapshots open directly
+        from the link.
+
+        New in SeleniumLibrary 4.1.
+        """
+        if not self.drivers.current:
+            self.info('Cannot capture DOM snapshot because no browser is open.')
+            return
+        path = self._get_screenshot_path(filename)
+        self._create_directory(path)
+        html = self.driver.execute_script(DOM_SNAPSHOT_SCRIPT).encode('UTF-8')
+        if path.endswith('.gz'):
+            with gzip.open(path, 'wb') as output:
+                output.write(html)
+        else:
+            with open(path, 'wb') as output:
+                output.write(html)
+        self.info('DOM snapshot saved to <a href="{src}">{name}</a>.'
+                  .format(src=get_link_path(path, self.log_dir),
+                          name=os.path.basename(path)), html=True)
+        return path
+
     def _get_screenshot_path(self, filename):
         directory = self.ctx.screenshot_root_directory or self.log_dir
         filename = filename.replace('/', os.sep)
@@ -134,9 +292,15 @@ class ScreenshotKeywords(LibraryComponent):
             formatted = _format_path(filename, index)
             path = os.path.join(directory, formatted)
             # filename didn't contain {index} or unique path was found
-            if formatted == filename or not os.path.exists(path):
+            if formatted == filename or not self._path_exists(path):
                 return path
 
+    def _path_exists(self, path):
+        if os.path.exists(path):
+            return True
+        writer = self.screenshot_writer
+        return writer is not None and writer.is_pending(path)
+
     def _create_directory(self, path):
         target_dir = os.path.dirname(path)
         if not os.path.exists(target_dir):
@@ -15,10 +15,11 @@
 # limitations under the License.
 
 from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.support.ui import Select
 
 from SeleniumLibrary.base import LibraryComponent, keyword
-from SeleniumLibrary.utils import is_truthy, plural_or_not as s
+from SeleniumLibrary.utils import is_truthy, LazyImport, plural_or_not as s
+
+Select = LazyImport('selenium.webdriver.support.ui', 'Select')
 
 
 class SelectElementKeywords(LibraryComponent):
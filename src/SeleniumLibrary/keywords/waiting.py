@@ -23,6 +23,44 @@ from SeleniumLibrary.errors import ElementNotFound
 from SeleniumLibrary.utils import is_noney, secs_to_timestr
 
 
+WAIT_FOR_MUTATION_SCRIPT = """
+var element = arguments[0], kind = arguments[1], name = arguments[2],
+    expected = arguments[3], timeout = arguments[4],
+    callback = arguments[arguments.length - 1];
+var observer = null, interval = null, timer = null, done = false;
+function read() {
+    return kind === 'attribute' ? element.getAttribute(name) : element[name];
+}
+function finish(matched) {
+    if (done) { return; }
+    done = true;
+    if (observer) { observer.disconnect(); }
+    if (interval) { clearInterval(interval); }
+    if (timer) { clearTimeout(timer); }
+    callback(matched);
+}
+function check() {
+    var value = read();
+    if (value === expected || (value !== null && value !== undefined
+                               && String(value) === String(expected))) {
+        finish(true);
+    }
+}
+check();
+if (!done) {
+    observer = new MutationObserver(check);
+    if (kind === 'attribute') {
+        observer.observe(element, {attributes: true, attributeFilter: [name]});
+    } else {
+        observer.observe(element, {attributes: true, childList: true,
+                                   characterData: true, subtree: true});
+        interval = setInterval(check, 50);
+    }
+    timer = setTimeout(function () { finish(false); }, timeout);
+}
+"""
+
+
 class WaitingKeywords(LibraryComponent):
 
     @keyword
@@ -255,14 +293,96 @@ class WaitingKeywords(LibraryComponent):
             timeout, error
         )
 
+    @keyword
+    def wait_until_element_attribute_is(self, locator, attribute, expected,
+                                        timeout=None, error=None):
+        """Waits until the ``attribute`` of element ``locator`` is ``expected``.
+
+        Unlike other ``Wait ...`` keywords, this keyword does not poll the
+        browser. The element is located once and the browser notifies
+        when the attribute changes, which makes the keyword react faster
+        and use fewer WebDriver commands. Because the element is located
+        only once, it must exist when the keyword is called and must not
+        be replaced while waiting.
+
+        Fails if ``timeout`` expires before the attribute value is
+        ``expected``. See the `Timeouts` section for more information about
+        using timeouts and their default value and the `Locating elements`
+        section for details about the locator syntax.
+
+        ``error`` can be used to override the default error message.
+
+        Examples:
+        | `Wait Until Element Attribute Is` | id:results | aria-busy | false |
+        | `Wait Until Element Attribute Is` | id:loader  | class     | done  | timeout=10 s |
+
+        New in SeleniumLibrary 4.1.
+        """
+        self._wait_until_element_state(
+            'attribute', locator, attribute, expected,
+            "Element '%s' attribute '%s' did not become '%s' in <TIMEOUT>."
+            % (locator, attribute, expected), timeout, error
+        )
+
+    @keyword
+    def wait_until_element_property_is(self, locator, property, expected,
+                                       timeout=None, error=None):
+        """Waits until the ``property`` of element ``locator`` is ``expected``.
+
+        Like `Wait Until Element Attribute Is`, but waits for a DOM
+        property, such as ``value``, ``checked`` or ``disabled``, instead of
+        an HTML attribute. Properties do not always cause DOM mutations, and
+        therefore the browser also checks the property value at short
+        intervals while waiting.
+
+        The property value is compared both as is and as a string. For
+        example, expected value ``false`` matches the boolean ``false``.
+
+        Examples:
+        | `Wait Until Element Property Is` | id:submit | disabled | false |
+        | `Wait Until Element Property Is` | id:name   | value    | Robot | timeout=2 s |
+
+        New in SeleniumLibrary 4.1.
+        """
+        self._wait_until_element_state(
+            'property', locator, property, expected,
+            "Element '%s' property '%s' did not become '%s' in <TIMEOUT>."
+            % (locator, property, expected), timeout, error
+        )
+
+    def _wait_until_element_state(self, kind, locator, name, expected, error,
+                                  timeout=None, custom_error=None):
+        timeout = self.get_timeout(timeout)
+        error = self._get_error(error, timeout, custom_error)
+        element = self.find_element(locator)
+        # The script must not hit the WebDriver script timeout before
+        # the wait itself times out.
+        extend_script_timeout = timeout >= self.ctx.timeout
+        if extend_script_timeout:
+            self.driver.set_script_timeout(timeout + 1)
+        try:
+            matched = self.driver.execute_async_script(
+                WAIT_FOR_MUTATION_SCRIPT, element, kind, name, expected,
+                int(timeout * 1000)
+            )
+        except StaleElementReferenceException:
+            matched = False
+        finally:
+            if extend_script_timeout:
+                self.driver.set_script_timeout(self.ctx.timeout)
+        if not matched:
+            raise AssertionError(error)
+
     def _wait_until(self, condition, error, timeout=None, custom_error=None):
         timeout = self.get_timeout(timeout)
-        if is_noney(custom_error):
-            error = error.replace('<TIMEOUT>', secs_to_timestr(timeout))
-        else:
-            error = custom_error
+        error = self._get_error(error, timeout, custom_error)
         self._wait_until_worker(condition, timeout, error)
 
+    def _get_error(self, error, timeout, custom_error):
+        if is_noney(custom_error):
+            return error.replace('<TIMEOUT>', secs_to_timestr(timeout))
+        return custom_error
+
     def _wait_until_worker(self, condition, timeout, error):
         max_time = time.time() + timeout
         not_found = None
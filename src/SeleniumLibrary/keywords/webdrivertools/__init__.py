@@ -14,7 +14,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
+
+from .browserpool import BrowserPool
+from .commandpipeline import CommandPipeline, SpeedMiddleware
+from .driverservices import SharedDriverServices
+from .remoteconnection import RemoteConnectionPool
 from .webdrivertools import WebDriverCreator
 from .webdrivertools import WebDriverCache
 from .webdrivertools import SeleniumOptions
-from .sl_file_detector import SelLibLocalFileDetector
+
+# Importing the detector imports selenium.webdriver and is thus deferred
+# using a module level __getattr__ on Python versions supporting it.
+if sys.version_info >= (3, 7):
+    def __getattr__(name):
+        if name == 'SelLibLocalFileDetector':
+            from .sl_file_detector import SelLibLocalFileDetector
+            return SelLibLocalFileDetector
+        raise AttributeError('module %r has no attribute %r'
+                             % (__name__, name))
+else:
+    from .sl_file_detector import SelLibLocalFileDetector
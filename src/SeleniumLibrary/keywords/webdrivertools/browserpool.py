@@ -0,0 +1,223 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from robot.api import logger
+from robot.utils import is_string
+
+from SeleniumLibrary.utils import is_truthy
+
+
+RESET_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (error) {}
+try { window.sessionStorage.clear(); } catch (error) {}
+"""
+
+
+class BrowserPool(object):
+    """Keeps browsers ready to be handed out by `Open Browser`.
+
+    The pool contains browsers pre-launched in the background, when
+    ``size`` is positive, and closed browsers returned for reuse, when
+    ``reuse`` is true. Browsers are pooled by a signature created from
+    the arguments used to open them. Only browsers opened with arguments
+    that can be compared reliably, strings, numbers, Booleans and
+    dictionaries of them, are pooled.
+    """
+
+    def __init__(self, size=0, reuse=False):
+        self.size = int(size or 0)
+        self.reuse = is_truthy(reuse)
+        self._idle = {}
+        self._pending = {}
+        self._signatures = {}
+        self._messages = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.size > 0 or self.reuse
+
+    @staticmethod
+    def get_signature(*args):
+        signature = []
+        for arg in args:
+            if isinstance(arg, dict):
+                arg = tuple(sorted(arg.items()))
+            if not _is_comparable(arg):
+                return None
+            signature.append(arg)
+        return tuple(signature)
+
+    def acquire(self, signature, create_driver):
+        """Returns a pooled browser matching ``signature`` or ``None``.
+
+        Starts launching new browsers with ``create_driver`` in background
+        threads so that the pool has ``size`` idle browsers for the
+        ``signature`` available for the following calls. ``create_driver``
+        is called with a logger that collects messages so that they can be
+        logged later in the thread running keywords.
+        """
+        if not self.enabled or signature is None:
+            return None
+        self._log_messages()
+        driver = self._pop_alive(signature)
+        self._replenish(signature, create_driver)
+        return driver
+
+    def track(self, driver, signature):
+        """Remembers ``signature`` of ``driver`` so it can be released later."""
+        if self.reuse and signature is not None:
+            with self._lock:
+                self._signatures[driver] = signature
+
+    def release(self, driver):
+        """Resets ``driver`` and returns it to the pool for reuse.
+
+        Returns ``True`` if the pool took the browser and ``False`` if
+        the caller should quit it normally.
+        """
+        from selenium.webdriver.support.event_firing_webdriver import \
+            EventFiringWebDriver
+        if isinstance(driver, EventFiringWebDriver):
+            driver = driver.wrapped_driver
+        with self._lock:
+            signature = self._signatures.pop(driver, None)
+            if signature is None or self._closed:
+                return False
+        try:
+            self._reset(driver)
+        except Exception:
+            return False
+        with self._lock:
+            if self._closed:
+                return False
+            self._idle.setdefault(signature, []).append(driver)
+        return True
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            drivers = [driver for idle in self._idle.values()
+                       for driver in idle]
+            self._idle.clear()
+            self._signatures.clear()
+        for driver in drivers:
+            self._quit(driver)
+
+    def _pop_alive(self, signature):
+        while True:
+            with self._lock:
+                idle = self._idle.get(signature)
+                if not idle:
+                    return None
+                driver = idle.pop(0)
+            if self._is_alive(driver):
+                return driver
+            self._quit(driver)
+
+    def _reset(self, driver):
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.delete_all_cookies()
+        driver.execute_script(RESET_STORAGE_SCRIPT)
+        driver.get('about:blank')
+
+    def _is_alive(self, driver):
+        try:
+            driver.current_window_handle
+        except Exception:
+            return False
+        return True
+
+    def _replenish(self, signature, create_driver):
+        with self._lock:
+            if self._closed:
+                return
+            missing = (self.size - len(self._idle.get(signature, []))
+                       - self._pending.get(signature, 0))
+            if missing <= 0:
+                return
+            self._pending[signature] = self._pending.get(signature, 0) + missing
+        for _ in range(missing):
+            thread = threading.Thread(target=self._launch,
+                                      args=(signature, create_driver))
+            thread.daemon = True
+            thread.start()
+
+    def _launch(self, signature, create_driver):
+        driver = None
+        messages = MessageCollector()
+        try:
+            driver = create_driver(messages)
+        except Exception as error:
+            messages.warn('Pre-launching browser to the browser pool '
+                          'failed: %s' % error)
+        with self._lock:
+            self._messages.extend(messages)
+            self._pending[signature] -= 1
+            if driver is not None and not self._closed:
+                self._idle.setdefault(signature, []).append(driver)
+                return
+        if driver is not None:
+            self._quit(driver)
+
+    def _log_messages(self):
+        # Robot Framework ignores log messages from other threads and
+        # therefore messages are logged when the pool is used next time.
+        with self._lock:
+            messages, self._messages = self._messages, []
+        for message, level in messages:
+            logger.write(message, level)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+class MessageCollector(list):
+    """Collects messages logged with the ``robot.api.logger`` interface."""
+
+    def write(self, msg, level='INFO', html=False):
+        self.append((msg, level))
+
+    def trace(self, msg, html=False):
+        self.write(msg, 'TRACE')
+
+    def debug(self, msg, html=False):
+        self.write(msg, 'DEBUG')
+
+    def info(self, msg, html=False, also_console=False):
+        self.write(msg, 'INFO')
+
+    def warn(self, msg, html=False):
+        self.write(msg, 'WARN')
+
+    def error(self, msg, html=False):
+        self.write(msg, 'ERROR')
+
+
+def _is_comparable(item):
+    if isinstance(item, tuple):
+        return all(_is_comparable(value) for value in item)
+    return item is None or is_string(item) or isinstance(item, (bool, int, float))
@@ -0,0 +1,94 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import types
+
+
+class CommandPipeline(object):
+    """Chain of middleware around commands sent by WebDriver instances.
+
+    Middleware is a callable accepting ``driver``, ``command``, ``params``
+    and ``execute`` arguments. It must pass the command forward by calling
+    ``execute(command, params)`` and return the result. The last ``execute``
+    in the chain sends the command to the browser. Middleware registered
+    first is the outermost one.
+    """
+
+    def __init__(self, middleware=()):
+        self._middleware = ()
+        for item in middleware:
+            self.register(item)
+
+    @property
+    def middleware(self):
+        return list(self._middleware)
+
+    def register(self, middleware):
+        if not callable(middleware):
+            raise TypeError('Middleware must be callable, got %s.'
+                            % type(middleware).__name__)
+        # Chain is replaced, not modified, so that commands executed in
+        # other threads always see a consistent chain.
+        self._middleware = self._middleware + (middleware,)
+
+    def unregister(self, middleware):
+        self._middleware = tuple(item for item in self._middleware
+                                 if item != middleware)
+
+    def install(self, driver):
+        from selenium.webdriver.support.event_firing_webdriver import \
+            EventFiringWebDriver
+        if isinstance(driver, EventFiringWebDriver):
+            driver = driver.wrapped_driver
+        installed = getattr(driver, '_command_pipeline', None)
+        if installed is self:
+            return driver
+        if not isinstance(installed, CommandPipeline):
+            driver._base_execute = driver.execute
+        pipeline = self
+
+        def execute(self, driver_command, params=None):
+            return pipeline.execute(self, driver_command, params)
+
+        driver.execute = types.MethodType(execute, driver)
+        driver._command_pipeline = self
+        return driver
+
+    def execute(self, driver, command, params=None):
+        chain = self._middleware
+
+        def call(index, command, params=None):
+            if index == len(chain):
+                return driver._base_execute(command, params)
+            return chain[index](driver, command, params,
+                                lambda command, params=None:
+                                call(index + 1, command, params))
+
+        return call(0, command, params)
+
+
+class SpeedMiddleware(object):
+    """Waits the `Set Selenium Speed` delay after each command."""
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+
+    def __call__(self, driver, command, params, execute):
+        result = execute(command, params)
+        if self.ctx.speed > 0:
+            time.sleep(self.ctx.speed)
+        return result
@@ -0,0 +1,132 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from selenium.common.exceptions import SessionNotCreatedException
+
+from SeleniumLibrary.utils import LazyImport
+
+webdriver = LazyImport('selenium.webdriver')
+
+
+class SharedDriverServices(object):
+    """Keeps browser driver services running and shares them between sessions.
+
+    Instead of starting a new chromedriver or geckodriver process for each
+    browser, sessions are created against an already running service
+    using the WebDriver remote protocol. Services are health checked
+    before use and dead services are replaced. Services are stopped by
+    calling `close`.
+    """
+    drivers = None
+
+    def __init__(self):
+        self._services = {}
+        self._lock = threading.Lock()
+
+    def create_chrome(self, capabilities=None, options=None, service_log_path=None):
+        if options is not None:
+            capabilities = dict(capabilities or {})
+            capabilities.update(options.to_capabilities())
+        elif capabilities is None:
+            capabilities = webdriver.ChromeOptions().to_capabilities()
+        return self._create_session('chrome', capabilities, service_log_path)
+
+    def create_firefox(self, capabilities=None, options=None, profile=None,
+                       service_log_path=None):
+        firefox_capabilities = webdriver.DesiredCapabilities.FIREFOX.copy()
+        firefox_capabilities.update(capabilities or {})
+        firefox_capabilities.pop('marionette', None)
+        options = options or webdriver.FirefoxOptions()
+        if profile is not None:
+            options.profile = profile
+        firefox_capabilities.update(options.to_capabilities())
+        return self._create_session('firefox', firefox_capabilities,
+                                    service_log_path)
+
+    def close(self):
+        with self._lock:
+            services = [service for running in self._services.values()
+                        for service in running]
+            self._services.clear()
+        for service in services:
+            try:
+                service.stop()
+            except Exception:
+                pass
+
+    def _create_session(self, browser, capabilities, service_log_path):
+        for service in self._get_running_services(browser):
+            try:
+                return self._remote(browser, service, capabilities)
+            except SessionNotCreatedException:
+                # geckodriver supports only one session at a time and
+                # a busy service is skipped.
+                continue
+        service = self._start_service(browser, service_log_path)
+        return self._remote(browser, service, capabilities)
+
+    def _get_running_services(self, browser):
+        with self._lock:
+            running = [service for service in self._services.get(browser, [])
+                       if self._is_healthy(service)]
+            self._services[browser] = running
+            return list(running)
+
+    def _is_healthy(self, service):
+        process = getattr(service, 'process', None)
+        if process is None or process.poll() is not None:
+            return False
+        return service.is_connectable()
+
+    def _get_driver(self, browser):
+        if self.drivers is None:
+            self.drivers = self._get_default_drivers()
+        return self.drivers[browser]
+
+    def _get_default_drivers(self):
+        from selenium.webdriver.chrome.remote_connection import \
+            ChromeRemoteConnection
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        from selenium.webdriver.firefox.remote_connection import \
+            FirefoxRemoteConnection
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        return {
+            'chrome': (ChromeService, 'chromedriver', ChromeRemoteConnection),
+            'firefox': (FirefoxService, 'geckodriver', FirefoxRemoteConnection)
+        }
+
+    def _start_service(self, browser, service_log_path):
+        service_class, executable, _ = self._get_driver(browser)
+        if service_log_path:
+            service = service_class(executable, log_path=service_log_path)
+        else:
+            service = service_class(executable)
+        service.start()
+        with self._lock:
+            self._services.setdefault(browser, []).append(service)
+        return service
+
+    def _remote(self, browser, service, capabilities):
+        connection = self._get_driver(browser)[2]
+        executor = connection(remote_server_addr=service.service_url,
+                              keep_alive=True)
+        driver = webdriver.Remote(command_executor=executor,
+                                  desired_capabilities=dict(capabilities))
+        # Local file handling as with drivers started normally.
+        driver._is_remote = False
+        return driver
@@ -0,0 +1,26 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """Remote connection sending commands using a shared pool manager."""
+
+    def __init__(self, remote_server_addr, pool_manager):
+        RemoteConnection.__init__(self, remote_server_addr, keep_alive=False)
+        self.keep_alive = True
+        self._conn = pool_manager
@@ -0,0 +1,34 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
+
+
+class PreparedFirefoxProfile(FirefoxProfile):
+    """Firefox profile which content has already been zipped and encoded.
+
+    The profile has its own empty profile directory, which the driver
+    is free to remove, and `encoded` returns the cached payload.
+    """
+
+    def __init__(self, encoded, preferences):
+        FirefoxProfile.__init__(self)
+        self.default_preferences = dict(preferences)
+        self._encoded = encoded
+
+    @property
+    def encoded(self):
+        return self._encoded
@@ -0,0 +1,82 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+
+
+class FirefoxProfileCache(object):
+    """Caches prepared Firefox profiles between browser launches.
+
+    Creating a profile from a directory copies the whole directory and
+    sending it to the browser requires zipping and base64 encoding the
+    copy. The encoded payload is cached and keyed by the profile directory
+    fingerprint, which contains names, sizes and modification times of
+    the files, or by the profile option string. Subsequent launches get
+    a lightweight `PreparedFirefoxProfile` using the cached payload.
+    """
+    max_size = 8
+
+    def __init__(self):
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, ff_profile_dir, create_profile):
+        key = self.get_key(ff_profile_dir)
+        with self._lock:
+            prepared = self._profiles.get(key)
+        if prepared is None:
+            prepared = self._prepare(create_profile(ff_profile_dir))
+            with self._lock:
+                self._profiles[key] = prepared
+                while len(self._profiles) > self.max_size:
+                    self._profiles.popitem(last=False)
+        from .preparedprofile import PreparedFirefoxProfile
+        return PreparedFirefoxProfile(*prepared)
+
+    def clear(self):
+        with self._lock:
+            self._profiles.clear()
+
+    @staticmethod
+    def get_key(ff_profile_dir):
+        if not os.path.isdir(ff_profile_dir):
+            return 'options', ff_profile_dir
+        path = os.path.abspath(ff_profile_dir)
+        digest = hashlib.sha1()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                digest.update(repr((os.path.relpath(file_path, path),
+                                    stat.st_size, stat.st_mtime)).encode('UTF-8'))
+        return 'directory', path, digest.hexdigest()
+
+    def _prepare(self, profile):
+        encoded = profile.encoded
+        preferences = dict(profile.default_preferences)
+        for path in (profile.path, profile.tempfolder):
+            if path:
+                shutil.rmtree(path, ignore_errors=True)
+        return encoded, preferences
+
@@ -0,0 +1,114 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from robot.errors import DataError
+
+from SeleniumLibrary.utils import (is_string, is_truthy, LazyImport,
+                                   timestr_to_secs)
+
+urllib3 = LazyImport('urllib3')
+
+
+class RemoteConnectionPool(object):
+    """Keep-alive HTTP connections shared by sessions to remote servers.
+
+    Selenium opens a new HTTP connection for each command sent to a remote
+    server unless keep-alive is enabled for the connection of a single
+    session. This class owns one urllib3 pool manager that keeps
+    connections per remote server open and is shared by all sessions
+    created with `create_executor`.
+
+    Requires Selenium 3.14 or newer, because older versions do not send
+    commands using urllib3.
+    """
+    defaults = {'pool_size': 10, 'connect_timeout': None, 'timeout': None,
+                'retries': 3}
+
+    def __init__(self, config=None):
+        self._verify_selenium()
+        self.config = self._parse_config(config)
+        self._pool_manager = None
+
+    @property
+    def pool_manager(self):
+        if self._pool_manager is None:
+            self._pool_manager = urllib3.PoolManager(
+                maxsize=self.config['pool_size'], block=False,
+                timeout=self._get_timeout(), retries=self._get_retries())
+        return self._pool_manager
+
+    def create_executor(self, remote_url):
+        from .pooledconnection import PooledRemoteConnection
+        return PooledRemoteConnection(remote_url, self.pool_manager)
+
+    def close(self):
+        if self._pool_manager is not None:
+            self._pool_manager.clear()
+            self._pool_manager = None
+
+    def _verify_selenium(self):
+        from selenium.webdriver.remote import remote_connection
+        if not hasattr(remote_connection, 'urllib3'):
+            raise DataError('Remote connection pool requires Selenium 3.14 '
+                            'or newer.')
+
+    def _parse_config(self, config):
+        result = dict(self.defaults)
+        if is_string(config):
+            if not is_truthy(config):
+                return result
+            if config.upper() == 'TRUE':
+                return result
+            config = dict(self._split_item(item) for item in config.split(','))
+        elif not isinstance(config, dict):
+            return result
+        for name, value in config.items():
+            name = name.strip()
+            if name not in self.defaults:
+                raise ValueError("Invalid remote connection pool option '%s'. "
+                                 "Valid options are %s."
+                                 % (name, ', '.join(sorted(self.defaults))))
+            result[name] = self._convert(name, value)
+        return result
+
+    def _split_item(self, item):
+        if ':' not in item:
+            raise ValueError("Invalid remote connection pool option '%s'. "
+                             "Options must be given in format "
+                             "'name:value'." % item.strip())
+        return item.split(':', 1)
+
+    def _convert(self, name, value):
+        if is_string(value):
+            value = value.strip()
+        if name in ('pool_size', 'retries'):
+            return int(value)
+        return timestr_to_secs(value) if is_truthy(value) else None
+
+    def _get_timeout(self):
+        timeouts = {}
+        if self.config['connect_timeout'] is not None:
+            timeouts['connect'] = self.config['connect_timeout']
+        if self.config['timeout'] is not None:
+            timeouts['read'] = self.config['timeout']
+        return urllib3.Timeout(**timeouts)
+
+    def _get_retries(self):
+        # urllib3 retries read errors, such as connection resets, only
+        # with idempotent methods because the command may have been executed.
+        retries = self.config['retries']
+        return urllib3.Retry(total=retries, connect=retries, read=retries)
+
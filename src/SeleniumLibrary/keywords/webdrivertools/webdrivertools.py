@@ -14,25 +14,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import ast
+import copy
 import importlib
 import inspect
 import os
+import threading
 import token
 import warnings
 from tokenize import generate_tokens
 
 from robot.api import logger
 from robot.utils import ConnectionCache, StringIO
-from selenium import webdriver
-from selenium.webdriver import FirefoxProfile
 
-from SeleniumLibrary.utils import is_falsy, is_truthy, is_noney, is_string, PY3
-from SeleniumLibrary.keywords.webdrivertools.sl_file_detector import SelLibLocalFileDetector
+from SeleniumLibrary.utils import (is_falsy, is_truthy, is_noney, is_string,
+                                   LazyImport, run_concurrently, PY3)
+from SeleniumLibrary.keywords.webdrivertools.profilecache import FirefoxProfileCache
 from SeleniumLibrary.utils.path_formatter import _format_path
 
 if not PY3:
     FileNotFoundError = object
 
+webdriver = LazyImport('selenium.webdriver')
+
 
 class WebDriverCreator(object):
 
@@ -55,20 +58,41 @@ class WebDriverCreator(object):
         'android': 'android',
         'iphone': 'iphone'
     }
+    # Log paths reserved by drivers being created concurrently.
+    _log_paths_in_use = set()
+    _log_paths_lock = threading.Lock()
+    ff_profiles = FirefoxProfileCache()
 
-    def __init__(self, log_dir):
+    def __init__(self, log_dir, driver_services=None,
+                 remote_connection_pool=None, message_logger=None):
         self.log_dir = log_dir
+        self.logger = message_logger or logger
         self.selenium_options = SeleniumOptions()
+        self.driver_services = driver_services
+        self.remote_connection_pool = remote_connection_pool
 
     def create_driver(self, browser, desired_capabilities, remote_url,
                       profile_dir=None, options=None, service_log_path=None):
+        reserved_log_paths = []
+        try:
+            return self._create_driver(browser, desired_capabilities,
+                                       remote_url, profile_dir, options,
+                                       service_log_path, reserved_log_paths)
+        finally:
+            with self._log_paths_lock:
+                self._log_paths_in_use.difference_update(reserved_log_paths)
+
+    def _create_driver(self, browser, desired_capabilities, remote_url,
+                       profile_dir, options, service_log_path,
+                       reserved_log_paths):
         browser = self._normalise_browser_name(browser)
         creation_method = self._get_creator_method(browser)
         desired_capabilities = self._parse_capabilities(desired_capabilities, browser)
-        service_log_path = self._get_log_path(service_log_path)
+        service_log_path = self._get_log_path(service_log_path,
+                                              reserved_log_paths)
         options = self.selenium_options.create(self.browser_names.get(browser), options)
         if service_log_path:
-            logger.info('Browser driver log file created to: %s' % service_log_path)
+            self.logger.info('Browser driver log file created to: %s' % service_log_path)
             self._create_directory(service_log_path)
         if (creation_method == self.create_firefox
                 or creation_method == self.create_headless_firefox):
@@ -115,6 +139,10 @@ class WebDriverCreator(object):
             defaul_caps = webdriver.DesiredCapabilities.CHROME.copy()
             desired_capabilities = self._remote_capabilities_resolver(desired_capabilities, defaul_caps)
             return self._remote(desired_capabilities, remote_url, options=options)
+        if self.driver_services:
+            return self.driver_services.create_chrome(
+                desired_capabilities.get('desired_capabilities'), options,
+                service_log_path)
         return webdriver.Chrome(options=options, service_log_path=service_log_path, **desired_capabilities)
 
     def create_headless_chrome(self, desired_capabilities, remote_url, options=None, service_log_path=None):
@@ -132,6 +160,10 @@ class WebDriverCreator(object):
             return self._remote(desired_capabilities, remote_url,
                                 profile, options)
         service_log_path = service_log_path if service_log_path else self._geckodriver_log
+        if self.driver_services:
+            return self.driver_services.create_firefox(
+                desired_capabilities.get('capabilities'), options, profile,
+                service_log_path)
         if self._has_service_log_path(webdriver.Firefox):
             # service_log_path is supported from Selenium 3.14 onwards
             # If can be removed when minimum Selenium version is 3.14.0 or greater
@@ -140,10 +172,14 @@ class WebDriverCreator(object):
         return webdriver.Firefox(options=options, firefox_profile=profile, **desired_capabilities)
 
     def _get_ff_profile(self, ff_profile_dir):
+        from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
         if isinstance(ff_profile_dir, FirefoxProfile):
             return ff_profile_dir
         if is_falsy(ff_profile_dir):
             return webdriver.FirefoxProfile()
+        return self.ff_profiles.get(ff_profile_dir, self._create_ff_profile)
+
+    def _create_ff_profile(self, ff_profile_dir):
         try:
             return webdriver.FirefoxProfile(ff_profile_dir)
         except (OSError, FileNotFoundError):
@@ -161,7 +197,7 @@ class WebDriverCreator(object):
     @property
     def _geckodriver_log(self):
         log_file = self._get_log_path(os.path.join(self.log_dir, 'geckodriver-{index}.log'))
-        logger.info('Firefox driver log is always forced to to: %s' % log_file)
+        self.logger.info('Firefox driver log is always forced to to: %s' % log_file)
         return log_file
 
     def create_headless_firefox(self, desired_capabilities, remote_url,
@@ -184,9 +220,9 @@ class WebDriverCreator(object):
         elif not self._has_service_log_path(webdriver.Ie) and self._has_options(webdriver.Ie):
             # options is supported from Selenium 3.10 onwards
             # If can be removed when minimum Selenium version is 3.10.0 or greater
-            logger.warn('This version of Selenium does not support service_log_path argument.')
+            self.logger.warn('This version of Selenium does not support service_log_path argument.')
             return webdriver.Ie(options=options, **desired_capabilities)
-        logger.warn('This version of Selenium does not support options or service_log_path argument.')
+        self.logger.warn('This version of Selenium does not support options or service_log_path argument.')
         return webdriver.Ie(**desired_capabilities)
 
     def _has_service_log_path(self, web_driver):
@@ -209,9 +245,9 @@ class WebDriverCreator(object):
         if not self._has_options(webdriver.Edge) and self._has_service_log_path(webdriver.Edge):
             # service_log_path is supported from Selenium 3.14 onwards
             # If can be removed when minimum Selenium version is 3.14.0 or greater
-            logger.warn('This version of Selenium does not support options argument.')
+            self.logger.warn('This version of Selenium does not support options argument.')
             return webdriver.Edge(service_log_path=service_log_path, **desired_capabilities)
-        logger.warn('This version of Selenium does not support options or service_log_path argument.')
+        self.logger.warn('This version of Selenium does not support options or service_log_path argument.')
         return webdriver.Edge(**desired_capabilities)
 
     def create_opera(self, desired_capabilities, remote_url, options=None, service_log_path=None):
@@ -227,7 +263,7 @@ class WebDriverCreator(object):
             desired_capabilities = self._remote_capabilities_resolver(desired_capabilities, defaul_caps)
             return self._remote(desired_capabilities, remote_url)
         if options or service_log_path:
-            logger.warn('Safari browser does not support Selenium options or service_log_path.')
+            self.logger.warn('Safari browser does not support Selenium options or service_log_path.')
         return webdriver.Safari(**desired_capabilities)
 
     def create_phantomjs(self, desired_capabilities, remote_url, options=None, service_log_path=None):
@@ -238,33 +274,33 @@ class WebDriverCreator(object):
             desired_capabilities = self._remote_capabilities_resolver(desired_capabilities, defaul_caps)
             return self._remote(desired_capabilities, remote_url)
         if options:
-            logger.warn('PhantomJS browser does not support Selenium options.')
+            self.logger.warn('PhantomJS browser does not support Selenium options.')
         return webdriver.PhantomJS(service_log_path=service_log_path, **desired_capabilities)
 
     def create_htmlunit(self, desired_capabilities, remote_url, options=None, service_log_path=None):
         if service_log_path or options:
-            logger.warn('Htmlunit does not support Selenium options or service_log_path argument.')
+            self.logger.warn('Htmlunit does not support Selenium options or service_log_path argument.')
         defaul_caps = webdriver.DesiredCapabilities.HTMLUNIT.copy()
         desired_capabilities = self._remote_capabilities_resolver(desired_capabilities, defaul_caps)
         return self._remote(desired_capabilities, remote_url, options=options)
 
     def create_htmlunit_with_js(self, desired_capabilities, remote_url, options=None, service_log_path=None):
         if service_log_path or options:
-            logger.warn('Htmlunit with JS does not support service_log_path argument.')
+            self.logger.warn('Htmlunit with JS does not support service_log_path argument.')
         defaul_caps = webdriver.DesiredCapabilities.HTMLUNITWITHJS.copy()
         desired_capabilities = self._remote_capabilities_resolver(desired_capabilities, defaul_caps)
         return self._remote(desired_capabilities, remote_url, options=options)
 
     def create_android(self, desired_capabilities, remote_url, options=None, service_log_path=None):
         if service_log_path:
-            logger.warn('Android does not support service_log_path argument.')
+            self.logger.warn('Android does not support service_log_path argument.')
         defaul_caps = webdriver.DesiredCapabilities.ANDROID.copy()
         desired_capabilities = self._remote_capabilities_resolver(desired_capabilities, defaul_caps)
         return self._remote(desired_capabilities, remote_url, options=options)
 
     def create_iphone(self, desired_capabilities, remote_url, options=None, service_log_path=None):
         if service_log_path:
-            logger.warn('iPhone does not support service_log_path argument.')
+            self.logger.warn('iPhone does not support service_log_path argument.')
         defaul_caps = webdriver.DesiredCapabilities.IPHONE.copy()
         desired_capabilities = self._remote_capabilities_resolver(desired_capabilities, defaul_caps)
         return self._remote(desired_capabilities, remote_url, options=options)
@@ -272,6 +308,8 @@ class WebDriverCreator(object):
     def _remote(self, desired_capabilities, remote_url,
                 profile_dir=None, options=None):
         remote_url = str(remote_url)
+        if self.remote_connection_pool:
+            remote_url = self.remote_connection_pool.create_executor(remote_url)
         file_detector = self._get_sl_file_detector()
         return webdriver.Remote(command_executor=remote_url,
                                 browser_profile=profile_dir, options=options,
@@ -280,34 +318,77 @@ class WebDriverCreator(object):
 
     def _get_sl_file_detector(self):
         # To ease unit testing.
+        from .sl_file_detector import SelLibLocalFileDetector
         return SelLibLocalFileDetector()
 
-    def _get_log_path(self, log_file):
+    def _get_log_path(self, log_file, reserved_log_paths=None):
         if is_noney(log_file):
             return None
         index = 1
-        while True:
-            formatted = _format_path(log_file, index)
-            path = os.path.join(self.log_dir, formatted)
-            # filename didn't contain {index} or unique path was found
-            if formatted == log_file or not os.path.exists(path):
-                return path
-            index += 1
+        with self._log_paths_lock:
+            while True:
+                formatted = _format_path(log_file, index)
+                path = os.path.join(self.log_dir, formatted)
+                # filename didn't contain {index} or unique path was found
+                if formatted == log_file:
+                    return path
+                if (not os.path.exists(path)
+                        and path not in self._log_paths_in_use):
+                    # Driver creates the log file only when it is started
+                    # and browsers opened in parallel could otherwise get
+                    # the same path.
+                    if reserved_log_paths is not None:
+                        self._log_paths_in_use.add(path)
+                        reserved_log_paths.append(path)
+                    return path
+                index += 1
 
     def _create_directory(self, path):
         target_dir = os.path.dirname(path)
         if not os.path.exists(target_dir):
-            os.makedirs(target_dir)
+            try:
+                os.makedirs(target_dir)
+            except OSError:
+                if not os.path.isdir(target_dir):
+                    raise
 
     def _normalise_browser_name(self, browser):
         return browser.lower().replace(' ', '')
 
 
+class ReusedDriver(object):
+    """Placeholder for a closed browser that was registered again."""
+
+
 class WebDriverCache(ConnectionCache):
+    close_all_workers = 8
 
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         ConnectionCache.__init__(self, no_current_msg='No current browser')
         self._closed = set()
+        self.browser_pool = browser_pool
+
+    def register(self, driver, alias=None):
+        if driver in self._closed:
+            self._forget_closed(driver)
+        return ConnectionCache.register(self, driver, alias)
+
+    def _forget_closed(self, driver):
+        # Browsers reused from the browser pool are registered again and
+        # their earlier, closed entries must not become active.
+        for index, connection in enumerate(self._connections):
+            if connection is driver:
+                placeholder = ReusedDriver()
+                self._connections[index] = placeholder
+                self._closed.add(placeholder)
+        self._closed.discard(driver)
+
+    def get_connection(self, alias_or_index=None):
+        driver = ConnectionCache.get_connection(self, alias_or_index)
+        if isinstance(driver, ReusedDriver):
+            raise RuntimeError("Non-existing index or alias '%s'."
+                               % alias_or_index)
+        return driver
 
     @property
     def drivers(self):
@@ -347,9 +428,14 @@ class WebDriverCache(ConnectionCache):
 
     def close_all(self):
         error = None
-        for driver in self._connections:
-            if driver not in self._closed:
-                error = self._quit(driver, error)
+        # Quitting a browser can take seconds and therefore all browsers
+        # are quit concurrently. Errors are logged afterwards in the main
+        # thread, because Robot Framework ignores logging from other threads.
+        results = run_concurrently(self._quit_driver, self.active_drivers,
+                                   self.close_all_workers)
+        for _, exception in results:
+            if exception:
+                error = self._quit_failed(exception)
         self.empty_cache()
         if error:
             raise error
@@ -357,12 +443,20 @@ class WebDriverCache(ConnectionCache):
 
     def _quit(self, driver, error):
         try:
-            driver.quit()
+            self._quit_driver(driver)
         except Exception as exception:
-            logger.error('When closing browser, received exception: %s' % exception)
-            error = exception
+            error = self._quit_failed(exception)
         return error
 
+    def _quit_driver(self, driver):
+        if self.browser_pool and self.browser_pool.release(driver):
+            return
+        driver.quit()
+
+    def _quit_failed(self, exception):
+        logger.error('When closing browser, received exception: %s' % exception)
+        return exception
+
     def get_index(self, alias_or_index):
         index = self._get_index(alias_or_index)
         try:
@@ -388,6 +482,10 @@ class WebDriverCache(ConnectionCache):
 
 
 class SeleniumOptions(object):
+    # Option strings and classes are cached because same options are
+    # typically used when opening a browser for each test.
+    _compiled_options = {}
+    _options_classes = {}
 
     def create(self, browser, options):
         if is_falsy(options):
@@ -395,18 +493,21 @@ class SeleniumOptions(object):
         selenium_options = self._import_options(browser)
         if not is_string(options):
             return options
-        options = self._parse(options)
         selenium_options = selenium_options()
-        for option in options:
-            for key in option:
-                attr = getattr(selenium_options, key)
-                if callable(attr):
-                    attr(*option[key])
-                else:
-                    setattr(selenium_options, key, *option[key])
+        for key, arguments in self._compile(options):
+            attr = getattr(selenium_options, key)
+            if callable(attr):
+                attr(*arguments)
+            else:
+                setattr(selenium_options, key, *arguments)
         return selenium_options
 
     def _import_options(self, browser):
+        if browser not in self._options_classes:
+            self._options_classes[browser] = self._import_options_class(browser)
+        return self._options_classes[browser]
+
+    def _import_options_class(self, browser):
         if browser == 'android':
             browser = 'chrome'  # Android uses ChromeOptions()
         browser = browser.replace('headless_', '', 1)
@@ -414,13 +515,20 @@ class SeleniumOptions(object):
         return options.Options
 
     def _parse(self, options):
-        result = []
-        for item in self._split(options):
-            try:
-                result.append(self._parse_to_tokens(item))
-            except ValueError:
-                raise ValueError('Unable to parse option: "%s"' % item)
-        return result
+        return [{key: arguments} for key, arguments in self._compile(options)]
+
+    def _compile(self, options):
+        if options not in self._compiled_options:
+            compiled = []
+            for item in self._split(options):
+                try:
+                    parsed = self._parse_to_tokens(item)
+                except ValueError:
+                    raise ValueError('Unable to parse option: "%s"' % item)
+                compiled.extend((key, tuple(parsed[key])) for key in parsed)
+            self._compiled_options[options] = tuple(compiled)
+        return [(key, copy.deepcopy(list(arguments)))
+                for key, arguments in self._compiled_options[options]]
 
     def _parse_to_tokens(self, item):
         result = {}
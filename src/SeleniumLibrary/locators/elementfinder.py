@@ -16,7 +16,6 @@
 
 from robot.api import logger
 from robot.utils import NormalizedDict
-from selenium.webdriver.remote.webelement import WebElement
 
 from SeleniumLibrary.base import ContextAware
 from SeleniumLibrary.errors import ElementNotFound
@@ -102,6 +101,7 @@ class ElementFinder(ContextAware):
 
     def _is_webelement(self, element):
         # Hook for unit tests
+        from selenium.webdriver.remote.webelement import WebElement
         return isinstance(element, WebElement)
 
     def _disallow_webelement_parent(self, element):
@@ -16,7 +16,13 @@
 
 from robot.utils import plural_or_not, secs_to_timestr, timestr_to_secs
 
-from .librarylistener import LibraryListener
+from .commandstatistics import CommandStatistics
+from .concurrency import run_concurrently
+from .lazyimport import LazyImport
+from .librarylistener import KeywordListener, LibraryListener
+from .screenshotwriter import ScreenshotWriter
+from .timingdatabase import TimingDatabase, TimingRecorder
+from .tracer import Tracer
 from .types import is_falsy, is_noney, is_string, is_truthy, PY3
 
 
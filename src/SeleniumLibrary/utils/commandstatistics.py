@@ -0,0 +1,128 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import threading
+import time
+
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
+from robot.utils import plural_or_not, printable_name, secs_to_timestr
+
+from .types import is_string
+
+
+class CommandStatistics(object):
+    """Attributes WebDriver commands to the SeleniumLibrary keyword running them.
+
+    Used as a command middleware. Totals of each finished keyword are
+    logged on DEBUG level and a summary of all keywords is written to
+    a JSON file by `write_summary`.
+    """
+    default_output = 'seleniumlibrary-commands.json'
+
+    def __init__(self, output=None):
+        if not is_string(output) or output.upper() == 'TRUE':
+            output = self.default_output
+        self.output = output
+        self.keywords = {}
+        self._stack = []
+        self._lock = threading.Lock()
+        self._output_dir = None
+
+    def __call__(self, driver, command, params, execute):
+        start = time.time()
+        try:
+            return execute(command, params)
+        finally:
+            self._record(command, time.time() - start)
+
+    def start_keyword(self, name):
+        if self._output_dir is None:
+            self._output_dir = self._get_output_dir()
+        with self._lock:
+            self._stack.append(_KeywordCommands(printable_name(name, code_style=True)))
+
+    def end_keyword(self):
+        with self._lock:
+            current = self._stack.pop()
+            total = self.keywords.setdefault(current.name, _KeywordTotals())
+            total.add(current)
+        logger.debug('Executed %d WebDriver command%s in %s.'
+                     % (current.count, plural_or_not(current.count),
+                        secs_to_timestr(current.elapsed)))
+
+    def get_summary(self):
+        with self._lock:
+            keywords = [dict(total.to_dict(), name=name)
+                        for name, total in self.keywords.items()]
+        keywords.sort(key=lambda item: (-item['commands'], item['name']))
+        return {'keywords': keywords,
+                'commands': sum(item['commands'] for item in keywords),
+                'elapsed': round(sum(item['elapsed'] for item in keywords), 3)}
+
+    def write_summary(self):
+        path = os.path.join(self._output_dir or self._get_output_dir(),
+                            self.output)
+        with open(path, 'w') as output:
+            json.dump(self.get_summary(), output, indent=2, sort_keys=True)
+
+    def _record(self, command, elapsed):
+        with self._lock:
+            if self._stack:
+                self._stack[-1].add(command, elapsed)
+
+    def _get_output_dir(self):
+        try:
+            return BuiltIn().get_variable_value('${OUTPUT DIR}')
+        except RobotNotRunningError:
+            return os.getcwd()
+
+
+class _KeywordCommands(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.elapsed = 0.0
+        self.commands = {}
+
+    def add(self, command, elapsed):
+        self.count += 1
+        self.elapsed += elapsed
+        self.commands[command] = self.commands.get(command, 0) + 1
+
+
+class _KeywordTotals(object):
+
+    def __init__(self):
+        self.calls = 0
+        self.count = 0
+        self.elapsed = 0.0
+        self.commands = {}
+
+    def add(self, keyword):
+        self.calls += 1
+        self.count += keyword.count
+        self.elapsed += keyword.elapsed
+        for command, count in keyword.commands.items():
+            self.commands[command] = self.commands.get(command, 0) + count
+
+    def to_dict(self):
+        return {'calls': self.calls, 'commands': self.count,
+                'elapsed': round(self.elapsed, 3),
+                'by_command': dict(self.commands)}
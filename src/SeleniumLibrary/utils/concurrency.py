@@ -0,0 +1,55 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+
+def run_concurrently(function, items, max_workers=8):
+    """Calls ``function`` with each of the ``items`` using a bounded number of threads.
+
+    Returns a list of ``(result, error)`` tuples in the same order as
+    ``items``. Exceptions are not raised but returned as ``error``.
+    Notice that Robot Framework ignores log messages written by other
+    threads than the main thread, and therefore ``function`` should not
+    log anything.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    indices = iter(range(len(items)))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                index = next(indices, None)
+            if index is None:
+                return
+            try:
+                results[index] = (function(items[index]), None)
+            except Exception as error:
+                results[index] = (None, error)
+
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        worker()
+        return results
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
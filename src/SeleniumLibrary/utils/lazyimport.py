@@ -0,0 +1,58 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from importlib import import_module
+
+
+class LazyImport(object):
+    """Imports a module, or a name from a module, when it is first used.
+
+    Importing any part of `selenium.webdriver` imports all the browser
+    specific modules, which is a considerable part of the library import
+    time. Keyword modules use this class instead of module level imports
+    so that the import happens when a browser is opened or a keyword
+    needing it is run.
+
+    Attributes and calls are forwarded to the imported object. Attributes
+    are looked up from the module on each use, so patching the module in
+    tests works as with normal imports. Use a function level import when
+    a class is needed with `isinstance` or as a base class.
+    """
+
+    def __init__(self, module, name=None):
+        self._module_name = module
+        self._name = name
+        self._module = None
+
+    @property
+    def target(self):
+        if self._module is None:
+            self._module = import_module(self._module_name)
+        if self._name is None:
+            return self._module
+        return getattr(self._module, self._name)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.target, name)
+
+    def __call__(self, *args, **kwargs):
+        return self.target(*args, **kwargs)
+
+    def __repr__(self):
+        return '<LazyImport %s>' % '.'.join(filter(None, [self._module_name,
+                                                           self._name]))
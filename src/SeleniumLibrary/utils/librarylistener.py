@@ -18,16 +18,84 @@ from .events import dispatch
 
 
 class LibraryListener(object):
+    """Listener of one library instance.
+
+    Scope events are dispatched to all registered event handlers. Scope
+    start and close handlers registered to the listener are specific to
+    the library instance owning the listener, because Robot Framework
+    calls listeners of each library instance separately.
+
+    Scope start handlers are called when a suite or a test starts and
+    also when a test or a child suite ends, because the teardown of the
+    parent suite may run after that and it is a scope of its own.
+    """
     ROBOT_LISTENER_API_VERSION = 2
 
+    def __init__(self):
+        self._scope_start_handlers = []
+        self._close_handlers = []
+
+    def register_scope_start(self, handler):
+        self._scope_start_handlers.append(handler)
+
+    def register_close(self, handler):
+        self._close_handlers.append(handler)
+
     def start_suite(self, name, attrs):
         dispatch('scope_start', attrs['longname'])
+        self._start_scope(attrs['longname'])
 
     def end_suite(self, name, attrs):
         dispatch('scope_end', attrs['longname'])
+        self._start_parent_scope(attrs['longname'])
 
     def start_test(self, name, attrs):
         dispatch('scope_start', attrs['longname'])
+        self._start_scope(attrs['longname'])
 
     def end_test(self, name, attrs):
         dispatch('scope_end', attrs['longname'])
+        self._start_parent_scope(attrs['longname'])
+
+    def _start_scope(self, scope):
+        for handler in self._scope_start_handlers:
+            handler(scope)
+
+    def _start_parent_scope(self, scope):
+        if '.' in scope:
+            self._start_scope(scope.rsplit('.', 1)[0])
+
+    def close(self):
+        for handler in self._close_handlers:
+            handler()
+
+
+class KeywordListener(object):
+    """Calls keyword handlers of one library instance.
+
+    Used only when keyword handlers are registered, because Robot
+    Framework calls keyword listener methods for every keyword executed.
+    """
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self):
+        self._start_handlers = []
+        self._end_handlers = []
+
+    @property
+    def enabled(self):
+        return bool(self._start_handlers or self._end_handlers)
+
+    def register_start(self, handler):
+        self._start_handlers.append(handler)
+
+    def register_end(self, handler):
+        self._end_handlers.append(handler)
+
+    def start_keyword(self, name, attrs):
+        for handler in self._start_handlers:
+            handler(name, attrs)
+
+    def end_keyword(self, name, attrs):
+        for handler in self._end_handlers:
+            handler(name, attrs)
@@ -0,0 +1,97 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import os
+import threading
+
+try:
+    from queue import Queue
+except ImportError:  # Python 2
+    from Queue import Queue
+
+
+class ScreenshotWriter(object):
+    """Decodes and writes screenshots to files in a background thread.
+
+    Screenshots are given to `write` as base64 encoded strings returned by
+    the browser. The path is reserved immediately, so that the caller can
+    embed it to the log before the file exists, and the file is written by
+    a daemon thread. Errors are collected and returned by `get_errors`,
+    because Robot Framework ignores messages logged by other threads.
+    `close` waits until all pending screenshots have been written.
+    """
+
+    def __init__(self):
+        self._queue = Queue()
+        self._pending = set()
+        self._errors = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def write(self, path, data):
+        with self._lock:
+            self._pending.add(path)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='ScreenshotWriter')
+                self._thread.daemon = True
+                self._thread.start()
+        self._queue.put((path, data))
+
+    def is_pending(self, path):
+        with self._lock:
+            return path in self._pending
+
+    def get_errors(self):
+        with self._lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    def flush(self):
+        self._queue.join()
+
+    def close(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path, data):
+        try:
+            directory = os.path.dirname(path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(path, 'wb') as output:
+                output.write(base64.b64decode(data.encode('ASCII')))
+        except Exception as error:
+            with self._lock:
+                self._errors.append("Writing screenshot '%s' failed: %s"
+                                    % (path, error))
+        finally:
+            with self._lock:
+                self._pending.discard(path)
@@ -0,0 +1,280 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Historical timing database and slowdown detection.
+
+Usage: python -m SeleniumLibrary.utils.timingdatabase database [options]
+
+Compares the latest run stored in the database with a rolling baseline
+built from the preceding runs with the same name and reports keywords and
+locators that have become significantly slower. Exits with a non-zero
+return code if slowdowns are found.
+"""
+
+from __future__ import print_function
+
+import argparse
+import math
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
+
+from .types import is_string
+
+
+class TimingStatistics(object):
+
+    def __init__(self, count=0, total=0.0, squares=0.0, minimum=None,
+                 maximum=None):
+        self.count = count
+        self.total = total
+        self.squares = squares
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        self.squares += elapsed * elapsed
+        self.minimum = elapsed if self.minimum is None else min(self.minimum, elapsed)
+        self.maximum = elapsed if self.maximum is None else max(self.maximum, elapsed)
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        self.squares += other.squares
+        for value in (other.minimum, other.maximum):
+            if value is not None:
+                self.minimum = value if self.minimum is None else min(self.minimum, value)
+                self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self):
+        if self.count < 2:
+            return 0.0
+        return max(self.squares - self.count * self.mean ** 2, 0.0) / (self.count - 1)
+
+
+class TimingRecorder(object):
+    """Collects keyword and locator timings and stores them at the end of run.
+
+    Keyword timings are received from `KeywordListener` keyword events and
+    locator timings by wrapping the element finder with `trace`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.keywords = {}
+        self.locators = {}
+        self._output_dir = None
+        self._run_name = None
+
+    def end_keyword(self, name, attrs):
+        if self._output_dir is None:
+            self._output_dir, self._run_name = self._get_run_info()
+        self._add(self.keywords, name, attrs['elapsedtime'] / 1000.0)
+
+    def trace(self, find):
+        def timed_find(locator, *args, **kwargs):
+            start = time.time()
+            try:
+                return find(locator, *args, **kwargs)
+            finally:
+                if is_string(locator):
+                    self._add(self.locators, str(locator), time.time() - start)
+        return timed_find
+
+    def write(self):
+        path = os.path.join(self._output_dir or self._get_run_info()[0],
+                            self.path)
+        with TimingDatabase(path) as database:
+            database.add_run(self._run_name or 'Unknown', self.keywords,
+                             self.locators)
+        return path
+
+    def _add(self, statistics, name, elapsed):
+        if name not in statistics:
+            statistics[name] = TimingStatistics()
+        statistics[name].add(elapsed)
+
+    def _get_run_info(self):
+        try:
+            builtin = BuiltIn()
+            return (builtin.get_variable_value('${OUTPUT DIR}'),
+                    builtin.get_variable_value('${SUITE NAME}'))
+        except RobotNotRunningError:
+            return os.getcwd(), None
+
+
+class TimingDatabase(object):
+    """SQLite database storing timing statistics of each run."""
+
+    def __init__(self, path):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT, started TEXT);
+            CREATE TABLE IF NOT EXISTS timings (
+                run_id INTEGER REFERENCES runs(id), kind TEXT, name TEXT,
+                count INTEGER, total REAL, squares REAL, minimum REAL,
+                maximum REAL);
+            CREATE INDEX IF NOT EXISTS timings_run ON timings (run_id);
+        """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def add_run(self, name, keywords, locators):
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT INTO runs (name, started) VALUES (?, ?)',
+                (name, datetime.now().isoformat()))
+            run_id = cursor.lastrowid
+            for kind, statistics in (('keyword', keywords),
+                                     ('locator', locators)):
+                self.connection.executemany(
+                    'INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    [(run_id, kind, item, stat.count, stat.total, stat.squares,
+                      stat.minimum, stat.maximum)
+                     for item, stat in statistics.items()])
+        return run_id
+
+    def get_runs(self, limit, name=None):
+        if name is None:
+            rows = self.connection.execute(
+                'SELECT id FROM runs ORDER BY id DESC LIMIT ?', (limit,))
+        else:
+            rows = self.connection.execute(
+                'SELECT id FROM runs WHERE name = ? ORDER BY id DESC LIMIT ?',
+                (name, limit))
+        return [row[0] for row in rows]
+
+    def get_latest_run_name(self):
+        row = self.connection.execute(
+            'SELECT name FROM runs ORDER BY id DESC LIMIT 1').fetchone()
+        return row[0] if row else None
+
+    def get_timings(self, run_ids):
+        timings = {}
+        for run_id in run_ids:
+            rows = self.connection.execute(
+                'SELECT kind, name, count, total, squares, minimum, maximum '
+                'FROM timings WHERE run_id = ?', (run_id,))
+            for kind, name, count, total, squares, minimum, maximum in rows:
+                stat = TimingStatistics(count, total, squares, minimum, maximum)
+                timings.setdefault((kind, name), TimingStatistics()).merge(stat)
+        return timings
+
+    def compare(self, baseline_runs=7, min_change=10.0, threshold=3.0):
+        """Returns slowdowns of the latest run compared to earlier runs.
+
+        Only earlier runs having the same name as the latest run are used
+        as the baseline, so runs of different suites stored in the same
+        database are not compared with each other. A slowdown is reported
+        when the mean time has grown at least ``min_change`` percent and
+        Welch's t statistic of the difference is at least ``threshold``.
+        """
+        name = self.get_latest_run_name()
+        if name is None:
+            return []
+        runs = self.get_runs(baseline_runs + 1, name)
+        if len(runs) < 2:
+            return []
+        latest = self.get_timings(runs[:1])
+        baseline = self.get_timings(runs[1:])
+        slowdowns = []
+        for key, current in sorted(latest.items()):
+            previous = baseline.get(key)
+            if not previous or not previous.mean:
+                continue
+            change = (current.mean - previous.mean) / previous.mean * 100
+            t = _welch_t(current, previous)
+            if change >= min_change and t >= threshold:
+                slowdowns.append(Slowdown(key[0], key[1], previous.mean,
+                                          current.mean, change, t))
+        return slowdowns
+
+
+class Slowdown(object):
+
+    def __init__(self, kind, name, baseline, latest, change, t):
+        self.kind = kind
+        self.name = name
+        self.baseline = baseline
+        self.latest = latest
+        self.change = change
+        self.t = t
+
+    def __str__(self):
+        return ("%s '%s' mean %.3fs -> %.3fs (+%.1f%%, t=%.1f)"
+                % (self.kind.capitalize(), self.name, self.baseline,
+                   self.latest, self.change, self.t))
+
+
+def _welch_t(first, second):
+    error = math.sqrt(first.variance / max(first.count, 1)
+                      + second.variance / max(second.count, 1))
+    difference = first.mean - second.mean
+    if not error:
+        return float('inf') if difference > 0 else 0.0
+    return difference / error
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m SeleniumLibrary.utils.timingdatabase',
+        description='Compares the latest run in a SeleniumLibrary timing '
+                    'database with a rolling baseline of earlier runs.')
+    parser.add_argument('database', help='Path to the timing database.')
+    parser.add_argument('--baseline', type=int, default=7, metavar='RUNS',
+                        help='Number of earlier runs used as the baseline. '
+                             'Default is 7.')
+    parser.add_argument('--min-change', type=float, default=10.0,
+                        metavar='PERCENT',
+                        help='Minimum slowdown to report. Default is 10.')
+    parser.add_argument('--threshold', type=float, default=3.0, metavar='T',
+                        help="Minimum Welch's t statistic to consider the "
+                             "slowdown significant. Default is 3.")
+    options = parser.parse_args(arguments)
+    if not os.path.isfile(options.database):
+        parser.error("Database '%s' does not exist." % options.database)
+    with TimingDatabase(options.database) as database:
+        slowdowns = database.compare(options.baseline, options.min_change,
+                                     options.threshold)
+    for slowdown in slowdowns:
+        print(slowdown)
+    if not slowdowns:
+        print('No significant slowdowns found.')
+    return 1 if slowdowns else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
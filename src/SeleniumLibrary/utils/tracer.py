@@ -0,0 +1,132 @@
+# Copyright 2008-2011 Nokia Networks
+# Copyright 2011-2016 Ryan Tomac, Ed Manlove and contributors
+# Copyright 2016-     Robot Framework Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import threading
+import time
+
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
+
+from .types import is_string
+
+
+class Tracer(object):
+    """Records nested spans and writes them as a Chrome trace or Speedscope file.
+
+    Spans are recorded as begin and end events per thread. Robot Framework
+    keywords, SeleniumLibrary keywords, element finds and WebDriver commands
+    are traced by the library. The tracer itself works as a command
+    middleware.
+    """
+    formats = {'chrome': 'seleniumlibrary-trace.json',
+               'speedscope': 'seleniumlibrary-trace.speedscope.json'}
+
+    def __init__(self, format='chrome'):
+        if not is_string(format) or format.upper() == 'TRUE':
+            format = 'chrome'
+        format = format.lower()
+        if format not in self.formats:
+            raise ValueError("Trace format must be 'chrome' or 'speedscope', "
+                             "got '%s'." % format)
+        self.format = format
+        self.events = []
+        self._output_dir = None
+
+    def begin(self, name, category):
+        if self._output_dir is None:
+            self._output_dir = self._get_output_dir()
+        self.events.append(('B', name, category, self._now(),
+                            threading.current_thread().ident))
+
+    def end(self, name, category):
+        self.events.append(('E', name, category, self._now(),
+                            threading.current_thread().ident))
+
+    def __call__(self, driver, command, params, execute):
+        self.begin(command, 'webdriver')
+        try:
+            return execute(command, params)
+        finally:
+            self.end(command, 'webdriver')
+
+    def start_keyword(self, name, attrs):
+        self.begin(name, 'robot')
+
+    def end_keyword(self, name, attrs):
+        self.end(name, 'robot')
+
+    def trace(self, function, category, get_name):
+        def traced(*args, **kwargs):
+            name = get_name(*args, **kwargs)
+            self.begin(name, category)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.end(name, category)
+        return traced
+
+    def write(self):
+        path = os.path.join(self._output_dir or self._get_output_dir(),
+                            self.formats[self.format])
+        if self.format == 'chrome':
+            trace = self._get_chrome_trace()
+        else:
+            trace = self._get_speedscope_trace()
+        with open(path, 'w') as output:
+            json.dump(trace, output)
+        return path
+
+    def _now(self):
+        return int(time.time() * 1000000)
+
+    def _get_chrome_trace(self):
+        events = [{'name': name, 'cat': category, 'ph': phase, 'ts': timestamp,
+                   'pid': 1, 'tid': thread}
+                  for phase, name, category, timestamp, thread in self.events]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def _get_speedscope_trace(self):
+        frames = []
+        frame_indices = {}
+        profiles = {}
+        for phase, name, category, timestamp, thread in self.events:
+            frame = '%s: %s' % (category, name)
+            if frame not in frame_indices:
+                frame_indices[frame] = len(frames)
+                frames.append({'name': frame})
+            profile = profiles.setdefault(thread, {
+                'type': 'evented', 'name': 'Thread %s' % thread,
+                'unit': 'microseconds', 'startValue': timestamp,
+                'endValue': timestamp, 'events': []})
+            profile['endValue'] = timestamp
+            profile['events'].append({'type': 'O' if phase == 'B' else 'C',
+                                      'frame': frame_indices[frame],
+                                      'at': timestamp})
+        return {'$schema': 'https://www.speedscope.app/file-format-schema.json',
+                'shared': {'frames': frames},
+                'profiles': list(profiles.values()),
+                'name': 'SeleniumLibrary trace',
+                'exporter': 'SeleniumLibrary'}
+
+    def _get_output_dir(self):
+        try:
+            output = BuiltIn().get_variable_value('${OUTPUT FILE}')
+            if output and output.upper() != 'NONE':
+                return os.path.dirname(output)
+            return BuiltIn().get_variable_value('${OUTPUT DIR}')
+        except RobotNotRunningError:
+            return os.getcwd()
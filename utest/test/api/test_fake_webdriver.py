@@ -0,0 +1,158 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+from SeleniumLibrary import SeleniumLibrary
+
+RESOURCES = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir,
+                         os.pardir, 'atest', 'resources')
+sys.path.insert(0, os.path.abspath(RESOURCES))
+try:
+    from fakewebdriver import FakeWebDriverServer
+    from fakewebdriver import css, dom, xpath
+finally:
+    sys.path.pop(0)
+
+PAGE = '''<html><head><title>Fake page</title></head><body>
+<div id="content" class="main wide"><p>Hello <b>world</b><p>Second</div>
+<table id="numbers"><tr><th>Name<th>Value<tr><td>one<td>1<tr><td>two<td>2</table>
+<select id="choice"><option value="1">One<option value="2" selected>Two</select>
+<ul><li>a<li>b<li class="last">c</ul>
+<input type="checkbox" name="agree"><input type="hidden" name="secret" value="x">
+<a href="other.html">Other page</a>
+</body></html>'''
+
+
+def html(element):
+    return [e.tag for e in element]
+
+
+class DomTests(unittest.TestCase):
+
+    def setUp(self):
+        self.document = dom.parse(PAGE, 'http://localhost/page.html')
+
+    def test_implied_end_tags_and_tbody(self):
+        table = css.select(self.document, '#numbers')[0]
+        self.assertEqual(html(table.elements), ['tbody'])
+        self.assertEqual(table.visible_text, 'Name Value\none 1\ntwo 2')
+        self.assertEqual(len(css.select(self.document, 'li')), 3)
+
+    def test_first_option_is_selected_by_default(self):
+        document = dom.parse('<select><option>A<option>B</select>'
+                             '<select multiple><option>C</select>')
+        self.assertEqual([option.selected for option in
+                          css.select(document, 'option')], [True, False, False])
+
+    def test_title_and_visibility(self):
+        self.assertEqual(self.document.title, 'Fake page')
+        hidden = css.select(self.document, 'input[type=hidden]')[0]
+        self.assertFalse(hidden.is_displayed)
+        self.assertTrue(self.document.body.is_displayed)
+
+    def test_css(self):
+        select = lambda selector: html(css.select(self.document, selector))
+        self.assertEqual(select('div#content.main > p'), ['p', 'p'])
+        self.assertEqual(select('[id="content"] b'), ['b'])
+        self.assertEqual(select('option[value ="2"]'), ['option'])
+        self.assertEqual(select('li:first-child, li.last'), ['li', 'li'])
+        self.assertEqual(select('li + li'), ['li', 'li'])
+        self.assertRaises(css.SelectorError, css.select, self.document, 'p::x')
+
+    def test_xpath(self):
+        select = lambda expression: xpath.select(self.document, expression)
+        self.assertEqual(html(select('//*[contains(., "world")]')),
+                         ['html', 'body', 'div', 'p', 'b'])
+        self.assertEqual(select('//tr[2]/td[2]')[0].string_value, '1')
+        self.assertEqual(select('(//li)[last()]')[0].string_value, 'c')
+        self.assertEqual(select('//li[position()=last()-1]')[0].string_value,
+                         'b')
+        self.assertEqual(html(select('//table/tbody/tr[1]/th|//frame')),
+                         ['th', 'th'])
+        self.assertEqual(len(select("//option[normalize-space(.) = "
+                                    "concat('T', 'wo')]")), 1)
+        self.assertEqual(len(select("//input[@type[. = 'checkbox' or . = "
+                                    "'radio'] and not(@checked)]")), 1)
+        self.assertEqual(select('//b/ancestor::div/@class')[0].value,
+                         'main wide')
+        self.assertRaises(xpath.XPathError, select, '//div[')
+        self.assertRaises(xpath.XPathError, select, 'count(//div)')
+
+
+class FakeWebDriverServerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        for name, content in [('page.html', PAGE),
+                              ('other.html', '<title>Other</title>'),
+                              ('frames.html', '<iframe id="inner" '
+                                              'src="page.html"></iframe>')]:
+            with open(os.path.join(cls.directory, name), 'w') as page:
+                page.write(content)
+        cls.server = FakeWebDriverServer(latencies={'get_title': 0.05}).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.lib = SeleniumLibrary(run_on_failure='Nothing',
+                                   screenshot_root_directory=self.directory)
+        self.lib.open_browser(self.url('page.html'), 'chrome',
+                              remote_url=self.server.url)
+        self.server.reset_commands()
+
+    def tearDown(self):
+        self.lib.close_all_browsers()
+
+    def url(self, name):
+        return 'file://' + os.path.join(self.directory, name)
+
+    def test_page_and_elements(self):
+        self.assertEqual(self.lib.get_title(), 'Fake page')
+        self.lib.page_should_contain('world')
+        self.lib.element_should_be_visible('id:content')
+        self.lib.element_should_not_be_visible('name:secret')
+        self.assertEqual(self.lib.get_text('css:#content p'), 'Hello world')
+        self.assertEqual(self.lib.get_element_attribute('id:content', 'class'),
+                         'main wide')
+        self.assertEqual(self.lib.get_element_count('//li'), 3)
+        self.assertEqual(self.server.commands[0], 'get_title')
+
+    def test_forms_and_tables(self):
+        self.lib.select_checkbox('agree')
+        self.lib.checkbox_should_be_selected('agree')
+        self.assertEqual(self.lib.get_selected_list_value('choice'), '2')
+        self.lib.select_from_list_by_label('choice', 'One')
+        self.assertEqual(self.lib.get_selected_list_label('choice'), 'One')
+        self.assertEqual(self.lib.get_table_cell('numbers', 3, 2), '2')
+        self.lib.table_should_contain('numbers', 'two')
+
+    def test_navigation_and_frames(self):
+        self.lib.click_link('Other page')
+        self.lib.title_should_be('Other')
+        self.lib.go_back()
+        self.lib.title_should_be('Fake page')
+        self.lib.go_to(self.url('frames.html'))
+        self.lib.select_frame('inner')
+        self.lib.element_text_should_be('css:li.last', 'c')
+        self.lib.unselect_frame()
+        self.lib.page_should_not_contain_element('css:li')
+
+    def test_stale_and_missing_elements(self):
+        element = self.lib.find_element('id:content')
+        self.lib.reload_page()
+        self.assertRaises(Exception, lambda: element.text)
+        self.assertRaises(Exception, self.lib.find_element, 'id:missing')
+
+    def test_latency(self):
+        start = time.time()
+        self.lib.get_title()
+        self.assertGreaterEqual(time.time() - start, 0.05)
+        self.lib.get_location()
+        self.assertEqual(self.server.commands, ['get_title', 'get_current_url'])
@@ -0,0 +1,154 @@
+import os
+import unittest
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.base import keyword, LazyComponent, LibraryCore
+
+
+class Component(object):
+
+    @keyword
+    def first(self, arg, default=1, *varargs, **kwargs):
+        pass
+
+    @keyword('Custom Name')
+    def second(self):
+        pass
+
+    @property
+    def broken(self):
+        raise AssertionError('Properties should not be accessed.')
+
+    def not_keyword(self):
+        pass
+
+
+class CountingComponent(Component):
+    created = 0
+
+    def __init__(self, value):
+        CountingComponent.created += 1
+        self.value = value
+
+    @keyword(tags=['tag'])
+    def third(self):
+        """Returns the value."""
+        return self.value
+
+
+class SubComponent(Component):
+
+    def second(self):
+        pass
+
+
+class SlotsComponent(Component):
+    __slots__ = ('dynamic',)
+
+
+class Library(LibraryCore):
+
+    def __init__(self, *components):
+        LibraryCore.__init__(self, components)
+
+
+class KeywordCacheTests(unittest.TestCase):
+
+    def test_only_decorated_methods_are_keywords(self):
+        lib = Library(Component())
+        self.assertEqual(lib.get_keyword_names(), ['Custom Name', 'first'])
+        self.assertEqual(LibraryCore._keyword_methods[Component],
+                         frozenset(['first', 'second']))
+
+    def test_undecorated_override_hides_keyword(self):
+        lib = Library(SubComponent())
+        self.assertEqual(lib.get_keyword_names(), ['first'])
+
+    def test_instance_attributes_can_be_keywords(self):
+        component = Component()
+        component.dynamic = keyword(lambda: None)
+        self.assertIn('dynamic', Library(component).get_keyword_names())
+
+    def test_components_with_slots(self):
+        component = SlotsComponent()
+        self.assertEqual(Library(component).get_keyword_names(),
+                         ['Custom Name', 'first'])
+        component.dynamic = keyword(lambda: None)
+        self.assertIn('first', Library(component).get_keyword_names())
+
+    def test_arguments_are_cached_and_copied(self):
+        lib = Library(Component())
+        args = lib.get_keyword_arguments('first')
+        self.assertEqual(args, ['arg', 'default=1', '*varargs', '**kwargs'])
+        args.append('mutated')
+        self.assertEqual(lib.get_keyword_arguments('first'),
+                         ['arg', 'default=1', '*varargs', '**kwargs'])
+        self.assertEqual(Library(Component()).get_keyword_arguments('first'),
+                         ['arg', 'default=1', '*varargs', '**kwargs'])
+
+    def test_keyword_names_are_updated_when_components_are_added(self):
+        lib = Library()
+        self.assertEqual(lib.get_keyword_names(), [])
+        lib.add_library_components([Component()])
+        self.assertEqual(lib.get_keyword_names(), ['Custom Name', 'first'])
+
+    def test_selenium_library_init_arguments(self):
+        args = SeleniumLibrary().get_keyword_arguments('__init__')
+        self.assertEqual(args[0], 'timeout=5.0')
+
+
+class LazyComponentTests(unittest.TestCase):
+
+    def setUp(self):
+        CountingComponent.created = 0
+        self.lib = Library(LazyComponent(CountingComponent, 'value'))
+
+    def test_keyword_information_does_not_create_component(self):
+        self.assertEqual(self.lib.get_keyword_names(),
+                         ['Custom Name', 'first', 'third'])
+        self.assertEqual(self.lib.get_keyword_arguments('first'),
+                         ['arg', 'default=1', '*varargs', '**kwargs'])
+        self.assertEqual(self.lib.get_keyword_arguments('third'), [])
+        self.assertEqual(self.lib.get_keyword_tags('third'), ['tag'])
+        self.assertEqual(self.lib.get_keyword_documentation('third'),
+                         'Returns the value.')
+        self.assertEqual(CountingComponent.created, 0)
+
+    def test_component_is_created_once_when_keyword_is_used(self):
+        self.assertEqual(self.lib.run_keyword('third', [], {}), 'value')
+        self.assertEqual(self.lib.third(), 'value')
+        self.lib.run_keyword('Custom Name', [], {})
+        self.assertEqual(CountingComponent.created, 1)
+
+    def test_selenium_library_components_are_created_when_used(self):
+        sl = SeleniumLibrary()
+        sl.get_keyword_documentation('get_selenium_speed')
+        sl.get_keyword_arguments('set_selenium_speed')
+        components = set(kw.component for kw in dict.values(sl.keywords))
+        self.assertEqual([c for c in components if c._instance], [])
+        self.assertEqual(sl.run_keyword('get_selenium_speed', [], {}),
+                         '0 seconds')
+        self.assertEqual(len([c for c in components if c._instance]), 1)
+
+
+class DocumentationCacheTests(unittest.TestCase):
+
+    def test_keyword_documentation_is_cached(self):
+        lib = Library(LazyComponent(CountingComponent, 'value'))
+        lib.get_keyword_tags('third')
+        self.assertEqual(lib.get_keyword_documentation('third'),
+                         'Returns the value.')
+        self.assertIn('Returns the value.', LibraryCore._documentation.values())
+
+    def test_intro_documentation_is_cached_per_plugins(self):
+        plugin = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              'my_lib.py')
+        intro = SeleniumLibrary().get_keyword_documentation('__intro__')
+        self.assertIs(SeleniumLibrary().get_keyword_documentation('__intro__'),
+                      intro)
+        with_plugin = SeleniumLibrary(plugins=plugin)
+        plugin_intro = with_plugin.get_keyword_documentation('__intro__')
+        self.assertIn('= Plugin: my_lib =', plugin_intro)
+        self.assertNotIn('= Plugin: my_lib =', intro)
+        self.assertIs(with_plugin.get_keyword_documentation('__intro__'),
+                      plugin_intro)
@@ -0,0 +1,45 @@
+import unittest
+
+from mockito import mock, unstub, when
+
+from SeleniumLibrary.keywords import JavaScriptKeywords
+from SeleniumLibrary.keywords.javascript import AWAIT_PROMISE_SCRIPT
+
+
+class AwaitJavaScriptPromiseTests(unittest.TestCase):
+
+    def setUp(self):
+        self.ctx = mock()
+        self.ctx.driver = mock()
+        self.js = JavaScriptKeywords(self.ctx)
+
+    def tearDown(self):
+        unstub()
+
+    def test_fulfilled(self):
+        script = AWAIT_PROMISE_SCRIPT % 'return window.app.load(arguments[0]);'
+        when(self.ctx.driver).execute_async_script(script, 'page1').thenReturn(
+            {'status': 'fulfilled', 'value': 42})
+        result = self.js.await_javascript_promise(
+            'return window.app.load(arguments[0]);', 'ARGUMENTS', 'page1')
+        self.assertEqual(result, 42)
+
+    def test_rejected_with_stack(self):
+        script = AWAIT_PROMISE_SCRIPT % 'return window.app.ready;'
+        when(self.ctx.driver).execute_async_script(script).thenReturn(
+            {'status': 'rejected', 'reason': 'Error: Not ready',
+             'stack': 'Error: Not ready\n    at load (app.js:1:2)'})
+        with self.assertRaises(AssertionError) as error:
+            self.js.await_javascript_promise('return window.app.ready;')
+        self.assertEqual(str(error.exception),
+                         'JavaScript promise was rejected: Error: Not ready\n'
+                         'Error: Not ready\n    at load (app.js:1:2)')
+
+    def test_rejected_without_stack(self):
+        script = AWAIT_PROMISE_SCRIPT % 'return Promise.reject("nope");'
+        when(self.ctx.driver).execute_async_script(script).thenReturn(
+            {'status': 'rejected', 'reason': 'nope', 'stack': ''})
+        with self.assertRaises(AssertionError) as error:
+            self.js.await_javascript_promise('return Promise.reject("nope");')
+        self.assertEqual(str(error.exception),
+                         'JavaScript promise was rejected: nope')
@@ -1,9 +1,11 @@
+import time
 import unittest
+import warnings
 
-from mockito import when, mock, verify, verifyNoMoreInteractions, unstub
+from mockito import ANY, when, mock, verify, verifyNoMoreInteractions, unstub
 from selenium import webdriver
 
-from SeleniumLibrary.keywords import BrowserManagementKeywords
+from SeleniumLibrary.keywords import BrowserManagementKeywords, BrowserPool
 from SeleniumLibrary import SeleniumLibrary
 
 
@@ -53,8 +55,22 @@ class BrowserManagementTests(unittest.TestCase):
         self.assertEqual(sl.get_selenium_implicit_wait(), '1 minute')
         self.assertEqual(org_value, '3 seconds')
 
+    def test_switch_browser_to_reused_browser_index(self):
+        sl = SeleniumLibrary()
+        driver = mock()
+        sl.register_driver(driver, 'first')
+        sl._drivers.close()
+        sl.register_driver(driver, 'second')
+        bm = BrowserManagementKeywords(sl)
+        with self.assertRaises(RuntimeError) as error:
+            bm.switch_browser(1)
+        self.assertEqual(str(error.exception),
+                         "No browser with index or alias '1' found.")
+        unstub()
+
     def test_bad_browser_name(self):
         ctx = mock()
+        ctx._browser_pool = BrowserPool()
         bm = BrowserManagementKeywords(ctx)
         try:
             bm._make_driver("fireox")
@@ -84,25 +100,42 @@ class BrowserManagementTests(unittest.TestCase):
         unstub()
 
     def test_open_browser_speed(self):
-        ctx = mock()
-        ctx._drivers = mock()
-        ctx.event_firing_webdriver = None
-        ctx.speed = 5.0
+        sl = SeleniumLibrary()
+        sl.set_selenium_speed('5 seconds')
         browser = mock()
+        when(browser).execute('getTitle', None).thenReturn('title')
         when(webdriver).Chrome(options=None, service_log_path=None).thenReturn(browser)
-        bm = BrowserManagementKeywords(ctx)
-        bm.open_browser('http://robotframework.org/', 'chrome')
-        self.assertEqual(browser._speed, 5.0)
+        when(time).sleep(5.0).thenReturn(None)
+        sl.open_browser('http://robotframework.org/', 'chrome')
+        self.assertEqual(browser.execute('getTitle'), 'title')
+        verify(time).sleep(5.0)
         unstub()
 
     def test_create_webdriver_speed(self):
-        ctx = mock()
-        ctx._drivers = mock()
-        ctx.event_firing_webdriver = None
-        ctx.speed = 0.0
+        sl = SeleniumLibrary()
         browser = mock()
+        when(browser).execute('getTitle', None).thenReturn('title')
         when(webdriver).Chrome(options=None, service_log_path=None).thenReturn(browser)
-        bm = BrowserManagementKeywords(ctx)
-        bm.open_browser('http://robotframework.org/', 'chrome')
-        verify(browser, times=0).__call__('_speed')
+        when(time).sleep(ANY).thenReturn(None)
+        sl.open_browser('http://robotframework.org/', 'chrome')
+        browser.execute('getTitle')
+        verify(time, times=0).sleep(ANY)
+        sl.set_selenium_speed(0.5)
+        browser.execute('getTitle')
+        verify(time).sleep(0.5)
+        unstub()
+
+    def test_deprecated_monkey_patch_speed_installs_pipeline(self):
+        sl = SeleniumLibrary()
+        sl.set_selenium_speed(0.5)
+        browser = mock()
+        when(browser).execute('getTitle', None).thenReturn('title')
+        when(time).sleep(ANY).thenReturn(None)
+        bm = BrowserManagementKeywords(sl)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            bm._monkey_patch_speed(browser)
+        self.assertEqual(caught[0].category, DeprecationWarning)
+        self.assertEqual(browser.execute('getTitle'), 'title')
+        verify(time).sleep(0.5)
         unstub()
@@ -0,0 +1,180 @@
+import threading
+import time
+import unittest
+
+from mockito import mock, unstub, verify, when
+from robot.api import logger
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import BrowserPool
+
+
+class BrowserFactory(object):
+
+    def __init__(self):
+        self.created = []
+        self.lock = threading.Lock()
+
+    def __call__(self, message_logger=None):
+        driver = mock()
+        with self.lock:
+            self.created.append(driver)
+        return driver
+
+
+class DeadDriver(object):
+    quitted = False
+
+    @property
+    def current_window_handle(self):
+        raise Exception('Session is gone.')
+
+    def quit(self):
+        self.quitted = True
+
+
+def wait_until_idle(pool, signature, count):
+    end = time.time() + 5
+    while time.time() < end:
+        if len(pool._idle.get(signature, [])) == count:
+            return
+        time.sleep(0.01)
+    raise AssertionError('Pool did not have %s idle browsers.' % count)
+
+
+def wait_until_launched(pool, signature):
+    end = time.time() + 5
+    while pool._pending[signature] and time.time() < end:
+        time.sleep(0.01)
+
+
+class BrowserPoolTests(unittest.TestCase):
+
+    def tearDown(self):
+        unstub()
+
+    def test_disabled_by_default(self):
+        pool = BrowserPool()
+        factory = BrowserFactory()
+        self.assertFalse(pool.enabled)
+        self.assertIsNone(pool.acquire(('chrome',), factory))
+        self.assertEqual(factory.created, [])
+
+    def test_signature(self):
+        signature = BrowserPool.get_signature(
+            'chrome', {'b': '2', 'a': '1'}, None, False, 'add_argument("x")',
+            None)
+        self.assertEqual(signature, ('chrome', (('a', '1'), ('b', '2')), None,
+                                     False, 'add_argument("x")', None))
+        self.assertIsNone(BrowserPool.get_signature('chrome', object()))
+        self.assertIsNone(BrowserPool.get_signature('chrome', {'a': object()}))
+
+    def test_not_comparable_signature_is_not_pooled(self):
+        pool = BrowserPool(1)
+        factory = BrowserFactory()
+        self.assertIsNone(pool.acquire(None, factory))
+        self.assertEqual(factory.created, [])
+
+    def test_acquire_replenishes_pool(self):
+        pool = BrowserPool(2)
+        factory = BrowserFactory()
+        signature = ('chrome',)
+        self.assertIsNone(pool.acquire(signature, factory))
+        wait_until_idle(pool, signature, 2)
+        driver = pool.acquire(signature, factory)
+        self.assertIn(driver, factory.created)
+        wait_until_idle(pool, signature, 2)
+        self.assertEqual(len(factory.created), 3)
+        self.assertIsNone(pool.acquire(('firefox',), factory))
+
+    def test_dead_browsers_are_skipped(self):
+        pool = BrowserPool(1)
+        dead, alive = DeadDriver(), mock()
+        pool._idle[('chrome',)] = [dead, alive]
+        pool._pending[('chrome',)] = 1
+        self.assertIs(pool.acquire(('chrome',), BrowserFactory()), alive)
+        self.assertTrue(dead.quitted)
+
+    def test_launch_errors_are_logged_later(self):
+        pool = BrowserPool(1)
+
+        def failing_factory(message_logger):
+            raise RuntimeError('No driver')
+
+        pool.acquire(('chrome',), failing_factory)
+        wait_until_launched(pool, ('chrome',))
+        message = 'Pre-launching browser to the browser pool failed: No driver'
+        self.assertEqual(pool._messages, [(message, 'WARN')])
+        when(logger).write(message, 'WARN')
+        pool.acquire(('chrome',), BrowserFactory())
+        verify(logger).write(message, 'WARN')
+        self.assertEqual(pool._messages, [])
+
+    def test_launch_messages_are_logged_later(self):
+        pool = BrowserPool(1)
+        factory = BrowserFactory()
+
+        def logging_factory(message_logger):
+            message_logger.info('Driver log file created.')
+            return factory(message_logger)
+
+        pool.acquire(('chrome',), logging_factory)
+        wait_until_idle(pool, ('chrome',), 1)
+        self.assertEqual(pool._messages, [('Driver log file created.', 'INFO')])
+        when(logger).write('Driver log file created.', 'INFO')
+        pool.acquire(('chrome',), factory)
+        verify(logger).write('Driver log file created.', 'INFO')
+
+    def test_close_quits_idle_browsers(self):
+        pool = BrowserPool(1)
+        driver = mock()
+        pool._idle[('chrome',)] = [driver]
+        pool.close()
+        verify(driver).quit()
+        factory = BrowserFactory()
+        self.assertIsNone(pool.acquire(('chrome',), factory))
+        self.assertEqual(factory.created, [])
+
+    def test_release_requires_reuse_and_tracking(self):
+        pool = BrowserPool()
+        driver = mock()
+        pool.track(driver, ('chrome',))
+        self.assertFalse(pool.release(driver))
+        pool = BrowserPool(reuse=True)
+        self.assertFalse(pool.release(driver))
+        verify(driver, times=0).get('about:blank')
+
+    def test_release_resets_and_reuses_browser(self):
+        pool = BrowserPool(reuse=True)
+        driver = mock()
+        driver.window_handles = ['main', 'popup']
+        driver.switch_to = mock()
+        pool.track(driver, ('chrome',))
+        self.assertTrue(pool.release(driver))
+        verify(driver.switch_to).window('popup')
+        verify(driver).close()
+        verify(driver.switch_to).window('main')
+        verify(driver).delete_all_cookies()
+        verify(driver).get('about:blank')
+        self.assertIs(pool.acquire(('chrome',), BrowserFactory()), driver)
+        self.assertIsNone(pool.acquire(('chrome',), BrowserFactory()))
+
+    def test_release_fails_when_reset_fails(self):
+        pool = BrowserPool(reuse=True)
+        driver = mock()
+        when(driver).delete_all_cookies().thenRaise(Exception('Alert open'))
+        driver.window_handles = ['main']
+        driver.switch_to = mock()
+        pool.track(driver, ('chrome',))
+        self.assertFalse(pool.release(driver))
+        self.assertEqual(pool._idle, {})
+
+
+class BrowserPoolLibraryCloseTests(unittest.TestCase):
+
+    def test_close_closes_only_own_browser_pool(self):
+        first = SeleniumLibrary(browser_pool=1)
+        second = SeleniumLibrary(browser_pool=1)
+        second.ROBOT_LIBRARY_LISTENER.close()
+        self.assertTrue(second._browser_pool._closed)
+        self.assertFalse(first._browser_pool._closed)
@@ -0,0 +1,120 @@
+import unittest
+
+from mockito import mock, unstub, verify, when
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+from selenium.webdriver.support.events import AbstractEventListener
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import CommandPipeline, SpeedMiddleware
+
+
+class Driver(WebDriver):
+
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, command, params=None):
+        self.executed.append((command, params))
+        return {'value': command}
+
+
+class Recorder(object):
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def __call__(self, driver, command, params, execute):
+        self.calls.append('%s before %s' % (self.name, command))
+        result = execute(command, params)
+        self.calls.append('%s after %s' % (self.name, command))
+        return result
+
+
+class CommandPipelineTests(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.first = Recorder('first', self.calls)
+        self.second = Recorder('second', self.calls)
+
+    def tearDown(self):
+        unstub()
+
+    def test_middleware_is_called_in_registration_order(self):
+        pipeline = CommandPipeline([self.first, self.second])
+        driver = Driver()
+        pipeline.install(driver)
+        self.assertEqual(driver.execute('getTitle'), {'value': 'getTitle'})
+        self.assertEqual(self.calls, ['first before getTitle',
+                                      'second before getTitle',
+                                      'second after getTitle',
+                                      'first after getTitle'])
+        self.assertEqual(driver.executed, [('getTitle', None)])
+
+    def test_middleware_can_change_command_and_result(self):
+        def rewrite(driver, command, params, execute):
+            return execute('get', {'url': params['url'].lower()})['value'] * 2
+
+        pipeline = CommandPipeline([rewrite])
+        driver = Driver()
+        pipeline.install(driver)
+        self.assertEqual(driver.execute('GET', {'url': 'HTTP://X'}), 'getget')
+        self.assertEqual(driver.executed, [('get', {'url': 'http://x'})])
+
+    def test_install_is_idempotent_and_middleware_is_dynamic(self):
+        pipeline = CommandPipeline()
+        driver = Driver()
+        pipeline.install(driver)
+        pipeline.install(driver)
+        pipeline.register(self.first)
+        driver.execute('quit')
+        pipeline.unregister(self.first)
+        driver.execute('quit')
+        self.assertEqual(self.calls, ['first before quit', 'first after quit'])
+        self.assertEqual(len(driver.executed), 2)
+
+    def test_new_pipeline_replaces_old_one(self):
+        driver = Driver()
+        CommandPipeline([self.first]).install(driver)
+        CommandPipeline([self.second]).install(driver)
+        driver.execute('quit')
+        self.assertEqual(self.calls, ['second before quit', 'second after quit'])
+        self.assertEqual(driver.executed, [('quit', None)])
+
+    def test_install_to_event_firing_webdriver(self):
+        pipeline = CommandPipeline([self.first])
+        driver = Driver()
+        pipeline.install(EventFiringWebDriver(driver, AbstractEventListener()))
+        driver.execute('quit')
+        self.assertEqual(self.calls, ['first before quit', 'first after quit'])
+
+    def test_middleware_must_be_callable(self):
+        with self.assertRaises(TypeError) as error:
+            CommandPipeline().register('not callable')
+        self.assertEqual(str(error.exception),
+                         'Middleware must be callable, got str.')
+
+    def test_speed_middleware(self):
+        import time
+        ctx = mock()
+        ctx.speed = 0.0
+        when(time).sleep(0.2).thenReturn(None)
+        pipeline = CommandPipeline([SpeedMiddleware(ctx)])
+        driver = Driver()
+        pipeline.install(driver)
+        driver.execute('getTitle')
+        ctx.speed = 0.2
+        driver.execute('getTitle')
+        verify(time, times=1).sleep(0.2)
+
+    def test_library_registers_middleware(self):
+        sl = SeleniumLibrary()
+        driver = Driver()
+        sl.register_driver(driver, 'alias')
+        sl.register_command_middleware(self.first)
+        driver.execute('quit')
+        sl.unregister_command_middleware(self.first)
+        driver.execute('quit')
+        self.assertEqual(self.calls, ['first before quit', 'first after quit'])
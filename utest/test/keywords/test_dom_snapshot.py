@@ -0,0 +1,50 @@
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from mockito import mock, unstub, verify, when
+
+from SeleniumLibrary.keywords import ScreenshotKeywords
+from SeleniumLibrary.keywords.screenshot import DOM_SNAPSHOT_SCRIPT
+
+HTML = u'<!DOCTYPE html>\n<html><body style="color:red">\xe4</body></html>'
+
+
+class CaptureDomSnapshotTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.ctx = mock()
+        self.ctx._drivers = mock()
+        self.ctx._drivers.current = True
+        self.ctx.driver = mock()
+        self.ctx.screenshot_root_directory = self.directory
+        self.ctx._screenshot_writer = None
+        when(self.ctx.driver).execute_script(DOM_SNAPSHOT_SCRIPT).thenReturn(HTML)
+        self.screenshot = ScreenshotKeywords(self.ctx)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        unstub()
+
+    def test_snapshot_is_not_compressed_by_default(self):
+        path = self.screenshot.capture_dom_snapshot()
+        self.assertEqual(path, os.path.join(self.directory,
+                                            'selenium-dom-snapshot-1.html'))
+        with open(path, 'rb') as snapshot:
+            self.assertEqual(snapshot.read().decode('UTF-8'), HTML)
+        self.assertEqual(os.path.basename(self.screenshot.capture_dom_snapshot()),
+                         'selenium-dom-snapshot-2.html')
+        verify(self.ctx.driver, times=2).execute_script(DOM_SNAPSHOT_SCRIPT)
+
+    def test_compressed_snapshot(self):
+        path = self.screenshot.capture_dom_snapshot('snapshot.html.gz')
+        with gzip.open(path, 'rb') as snapshot:
+            self.assertEqual(snapshot.read().decode('UTF-8'), HTML)
+
+    def test_no_browser(self):
+        self.ctx._drivers.current = None
+        self.assertIsNone(self.screenshot.capture_dom_snapshot())
+        verify(self.ctx.driver, times=0).execute_script(DOM_SNAPSHOT_SCRIPT)
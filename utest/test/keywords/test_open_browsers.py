@@ -0,0 +1,106 @@
+import threading
+import time
+import unittest
+
+from mockito import mock, unstub, verify, when
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import BrowserManagementKeywords
+
+
+class DriverMaker(object):
+
+    def __init__(self, delay=0.2, fail=None):
+        self.delay = delay
+        self.fail = fail
+        self.created = []
+        self.lock = threading.Lock()
+
+    def __call__(self, browser, desired_capabilities, profile_dir, remote,
+                 options, service_log_path):
+        time.sleep(self.delay)
+        if browser == self.fail:
+            raise RuntimeError('Cannot start %s.' % browser)
+        driver = mock()
+        driver.browser = browser
+        driver.options = options
+        driver.remote = remote
+        with self.lock:
+            self.created.append(driver)
+        return driver
+
+
+class OpenBrowsersTests(unittest.TestCase):
+
+    def setUp(self):
+        self.sl = SeleniumLibrary()
+        self.bm = BrowserManagementKeywords(self.sl)
+        self.maker = DriverMaker()
+        self.bm._make_driver = self.maker
+
+    def tearDown(self):
+        unstub()
+
+    def test_browsers_are_opened_concurrently_and_registered_in_order(self):
+        start = time.time()
+        indices = self.bm.open_browsers(
+            ['http://one', 'chrome', 'one', 'add_argument("x")'],
+            {'url': 'http://two', 'browser': 'ff', 'alias': 'two',
+             'remote_url': 'http://grid'},
+            ['http://three', 'edge'])
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual(indices, [1, 2, 3])
+        drivers = self.sl._drivers.active_drivers
+        self.assertEqual([d.browser for d in drivers], ['chrome', 'ff', 'edge'])
+        self.assertEqual(drivers[0].options, 'add_argument("x")')
+        self.assertEqual(drivers[1].remote, 'http://grid')
+        self.assertEqual(drivers[2].remote, False)
+        verify(drivers[0]).get('http://one')
+        verify(drivers[1]).get('http://two')
+        self.assertEqual(self.sl._drivers.get_index('two'), 2)
+        self.assertIs(self.sl.driver, drivers[2])
+
+    def test_defaults(self):
+        self.bm.open_browsers([], {'alias': 'x'})
+        drivers = self.sl._drivers.active_drivers
+        self.assertEqual([d.browser for d in drivers], ['firefox', 'firefox'])
+
+    def test_existing_alias_is_reused(self):
+        self.bm.open_browsers(['http://one', 'chrome', 'one'])
+        first = self.sl.driver
+        indices = self.bm.open_browsers(['http://new', 'chrome', 'one'],
+                                        ['http://two', 'chrome', 'two'])
+        self.assertEqual(indices, [1, 2])
+        self.assertEqual(len(self.maker.created), 2)
+        verify(first).get('http://new')
+
+    def test_created_browsers_are_closed_when_one_fails(self):
+        self.maker.fail = 'ie'
+        with self.assertRaises(RuntimeError) as error:
+            self.bm.open_browsers(['http://one', 'chrome'], ['http://two', 'ie'],
+                                  ['http://three', 'edge'])
+        self.assertEqual(str(error.exception), 'Cannot start ie.')
+        for driver in self.maker.created:
+            verify(driver).quit()
+        self.assertEqual(self.sl._drivers.active_drivers, [])
+
+    def test_url_failure_is_reported_after_registration(self):
+        driver = mock()
+        when(driver).get('http://broken').thenRaise(RuntimeError('Bad url'))
+        self.bm._make_driver = lambda *args: driver
+        with self.assertRaises(RuntimeError):
+            self.bm.open_browsers(['http://broken', 'chrome'])
+        self.assertEqual(self.sl._drivers.active_drivers, [driver])
+
+    def test_invalid_specification(self):
+        with self.assertRaises(ValueError) as error:
+            self.bm.open_browsers('http://example.com')
+        self.assertEqual(str(error.exception),
+                         "Browser must be specified as a dictionary or as a "
+                         "list of url, browser, alias, options, got "
+                         "'http://example.com'.")
+        with self.assertRaises(ValueError) as error:
+            self.bm.open_browsers({'url': 'x', 'brwoser': 'chrome'})
+        self.assertEqual(str(error.exception),
+                         'Browser specification contains invalid argument: '
+                         'brwoser.')
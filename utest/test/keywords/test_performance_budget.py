@@ -0,0 +1,65 @@
+import time
+import unittest
+
+from mockito import unstub, when
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import PerformanceKeywords
+
+
+class Driver(object):
+
+    def execute(self, command, params=None):
+        return {'value': None}
+
+
+class PerformanceBudgetTests(unittest.TestCase):
+
+    def setUp(self):
+        self.sl = SeleniumLibrary()
+        self.driver = Driver()
+        self.sl.register_driver(self.driver, None)
+        self.performance = PerformanceKeywords(self.sl)
+
+    def tearDown(self):
+        unstub()
+
+    def test_budget_not_started(self):
+        with self.assertRaises(RuntimeError) as error:
+            self.performance.performance_budget_should_not_exceed(commands=1)
+        self.assertEqual(str(error.exception),
+                         'Performance budget has not been started.')
+
+    def test_commands_within_budget(self):
+        self.driver.execute('getTitle')
+        self.performance.start_performance_budget()
+        self.driver.execute('getTitle')
+        self.driver.execute('getTitle')
+        self.performance.performance_budget_should_not_exceed(commands='2')
+
+    def test_commands_exceed_budget(self):
+        self.performance.start_performance_budget()
+        for _ in range(3):
+            self.driver.execute('findElement')
+        with self.assertRaises(AssertionError) as error:
+            self.performance.performance_budget_should_not_exceed(commands=2)
+        self.assertEqual(str(error.exception),
+                         'Performance budget exceeded: 3 WebDriver commands '
+                         'exceeded the budget of 2.')
+
+    def test_time_exceeds_budget(self):
+        when(time).time().thenReturn(100.0).thenReturn(103.5)
+        self.performance.start_performance_budget()
+        with self.assertRaises(AssertionError) as error:
+            self.performance.performance_budget_should_not_exceed(
+                commands=10, time='2s')
+        self.assertEqual(str(error.exception),
+                         'Performance budget exceeded: Elapsed time 3 seconds '
+                         '500 milliseconds exceeded the budget of 2 seconds.')
+
+    def test_restart_resets_measurement(self):
+        self.performance.start_performance_budget()
+        self.driver.execute('findElement')
+        self.performance.start_performance_budget()
+        self.performance.performance_budget_should_not_exceed(commands=0)
+        self.assertEqual(len(self.sl._command_pipeline.middleware), 2)
@@ -0,0 +1,90 @@
+import unittest
+
+import urllib3
+from mockito import ANY, mock, unstub, when
+from robot.errors import DataError
+from selenium import webdriver
+from selenium.webdriver.remote import remote_connection
+
+from SeleniumLibrary.keywords import RemoteConnectionPool, WebDriverCreator
+from SeleniumLibrary.keywords.webdrivertools.pooledconnection import \
+    PooledRemoteConnection
+
+
+class RemoteConnectionPoolTests(unittest.TestCase):
+
+    def tearDown(self):
+        unstub()
+
+    def test_defaults(self):
+        for config in (True, 'True', None, {}):
+            pool = RemoteConnectionPool(config)
+            self.assertEqual(pool.config, RemoteConnectionPool.defaults)
+
+    def test_config_as_string(self):
+        pool = RemoteConnectionPool('pool_size:4, timeout:2 minutes,'
+                                    'connect_timeout:5s,retries:1')
+        self.assertEqual(pool.config, {'pool_size': 4, 'timeout': 120.0,
+                                       'connect_timeout': 5.0, 'retries': 1})
+
+    def test_config_as_dictionary(self):
+        pool = RemoteConnectionPool({'pool_size': '2', 'timeout': 'None'})
+        self.assertEqual(pool.config['pool_size'], 2)
+        self.assertIsNone(pool.config['timeout'])
+
+    def test_old_selenium_is_not_supported(self):
+        module_urllib3 = remote_connection.urllib3
+        del remote_connection.urllib3
+        try:
+            with self.assertRaises(DataError) as error:
+                RemoteConnectionPool(True)
+        finally:
+            remote_connection.urllib3 = module_urllib3
+        self.assertEqual(str(error.exception), 'Remote connection pool '
+                         'requires Selenium 3.14 or newer.')
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError) as error:
+            RemoteConnectionPool('size:2')
+        self.assertEqual(str(error.exception),
+                         "Invalid remote connection pool option 'size'. Valid "
+                         "options are connect_timeout, pool_size, retries, "
+                         "timeout.")
+        with self.assertRaises(ValueError) as error:
+            RemoteConnectionPool('pool_size')
+        self.assertEqual(str(error.exception),
+                         "Invalid remote connection pool option 'pool_size'. "
+                         "Options must be given in format 'name:value'.")
+
+    def test_pool_manager(self):
+        pool = RemoteConnectionPool('pool_size:4,timeout:30,retries:2')
+        manager = pool.pool_manager
+        self.assertIs(pool.pool_manager, manager)
+        self.assertEqual(manager.connection_pool_kw['maxsize'], 4)
+        self.assertEqual(manager.connection_pool_kw['timeout'].read_timeout, 30)
+        self.assertEqual(manager.connection_pool_kw['retries'].total, 2)
+        pool.close()
+        self.assertIsNot(pool.pool_manager, manager)
+
+    def test_executors_share_pool_manager(self):
+        pool = RemoteConnectionPool(True)
+        first = pool.create_executor('https://grid:4444/wd/hub')
+        second = pool.create_executor('https://grid:4444/wd/hub')
+        self.assertIsInstance(first, PooledRemoteConnection)
+        self.assertTrue(first.keep_alive)
+        self.assertIs(first._conn, second._conn)
+        self.assertIsInstance(first._conn, urllib3.PoolManager)
+
+    def test_creator_uses_pooled_executor(self):
+        pool = RemoteConnectionPool(True)
+        executor = mock()
+        when(pool).create_executor('http://grid').thenReturn(executor)
+        creator = WebDriverCreator('/log/dir', remote_connection_pool=pool)
+        driver = mock()
+        when(webdriver).Remote(command_executor=executor, browser_profile=None,
+                               options=None, file_detector=ANY,
+                               desired_capabilities={'browserName': 'chrome'}
+                               ).thenReturn(driver)
+        result = creator._remote(
+            {'desired_capabilities': {'browserName': 'chrome'}}, 'http://grid')
+        self.assertIs(result, driver)
@@ -0,0 +1,101 @@
+import unittest
+
+from mockito import ANY, mock, unstub, verify, when
+from robot.libraries.BuiltIn import BuiltIn
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import RunOnFailurePolicy
+from SeleniumLibrary.keywords.runonfailure import PAGE_STATE_SCRIPT
+
+
+class RunOnFailurePolicyTests(unittest.TestCase):
+
+    def tearDown(self):
+        unstub()
+
+    def test_disabled_by_default(self):
+        for config in None, '', 'NONE', False:
+            self.assertFalse(RunOnFailurePolicy(config).enabled)
+
+    def test_parse_config(self):
+        policy = RunOnFailurePolicy('max_per_test: 3, skip_in_retry:True')
+        self.assertEqual(policy.config, {'max_per_test': 3,
+                                         'skip_unchanged': False,
+                                         'skip_in_retry': True})
+        self.assertTrue(policy.enabled)
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError) as error:
+            RunOnFailurePolicy('max:3')
+        self.assertEqual(str(error.exception),
+                         "Invalid run-on-failure policy option 'max'. Valid "
+                         "options are max_per_test, skip_in_retry, "
+                         "skip_unchanged.")
+        with self.assertRaises(ValueError):
+            RunOnFailurePolicy('max_per_test')
+
+    def test_max_per_test(self):
+        policy = RunOnFailurePolicy('max_per_test:2')
+        policy.start_scope('Suite.Test 1')
+        self.assertEqual([policy.should_run() for _ in range(3)],
+                         [True, True, False])
+        policy.start_scope('Suite.Test 2')
+        self.assertTrue(policy.should_run())
+
+    def test_skip_in_retry(self):
+        policy = RunOnFailurePolicy('skip_in_retry:yes')
+        policy.start_keyword('BuiltIn.Wait Until Keyword Succeeds', {})
+        policy.start_keyword('SeleniumLibrary.Click Element', {})
+        self.assertFalse(policy.should_run())
+        policy.end_keyword('SeleniumLibrary.Click Element', {})
+        policy.end_keyword('BuiltIn.Wait Until Keyword Succeeds', {})
+        self.assertTrue(policy.should_run())
+
+    def test_skip_unchanged(self):
+        policy = RunOnFailurePolicy('skip_unchanged:true')
+        driver = mock()
+        when(driver).execute_script(PAGE_STATE_SCRIPT).thenReturn(
+            ['http://a', 10, 42]).thenReturn(['http://a', 10, 42]).thenReturn(
+            ['http://a', 11, 43])
+        self.assertTrue(policy.should_run(driver))
+        self.assertFalse(policy.should_run(driver))
+        self.assertTrue(policy.should_run(driver))
+
+    def test_page_state_errors_do_not_skip(self):
+        policy = RunOnFailurePolicy('skip_unchanged:true')
+        driver = mock()
+        when(driver).execute_script(PAGE_STATE_SCRIPT).thenRaise(
+            Exception('Alert is open'))
+        self.assertTrue(policy.should_run(driver))
+        self.assertTrue(policy.should_run(driver))
+
+    def test_failure_occurred_uses_policy(self):
+        when(BuiltIn).run_keyword(ANY).thenReturn(None)
+        sl = SeleniumLibrary(run_on_failure_policy='max_per_test:1')
+        sl.failure_occurred()
+        sl.failure_occurred()
+        verify(BuiltIn, times=1).run_keyword('Capture Page Screenshot')
+        sl.ROBOT_LIBRARY_LISTENER[0].start_test('Test', {'longname': 'Suite.Test'})
+        sl.failure_occurred()
+        verify(BuiltIn, times=2).run_keyword('Capture Page Screenshot')
+        self.assertIsNone(SeleniumLibrary()._run_on_failure_policy)
+
+    def test_suite_teardown_does_not_inherit_count_of_last_test(self):
+        when(BuiltIn).run_keyword(ANY).thenReturn(None)
+        sl = SeleniumLibrary(run_on_failure_policy='max_per_test:1')
+        listener = sl.ROBOT_LIBRARY_LISTENER[0]
+        listener.start_test('Test', {'longname': 'Suite.Test'})
+        sl.failure_occurred()
+        sl.failure_occurred()
+        listener.end_test('Test', {'longname': 'Suite.Test'})
+        sl.failure_occurred()
+        verify(BuiltIn, times=2).run_keyword('Capture Page Screenshot')
+
+    def test_parent_suite_teardown_does_not_inherit_count_of_child(self):
+        when(BuiltIn).run_keyword(ANY).thenReturn(None)
+        sl = SeleniumLibrary(run_on_failure_policy='max_per_test:1')
+        listener = sl.ROBOT_LIBRARY_LISTENER[0]
+        sl.failure_occurred()
+        listener.end_suite('Child', {'longname': 'Parent.Child'})
+        sl.failure_occurred()
+        verify(BuiltIn, times=2).run_keyword('Capture Page Screenshot')
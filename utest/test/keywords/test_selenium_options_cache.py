@@ -0,0 +1,52 @@
+import unittest
+
+from mockito import unstub, when, ANY
+from selenium import webdriver
+
+from SeleniumLibrary.keywords.webdrivertools import SeleniumOptions
+
+
+class SeleniumOptionsCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.options = SeleniumOptions()
+
+    def test_parsed_options_are_cached(self):
+        options = 'add_argument("--cached");add_experimental_option("key", 1)'
+        first = self.options.create('chrome', options)
+        when(self.options)._split(ANY).thenRaise(AssertionError('Not cached'))
+        try:
+            second = self.options.create('chrome', options)
+        finally:
+            unstub()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.arguments, ['--cached'])
+        self.assertEqual(second.experimental_options, {'key': 1})
+        self.assertEqual(self.options._parse(options),
+                         [{'add_argument': ['--cached']},
+                          {'add_experimental_option': ['key', 1]}])
+
+    def test_cached_arguments_are_not_shared(self):
+        options = 'add_experimental_option("prefs", "cached")'
+        SeleniumOptions._compiled_options[options] = (
+            ('add_experimental_option', ('prefs', {'key': 'value'})),)
+        try:
+            first = self.options._parse(options)
+            first[0]['add_experimental_option'][1]['key'] = 'changed'
+            second = self.options._parse(options)
+        finally:
+            del SeleniumOptions._compiled_options[options]
+        self.assertEqual(second,
+                         [{'add_experimental_option': ['prefs', {'key': 'value'}]}])
+
+    def test_parse_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.options._parse('method(not_valid)')
+        self.assertNotIn('method(not_valid)', self.options._compiled_options)
+
+    def test_options_classes_are_cached(self):
+        self.assertIs(self.options._import_options('chrome'),
+                      webdriver.ChromeOptions)
+        self.assertIs(SeleniumOptions._options_classes['chrome'],
+                      webdriver.ChromeOptions)
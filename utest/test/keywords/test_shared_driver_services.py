@@ -0,0 +1,143 @@
+import unittest
+
+from mockito import ANY, mock, unstub, verify, when
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+
+from SeleniumLibrary.keywords import SharedDriverServices, WebDriverCreator
+
+
+class FakeProcess(object):
+
+    def __init__(self, running=True):
+        self.running = running
+
+    def poll(self):
+        return None if self.running else 1
+
+
+class FakeService(object):
+    started = []
+
+    def __init__(self, executable, log_path=None):
+        self.executable = executable
+        self.log_path = log_path
+        self.service_url = 'http://localhost:%s' % (len(self.started) + 9515)
+        self.process = None
+        self.stopped = False
+
+    def start(self):
+        self.process = FakeProcess()
+        self.started.append(self)
+
+    def is_connectable(self):
+        return True
+
+    def stop(self):
+        self.stopped = True
+
+
+class FakeConnection(object):
+
+    def __init__(self, remote_server_addr, keep_alive):
+        self.url = remote_server_addr
+
+
+class SharedDriverServicesTests(unittest.TestCase):
+
+    def setUp(self):
+        FakeService.started = []
+        self.services = SharedDriverServices()
+        self.services.drivers = {
+            'chrome': (FakeService, 'chromedriver', FakeConnection),
+            'firefox': (FakeService, 'geckodriver', FakeConnection)
+        }
+
+    def tearDown(self):
+        unstub()
+
+    def test_chrome_sessions_share_service(self):
+        first, second = mock(), mock()
+        when(webdriver).Remote(command_executor=ANY,
+                               desired_capabilities={'browserName': 'chrome'}
+                               ).thenReturn(first).thenReturn(second)
+        capabilities = {'browserName': 'chrome'}
+        self.assertIs(self.services.create_chrome(capabilities), first)
+        self.assertIs(self.services.create_chrome(capabilities), second)
+        self.assertEqual(len(FakeService.started), 1)
+        self.assertFalse(first._is_remote)
+
+    def test_chrome_options_are_merged_to_capabilities(self):
+        options = webdriver.ChromeOptions()
+        options.add_argument('--headless')
+        expected = {'key': 'value'}
+        expected.update(options.to_capabilities())
+        driver = mock()
+        when(webdriver).Remote(command_executor=ANY,
+                               desired_capabilities=expected).thenReturn(driver)
+        self.assertIs(self.services.create_chrome({'key': 'value'}, options),
+                      driver)
+
+    def test_dead_service_is_replaced(self):
+        when(webdriver).Remote(command_executor=ANY,
+                               desired_capabilities=ANY).thenReturn(mock())
+        self.services.create_chrome()
+        FakeService.started[0].process.running = False
+        self.services.create_chrome(service_log_path='chromedriver.log')
+        self.assertEqual(len(FakeService.started), 2)
+        self.assertEqual(FakeService.started[1].log_path, 'chromedriver.log')
+        self.assertEqual(self.services._services['chrome'],
+                         [FakeService.started[1]])
+
+    def test_busy_firefox_service_starts_new_one(self):
+        driver = mock()
+        when(webdriver).Remote(command_executor=ANY, desired_capabilities=ANY)\
+            .thenReturn(mock())\
+            .thenRaise(SessionNotCreatedException('Session is already started'))\
+            .thenReturn(driver)
+        self.services.create_firefox()
+        self.assertIs(self.services.create_firefox(profile=None,
+                                                   service_log_path='gd.log'),
+                      driver)
+        self.assertEqual(len(FakeService.started), 2)
+
+    def test_close_stops_services(self):
+        when(webdriver).Remote(command_executor=ANY,
+                               desired_capabilities=ANY).thenReturn(mock())
+        self.services.create_chrome()
+        self.services.create_firefox()
+        self.services.close()
+        self.assertTrue(all(service.stopped for service in FakeService.started))
+        self.assertEqual(self.services._services, {})
+
+
+class WebDriverCreatorWithSharedServicesTests(unittest.TestCase):
+
+    def tearDown(self):
+        unstub()
+
+    def test_chrome_uses_shared_service(self):
+        services = mock()
+        driver = mock()
+        when(services).create_chrome({'key': 'value'}, None, None).thenReturn(driver)
+        creator = WebDriverCreator('/log/dir', services)
+        result = creator.create_chrome({'desired_capabilities': {'key': 'value'}}, None)
+        self.assertIs(result, driver)
+
+    def test_remote_chrome_does_not_use_shared_service(self):
+        services = mock()
+        creator = WebDriverCreator('/log/dir', services)
+        driver = mock()
+        when(creator)._remote(ANY, 'http://grid', options=None).thenReturn(driver)
+        self.assertIs(creator.create_chrome({}, 'http://grid'), driver)
+        verify(services, times=0).create_chrome(ANY, ANY, ANY)
+
+    def test_firefox_uses_shared_service(self):
+        services = mock()
+        profile = mock()
+        driver = mock()
+        creator = WebDriverCreator('/log/dir', services)
+        when(creator)._get_ff_profile(None).thenReturn(profile)
+        when(services).create_firefox(None, None, profile, 'gd.log').thenReturn(driver)
+        self.assertIs(creator.create_firefox({}, None, None,
+                                             service_log_path='gd.log'), driver)
@@ -0,0 +1,63 @@
+import pytest
+from mockito import any as ANY, mock, unstub, verify, when
+from selenium.common.exceptions import StaleElementReferenceException
+
+from SeleniumLibrary.keywords import WaitingKeywords
+from SeleniumLibrary.keywords.waiting import WAIT_FOR_MUTATION_SCRIPT
+
+TIMEOUT = 5.0
+
+
+@pytest.fixture(scope='function')
+def waiting():
+    ctx = mock()
+    ctx.driver = mock()
+    ctx.timeout = TIMEOUT
+    return WaitingKeywords(ctx)
+
+
+def teardown_function():
+    unstub()
+
+
+def test_attribute_matches(waiting):
+    element = mock()
+    when(waiting).find_element('id:foo').thenReturn(element)
+    when(waiting.driver).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, element, 'attribute', 'aria-busy', 'false',
+        1000).thenReturn(True)
+    waiting.wait_until_element_attribute_is('id:foo', 'aria-busy', 'false', '1s')
+    verify(waiting.driver, times=0).set_script_timeout(ANY())
+
+
+def test_attribute_timeout(waiting):
+    when(waiting).find_element('id:foo').thenReturn(mock())
+    when(waiting.driver).execute_async_script(*[ANY()] * 6).thenReturn(False)
+    with pytest.raises(AssertionError) as error:
+        waiting.wait_until_element_attribute_is('id:foo', 'class', 'done', '1s')
+    assert str(error.value) == ("Element 'id:foo' attribute 'class' did not "
+                                "become 'done' in 1 second.")
+    with pytest.raises(AssertionError) as error:
+        waiting.wait_until_element_attribute_is('id:foo', 'class', 'done',
+                                                '1s', 'Custom error')
+    assert str(error.value) == 'Custom error'
+
+
+def test_property_extends_and_restores_script_timeout(waiting):
+    element = mock()
+    when(waiting).find_element('id:foo').thenReturn(element)
+    when(waiting.driver).execute_async_script(
+        WAIT_FOR_MUTATION_SCRIPT, element, 'property', 'disabled', False,
+        10000).thenReturn(True)
+    waiting.wait_until_element_property_is('id:foo', 'disabled', False, '10s')
+    verify(waiting.driver).set_script_timeout(11.0)
+    verify(waiting.driver).set_script_timeout(TIMEOUT)
+
+
+def test_property_stale_element(waiting):
+    when(waiting).find_element('id:foo').thenReturn(mock())
+    when(waiting.driver).execute_async_script(*[ANY()] * 6).thenRaise(
+        StaleElementReferenceException('Darn'))
+    with pytest.raises(AssertionError) as error:
+        waiting.wait_until_element_property_is('id:foo', 'value', 'x', '1s')
+    assert "property 'value' did not become 'x'" in str(error.value)
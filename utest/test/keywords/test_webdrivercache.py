@@ -1,10 +1,19 @@
+import time
 import unittest
 
 from mockito import mock, verify, when, unstub
 from robot.utils.connectioncache import NoConnection
 from selenium.common.exceptions import TimeoutException, RemoteDriverServerException
 
-from SeleniumLibrary.keywords import WebDriverCache
+from SeleniumLibrary.keywords import BrowserPool, WebDriverCache
+
+
+class SlowDriver(object):
+    quitted = False
+
+    def quit(self):
+        time.sleep(0.1)
+        self.quitted = True
 
 
 class WebDriverCacheTests(unittest.TestCase):
@@ -220,6 +229,17 @@ class WebDriverCacheTests(unittest.TestCase):
         cache.close_all()
         self.verify_cache(cache)
 
+    def test_close_all_quits_concurrently(self):
+        cache = WebDriverCache()
+        drivers = [SlowDriver() for _ in range(4)]
+        for driver in drivers:
+            cache.register(driver)
+        start = time.time()
+        cache.close_all()
+        self.assertLess(time.time() - start, 0.35)
+        self.assertTrue(all(driver.quitted for driver in drivers))
+        self.verify_cache(cache)
+
     def test_close_quite_fails(self):
         cache = WebDriverCache()
         driver = mock()
@@ -239,6 +259,38 @@ class WebDriverCacheTests(unittest.TestCase):
         self.assertTrue(isinstance(cache.current, NoConnection))
         self.assertTrue(driver in cache._closed)
 
+    def test_close_releases_browser_to_pool(self):
+        pool = BrowserPool(reuse=True)
+        cache = WebDriverCache(pool)
+        driver = mock()
+        when(pool).release(driver).thenReturn(True)
+        cache.register(driver, 'bar')
+        cache.close()
+        verify(driver, times=0).quit()
+        self.assertTrue(driver in cache._closed)
+
+    def test_register_reused_browser(self):
+        cache = WebDriverCache()
+        driver = mock()
+        cache.register(driver, 'first')
+        cache.close()
+        index = cache.register(driver, 'second')
+        self.assertEqual(index, 2)
+        self.assertEqual(cache.active_drivers, [driver])
+        self.assertEqual(cache.active_driver_ids, [2])
+        self.assertIsNone(cache.get_index(1))
+        self.assertEqual(cache.get_index('second'), 2)
+
+    def test_switch_to_reused_browser_index(self):
+        cache = WebDriverCache()
+        driver = mock()
+        cache.register(driver, 'first')
+        cache.close()
+        cache.register(driver, 'second')
+        self.assertRaises(RuntimeError, cache.switch, 1)
+        self.assertRaises(RuntimeError, cache.switch, 'first')
+        self.assertIs(cache.switch(2), driver)
+
     def verify_cache(self, cache):
         self.assertEqual(cache._connections, [])
         self.assertEqual(cache._aliases, {})
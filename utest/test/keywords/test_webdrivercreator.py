@@ -215,12 +215,54 @@ def test_firefox(creator):
     verify(webdriver).FirefoxProfile()
 
 
-def test_get_ff_profile_real_path(creator):
-    profile_path = '/path/to/profile'
-    profile_mock = mock()
-    when(webdriver).FirefoxProfile(profile_path).thenReturn(profile_mock)
-    profile = creator._get_ff_profile(profile_path)
-    assert profile == profile_mock
+def test_get_ff_profile_real_path(creator, tmpdir):
+    creator.ff_profiles.clear()
+    profile_dir = tmpdir.mkdir('profile')
+    profile_dir.join('user.js').write('user_pref("key", "value");\n')
+    profile = creator._get_ff_profile(str(profile_dir))
+    assert isinstance(profile, webdriver.FirefoxProfile)
+    assert profile.default_preferences['key'] == 'value'
+    assert os.path.isdir(profile.path)
+
+
+def test_get_ff_profile_real_path_is_cached(creator, tmpdir):
+    creator.ff_profiles.clear()
+    profile_dir = tmpdir.mkdir('profile')
+    profile_dir.join('user.js').write('user_pref("key", "value");\n')
+    first = creator._get_ff_profile(str(profile_dir))
+    when(webdriver).FirefoxProfile(str(profile_dir)).thenRaise(
+        AssertionError('Profile should be cached'))
+    second = creator._get_ff_profile(str(profile_dir))
+    assert second is not first
+    assert second.encoded == first.encoded
+    assert second.path != first.path
+
+
+def test_get_ff_profile_cache_is_invalidated_when_directory_changes(creator, tmpdir):
+    creator.ff_profiles.clear()
+    profile_dir = tmpdir.mkdir('profile')
+    profile_dir.join('user.js').write('user_pref("key", "value");\n')
+    first = creator._get_ff_profile(str(profile_dir))
+    profile_dir.join('prefs.js').write('user_pref("other", "value");\n')
+    second = creator._get_ff_profile(str(profile_dir))
+    assert second.encoded != first.encoded
+
+
+def test_get_ff_profile_options_are_cached(creator):
+    creator.ff_profiles.clear()
+    profile = mock()
+    options = 'set_preference("key", "value")'
+    when(webdriver).FirefoxProfile(options).thenRaise(OSError('Not a directory'))
+    when(webdriver).FirefoxProfile().thenReturn(profile)
+    profile.default_preferences = {}
+    profile.encoded = 'payload'
+    profile.path = None
+    profile.tempfolder = None
+    first = creator._get_ff_profile(options)
+    second = creator._get_ff_profile(options)
+    verify(webdriver, times=1).FirefoxProfile()
+    verify(profile, times=1).set_preference('key', 'value')
+    assert first.encoded == second.encoded == 'payload'
 
 
 def test_get_ff_profile_no_path(creator):
@@ -285,7 +327,7 @@ def test_firefox_profile(creator):
     expected_webdriver = mock()
     profile = mock()
     profile_dir = '/profile/dir'
-    when(webdriver).FirefoxProfile(profile_dir).thenReturn(profile)
+    when(creator)._get_ff_profile(profile_dir).thenReturn(profile)
     log_file = get_geckodriver_log()
     when(webdriver).Firefox(options=None, service_log_path=log_file,
                             firefox_profile=profile).thenReturn(expected_webdriver)
@@ -1,4 +1,5 @@
 import os
+import threading
 import unittest
 
 from mockito import mock, when, unstub, ANY
@@ -41,6 +42,57 @@ class WebDriverCreatorServiceLogPathTests(unittest.TestCase):
         file_name = self.creator._get_log_path(log_file)
         self.assertEqual(file_name, log_file.format(index='2'))
 
+    def test_log_file_with_index_reserved_while_creating_driver(self):
+        log_file = os.path.join(self.output_dir, 'reserved-{index}.log')
+        creator = WebDriverCreator(self.output_dir)
+        other = WebDriverCreator(self.output_dir)
+
+        def create_chrome(*args, **kwargs):
+            self.assertEqual(other._get_log_path(log_file),
+                             log_file.format(index='2'))
+            return kwargs['service_log_path']
+
+        creator.create_chrome = create_chrome
+        self.assertEqual(creator.create_driver('chrome', None, None,
+                                               service_log_path=log_file),
+                         log_file.format(index='1'))
+        self.assertEqual(WebDriverCreator._log_paths_in_use, set())
+        self.assertEqual(other._get_log_path(log_file),
+                         log_file.format(index='1'))
+
+    def test_log_file_with_index_reserved_by_concurrent_create_driver(self):
+        log_file = os.path.join(self.output_dir, 'concurrent-{index}.log')
+        creator = WebDriverCreator(self.output_dir)
+        lock = threading.Lock()
+        both_started = threading.Event()
+        started, paths, errors = [], [], []
+
+        def create_chrome(*args, **kwargs):
+            with lock:
+                started.append(kwargs['service_log_path'])
+                if len(started) == 2:
+                    both_started.set()
+            both_started.wait(5)
+            return kwargs['service_log_path']
+
+        def create_driver():
+            try:
+                paths.append(creator.create_driver('chrome', None, None,
+                                                   service_log_path=log_file))
+            except Exception as error:
+                errors.append(error)
+
+        creator.create_chrome = create_chrome
+        threads = [threading.Thread(target=create_driver) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(paths), [log_file.format(index='1'),
+                                         log_file.format(index='2')])
+        self.assertEqual(WebDriverCreator._log_paths_in_use, set())
+
     def test_create_chrome_with_service_log_path_none(self):
         expected_webdriver = mock()
         when(webdriver).Chrome(options=None, service_log_path=None).thenReturn(expected_webdriver)
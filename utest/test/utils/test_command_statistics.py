@@ -0,0 +1,94 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from mockito import unstub, when
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import CommandPipeline
+from SeleniumLibrary.utils import CommandStatistics
+
+
+class Driver(object):
+
+    def execute(self, command, params=None):
+        return {'value': None}
+
+    @property
+    def title(self):
+        return self.execute('getTitle')['value']
+
+
+class CommandStatisticsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.statistics = CommandStatistics()
+        self.driver = Driver()
+        CommandPipeline([self.statistics]).install(self.driver)
+
+    def tearDown(self):
+        unstub()
+
+    def test_commands_are_attributed_to_running_keyword(self):
+        self.driver.execute('findElement')
+        self.statistics.start_keyword('select_from_list_by_label')
+        self.driver.execute('findElement')
+        self.driver.execute('findChildElements')
+        self.statistics.start_keyword('capture_page_screenshot')
+        self.driver.execute('screenshot')
+        self.statistics.end_keyword()
+        self.driver.execute('clickElement')
+        self.statistics.end_keyword()
+        self.statistics.start_keyword('select_from_list_by_label')
+        self.driver.execute('clickElement')
+        self.statistics.end_keyword()
+        summary = self.statistics.get_summary()
+        self.assertEqual(summary['commands'], 5)
+        first, second = summary['keywords']
+        self.assertEqual(first['name'], 'Select From List By Label')
+        self.assertEqual(first['calls'], 2)
+        self.assertEqual(first['commands'], 4)
+        self.assertEqual(first['by_command'], {'findElement': 1,
+                                               'findChildElements': 1,
+                                               'clickElement': 2})
+        self.assertEqual(second['name'], 'Capture Page Screenshot')
+        self.assertEqual(second['commands'], 1)
+
+    def test_output(self):
+        self.assertEqual(CommandStatistics(True).output,
+                         'seleniumlibrary-commands.json')
+        self.assertEqual(CommandStatistics('true').output,
+                         'seleniumlibrary-commands.json')
+        self.assertEqual(CommandStatistics('stats.json').output, 'stats.json')
+
+    def test_write_summary(self):
+        output_dir = tempfile.mkdtemp()
+        try:
+            when(self.statistics)._get_output_dir().thenReturn(output_dir)
+            self.statistics.start_keyword('get_title')
+            self.driver.execute('getTitle')
+            self.statistics.end_keyword()
+            self.statistics.write_summary()
+            with open(os.path.join(output_dir,
+                                   'seleniumlibrary-commands.json')) as summary:
+                data = json.load(summary)
+            self.assertEqual(data['commands'], 1)
+            self.assertEqual(data['keywords'][0]['name'], 'Get Title')
+        finally:
+            shutil.rmtree(output_dir)
+
+    def test_library_counts_commands_per_keyword(self):
+        sl = SeleniumLibrary(command_statistics=True)
+        driver = Driver()
+        sl.register_driver(driver, None)
+        sl.run_keyword('get_title', [], {})
+        self.assertEqual(sl._command_statistics.get_summary()['keywords'][0]['name'],
+                         'Get Title')
+        self.assertEqual(sl._command_statistics.get_summary()['commands'], 1)
+
+    def test_disabled_by_default(self):
+        sl = SeleniumLibrary()
+        self.assertIsNone(sl._command_statistics)
+        self.assertEqual(len(sl._command_pipeline.middleware), 1)
@@ -0,0 +1,49 @@
+import threading
+import time
+import unittest
+
+from SeleniumLibrary.utils import run_concurrently
+
+
+class RunConcurrentlyTests(unittest.TestCase):
+
+    def test_results_are_in_order(self):
+        def square(value):
+            time.sleep(0.01 * (5 - value))
+            return value * value
+
+        results = run_concurrently(square, range(5))
+        self.assertEqual(results, [(value * value, None) for value in range(5)])
+
+    def test_errors_are_returned(self):
+        error = ValueError('bad')
+
+        def fail_on_odd(value):
+            if value % 2:
+                raise error
+            return value
+
+        results = run_concurrently(fail_on_odd, [0, 1, 2])
+        self.assertEqual(results, [(0, None), (None, error), (2, None)])
+
+    def test_runs_concurrently_with_bounded_threads(self):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def work(_):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+
+        start = time.time()
+        run_concurrently(work, range(8), max_workers=4)
+        self.assertLess(time.time() - start, 0.35)
+        self.assertEqual(max(max_running), 4)
+
+    def test_single_item_and_empty(self):
+        self.assertEqual(run_concurrently(str, [1]), [('1', None)])
+        self.assertEqual(run_concurrently(str, []), [])
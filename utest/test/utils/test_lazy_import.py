@@ -0,0 +1,57 @@
+import subprocess
+import sys
+import unittest
+from os.path import abspath, dirname, join
+
+from mockito import unstub, when
+from selenium.webdriver.support import ui
+
+from SeleniumLibrary.keywords.webdrivertools import sl_file_detector
+from SeleniumLibrary.utils import LazyImport
+
+SOURCE = join(dirname(abspath(__file__)), '..', '..', '..', 'src')
+
+
+class LazyImportTests(unittest.TestCase):
+
+    def tearDown(self):
+        unstub()
+
+    def test_module_is_imported_on_first_use(self):
+        lazy = LazyImport('colorsys')
+        self.assertIsNone(lazy._module)
+        self.assertEqual(lazy.rgb_to_hsv(0, 0, 0), (0, 0, 0))
+        self.assertEqual(lazy.target.__name__, 'colorsys')
+
+    def test_name_from_module(self):
+        Select = LazyImport('selenium.webdriver.support.ui', 'Select')
+        self.assertIs(Select.target, ui.Select)
+        when(ui).Select('element').thenReturn('select')
+        self.assertEqual(Select('element'), 'select')
+
+    def test_non_existing_attribute(self):
+        with self.assertRaises(AttributeError):
+            LazyImport('colorsys').not_here
+        with self.assertRaises(AttributeError):
+            LazyImport('colorsys').__not_here__
+
+    def test_file_detector_is_real_class(self):
+        from SeleniumLibrary.keywords.webdrivertools import \
+            SelLibLocalFileDetector
+        self.assertIs(SelLibLocalFileDetector,
+                      sl_file_detector.SelLibLocalFileDetector)
+
+        class Detector(SelLibLocalFileDetector):
+            pass
+
+        self.assertIsInstance(Detector(), SelLibLocalFileDetector)
+
+    @unittest.skipIf(sys.version_info < (3, 7),
+                     'Module level __getattr__ requires Python 3.7.')
+    def test_library_import_does_not_import_webdriver(self):
+        script = ('import sys, SeleniumLibrary\n'
+                  'print(sorted(m for m in sys.modules '
+                  'if m.startswith("selenium.webdriver")))')
+        output = subprocess.check_output([sys.executable, '-c', script],
+                                         cwd=abspath(SOURCE))
+        self.assertEqual(output.decode('ASCII').strip(), '[]')
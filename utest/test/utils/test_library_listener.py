@@ -0,0 +1,36 @@
+import unittest
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.utils import KeywordListener, LibraryListener
+
+
+class LibraryListenerTests(unittest.TestCase):
+
+    def test_no_keyword_listener_by_default(self):
+        listener = SeleniumLibrary().ROBOT_LIBRARY_LISTENER
+        self.assertIsInstance(listener, LibraryListener)
+        self.assertFalse(hasattr(listener, 'start_keyword'))
+        self.assertFalse(hasattr(listener, 'end_keyword'))
+
+    def test_keyword_listener_with_run_on_failure_policy(self):
+        library = SeleniumLibrary(run_on_failure_policy='max_per_test:1')
+        listeners = library.ROBOT_LIBRARY_LISTENER
+        self.assertEqual([type(listener) for listener in listeners],
+                         [LibraryListener, KeywordListener])
+
+    def test_close_calls_only_own_handlers(self):
+        first, second = LibraryListener(), LibraryListener()
+        closed = []
+        first.register_close(lambda: closed.append('first'))
+        second.register_close(lambda: closed.append('second'))
+        second.close()
+        self.assertEqual(closed, ['second'])
+
+    def test_keyword_events_go_only_to_own_instance(self):
+        first = SeleniumLibrary(timing_database='timings.db')
+        second = SeleniumLibrary(timing_database='timings.db')
+        attrs = {'elapsedtime': 100}
+        second.ROBOT_LIBRARY_LISTENER[1].start_keyword('Keyword', attrs)
+        second.ROBOT_LIBRARY_LISTENER[1].end_keyword('Keyword', attrs)
+        self.assertEqual(first._timing_recorder.keywords, {})
+        self.assertEqual(second._timing_recorder.keywords['Keyword'].count, 1)
@@ -0,0 +1,102 @@
+import base64
+import os
+import shutil
+import tempfile
+import unittest
+
+from mockito import ANY, mock, unstub, verify, when
+from robot.api import logger
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import ScreenshotKeywords
+from SeleniumLibrary.utils import ScreenshotWriter
+
+PNG = b'\x89PNG\r\n\x1a\nfake'
+DATA = base64.b64encode(PNG).decode('ASCII')
+
+
+class ScreenshotWriterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.writer = ScreenshotWriter()
+
+    def tearDown(self):
+        self.writer.close()
+        shutil.rmtree(self.directory)
+
+    def test_write(self):
+        path = os.path.join(self.directory, 'sub', 'shot.png')
+        self.writer.write(path, DATA)
+        self.writer.flush()
+        with open(path, 'rb') as png:
+            self.assertEqual(png.read(), PNG)
+        self.assertFalse(self.writer.is_pending(path))
+        self.assertEqual(self.writer.get_errors(), [])
+
+    def test_close_writes_pending_screenshots(self):
+        paths = [os.path.join(self.directory, '%d.png' % i) for i in range(5)]
+        for path in paths:
+            self.writer.write(path, DATA)
+        self.writer.close()
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+    def test_errors(self):
+        path = os.path.join(self.directory, 'shot.png')
+        os.mkdir(path)
+        self.writer.write(path, DATA)
+        self.writer.flush()
+        errors = self.writer.get_errors()
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Writing screenshot '%s' failed:" % path, errors[0])
+        self.assertEqual(self.writer.get_errors(), [])
+
+
+class BackgroundScreenshotTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.ctx = mock()
+        self.ctx._drivers = mock()
+        self.ctx._drivers.current = True
+        self.ctx.driver = mock()
+        self.ctx.screenshot_root_directory = self.directory
+        self.ctx._screenshot_writer = ScreenshotWriter()
+        self.ctx._running_on_failure_keyword = True
+        when(self.ctx.driver).get_screenshot_as_base64().thenReturn(DATA)
+        self.screenshot = ScreenshotKeywords(self.ctx)
+
+    def tearDown(self):
+        self.ctx._screenshot_writer.close()
+        shutil.rmtree(self.directory)
+        unstub()
+
+    def test_run_on_failure_screenshots_are_written_in_background(self):
+        first = self.screenshot.capture_page_screenshot()
+        second = self.screenshot.capture_page_screenshot()
+        self.assertEqual(first, os.path.join(self.directory,
+                                             'selenium-screenshot-1.png'))
+        self.assertEqual(second, os.path.join(self.directory,
+                                              'selenium-screenshot-2.png'))
+        self.ctx._screenshot_writer.flush()
+        for path in first, second:
+            with open(path, 'rb') as png:
+                self.assertEqual(png.read(), PNG)
+        verify(self.ctx.driver, times=0).save_screenshot(first)
+
+    def test_direct_screenshots_are_written_immediately(self):
+        self.ctx._running_on_failure_keyword = False
+        path = os.path.join(self.directory, 'selenium-screenshot-1.png')
+        when(self.ctx.driver).save_screenshot(path).thenReturn(True)
+        self.assertEqual(self.screenshot.capture_page_screenshot(), path)
+        verify(self.ctx.driver, times=0).get_screenshot_as_base64()
+
+    def test_errors_are_logged_when_library_is_closed(self):
+        blocker = os.path.join(self.directory, 'file')
+        open(blocker, 'w').close()
+        sl = SeleniumLibrary(background_screenshots=True)
+        sl._screenshot_writer.write(os.path.join(blocker, 'x.png'), DATA)
+        when(logger).warn(ANY)
+        sl._close_screenshot_writer()
+        verify(logger).warn(ANY)
+        self.assertEqual(sl._screenshot_writer.get_errors(), [])
@@ -0,0 +1,126 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from SeleniumLibrary.utils import TimingDatabase, TimingRecorder
+from SeleniumLibrary.utils.timingdatabase import main, TimingStatistics
+
+
+def statistics(*times):
+    stat = TimingStatistics()
+    for elapsed in times:
+        stat.add(elapsed)
+    return stat
+
+
+class TimingStatisticsTests(unittest.TestCase):
+
+    def test_add_and_merge(self):
+        stat = statistics(1.0, 3.0)
+        self.assertEqual(stat.mean, 2.0)
+        self.assertEqual(stat.variance, 2.0)
+        stat.merge(statistics(5.0))
+        self.assertEqual((stat.count, stat.minimum, stat.maximum), (3, 1.0, 5.0))
+        self.assertEqual(stat.mean, 3.0)
+        self.assertEqual(TimingStatistics().variance, 0.0)
+
+
+class TimingRecorderTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_keywords_and_locators_are_recorded(self):
+        recorder = TimingRecorder('timings.db')
+        recorder._output_dir = self.directory
+        recorder._run_name = 'Suite'
+        recorder.end_keyword('SeleniumLibrary.Click Element',
+                             {'elapsedtime': 1500})
+        recorder.end_keyword('SeleniumLibrary.Click Element',
+                             {'elapsedtime': 500})
+        find = recorder.trace(lambda locator, tag=None: 'element')
+        self.assertEqual(find('id:foo', tag='a'), 'element')
+        find(object())
+        self.assertEqual(recorder.keywords['SeleniumLibrary.Click Element'].mean,
+                         1.0)
+        self.assertEqual(list(recorder.locators), ['id:foo'])
+        path = recorder.write()
+        self.assertEqual(path, os.path.join(self.directory, 'timings.db'))
+        with TimingDatabase(path) as database:
+            runs = database.get_runs(10)
+            timings = database.get_timings(runs)
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(
+            sorted(timings),
+            [('keyword', 'SeleniumLibrary.Click Element'), ('locator', 'id:foo')])
+        self.assertEqual(timings[('keyword',
+                                  'SeleniumLibrary.Click Element')].count, 2)
+
+
+class TimingDatabaseCompareTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'timings.db')
+        self.database = TimingDatabase(self.path)
+
+    def tearDown(self):
+        self.database.close()
+        shutil.rmtree(self.directory)
+
+    def add_run(self, keyword_times, locator_times=(0.1, 0.1), name='Suite'):
+        self.database.add_run(name, {'Open': statistics(*keyword_times)},
+                              {'css:.row': statistics(*locator_times)})
+
+    def test_not_enough_runs(self):
+        self.assertEqual(self.database.compare(), [])
+        self.add_run([1.0])
+        self.assertEqual(self.database.compare(), [])
+
+    def test_significant_slowdown_is_reported(self):
+        for _ in range(3):
+            self.add_run([1.0, 1.1, 0.9])
+        self.add_run([2.0, 2.1, 1.9])
+        slowdowns = self.database.compare()
+        self.assertEqual([(s.kind, s.name) for s in slowdowns],
+                         [('keyword', 'Open')])
+        self.assertAlmostEqual(slowdowns[0].change, 100.0)
+        self.assertTrue(str(slowdowns[0]).startswith(
+            "Keyword 'Open' mean 1.000s -> 2.000s (+100.0%"))
+
+    def test_noise_and_small_changes_are_ignored(self):
+        self.add_run([1.0, 3.0, 0.5])
+        self.add_run([2.0, 0.5, 3.0])
+        self.assertEqual(self.database.compare(), [])
+        self.add_run([1.0, 1.0])
+        self.add_run([1.05, 1.05])
+        self.assertEqual(self.database.compare(), [])
+
+    def test_baseline_is_limited_to_recent_runs(self):
+        self.add_run([0.1, 0.1])
+        self.add_run([1.0, 1.1, 0.9])
+        self.add_run([1.0, 1.1, 0.9])
+        self.assertEqual(self.database.compare(baseline_runs=1), [])
+        self.assertEqual(
+            len(self.database.compare(baseline_runs=2, threshold=1)), 1)
+
+    def test_baseline_contains_only_runs_with_same_name(self):
+        for _ in range(3):
+            self.add_run([1.0, 1.1, 0.9])
+            self.add_run([2.0, 2.1, 1.9], name='Other')
+        self.assertEqual(self.database.compare(), [])
+        self.add_run([2.0, 2.1, 1.9])
+        self.assertEqual([s.name for s in self.database.compare()], ['Open'])
+        self.add_run([2.0, 2.1, 1.9], name='Other')
+        self.assertEqual(self.database.compare(), [])
+
+    def test_main(self):
+        self.add_run([1.0, 1.1, 0.9])
+        self.add_run([1.0, 1.1, 0.9])
+        self.assertEqual(main([self.path]), 0)
+        self.add_run([2.0, 2.1, 1.9], [0.3, 0.3])
+        self.assertEqual(main([self.path, '--min-change', '50']), 1)
@@ -0,0 +1,114 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from mockito import mock, unstub, when
+
+from SeleniumLibrary import SeleniumLibrary
+from SeleniumLibrary.keywords import CommandPipeline
+from SeleniumLibrary.utils import Tracer
+
+
+class Driver(object):
+
+    def execute(self, command, params=None):
+        return {'value': None}
+
+
+class TracerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        unstub()
+        shutil.rmtree(self.output_dir)
+
+    def _trace(self, format):
+        tracer = Tracer(format)
+        when(tracer)._get_output_dir().thenReturn(self.output_dir)
+        driver = Driver()
+        CommandPipeline([tracer]).install(driver)
+        tracer.start_keyword('SeleniumLibrary.Click Element', {})
+        tracer.begin('click_element', 'seleniumlibrary')
+        find = tracer.trace(lambda locator: 'element', 'element',
+                            lambda locator: locator)
+        self.assertEqual(find('id:foo'), 'element')
+        driver.execute('clickElement')
+        tracer.end('click_element', 'seleniumlibrary')
+        thread = threading.Thread(target=driver.execute, args=('getTitle',))
+        thread.start()
+        thread.join()
+        tracer.end_keyword('SeleniumLibrary.Click Element', {})
+        with open(tracer.write()) as output:
+            return json.load(output)
+
+    def test_chrome_trace(self):
+        trace = self._trace(True)
+        events = [(event['ph'], event['cat'], event['name'])
+                  for event in trace['traceEvents']]
+        self.assertEqual(events, [
+            ('B', 'robot', 'SeleniumLibrary.Click Element'),
+            ('B', 'seleniumlibrary', 'click_element'),
+            ('B', 'element', 'id:foo'),
+            ('E', 'element', 'id:foo'),
+            ('B', 'webdriver', 'clickElement'),
+            ('E', 'webdriver', 'clickElement'),
+            ('E', 'seleniumlibrary', 'click_element'),
+            ('B', 'webdriver', 'getTitle'),
+            ('E', 'webdriver', 'getTitle'),
+            ('E', 'robot', 'SeleniumLibrary.Click Element')])
+        timestamps = [event['ts'] for event in trace['traceEvents']]
+        self.assertEqual(timestamps, sorted(timestamps))
+        self.assertEqual(len(set(event['tid'] for event in trace['traceEvents'])), 2)
+        self.assertTrue(os.path.isfile(os.path.join(
+            self.output_dir, 'seleniumlibrary-trace.json')))
+
+    def test_speedscope_trace(self):
+        trace = self._trace('Speedscope')
+        frames = [frame['name'] for frame in trace['shared']['frames']]
+        self.assertEqual(frames, ['robot: SeleniumLibrary.Click Element',
+                                  'seleniumlibrary: click_element',
+                                  'element: id:foo',
+                                  'webdriver: clickElement',
+                                  'webdriver: getTitle'])
+        main, thread = trace['profiles']
+        self.assertEqual(main['type'], 'evented')
+        self.assertEqual([(e['type'], e['frame']) for e in main['events']],
+                         [('O', 0), ('O', 1), ('O', 2), ('C', 2), ('O', 3),
+                          ('C', 3), ('C', 1), ('C', 0)])
+        self.assertEqual([(e['type'], e['frame']) for e in thread['events']],
+                         [('O', 4), ('C', 4)])
+        self.assertTrue(os.path.isfile(os.path.join(
+            self.output_dir, 'seleniumlibrary-trace.speedscope.json')))
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError) as error:
+            Tracer('flamegraph')
+        self.assertEqual(str(error.exception),
+                         "Trace format must be 'chrome' or 'speedscope', "
+                         "got 'flamegraph'.")
+
+    def test_library_traces_keywords_finds_and_commands(self):
+        sl = SeleniumLibrary(trace=True)
+        when(sl._tracer)._get_output_dir().thenReturn(self.output_dir)
+        driver = Driver()
+        sl.register_driver(driver, None)
+        element = mock()
+        when(sl._element_finder)._parse_locator('id:foo').thenReturn(('id', 'foo'))
+        sl._element_finder._strategies['id'] = lambda *args, **kwargs: [element]
+        keyword_listener = sl.ROBOT_LIBRARY_LISTENER[1]
+        keyword_listener.start_keyword('SeleniumLibrary.Get WebElement', {})
+        self.assertIs(sl.run_keyword('Get WebElement', ['id:foo'], {}), element)
+        keyword_listener.end_keyword('SeleniumLibrary.Get WebElement', {})
+        names = [(event[0], event[2], event[1]) for event in sl._tracer.events]
+        self.assertEqual(names, [
+            ('B', 'robot', 'SeleniumLibrary.Get WebElement'),
+            ('B', 'seleniumlibrary', 'Get WebElement'),
+            ('B', 'element', 'id:foo'),
+            ('E', 'element', 'id:foo'),
+            ('E', 'seleniumlibrary', 'Get WebElement'),
+            ('E', 'robot', 'SeleniumLibrary.Get WebElement')])